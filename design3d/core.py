@@ -3,6 +3,7 @@
 """
 Base classes.
 """
+import itertools
 import os
 import tempfile
 import warnings
@@ -18,6 +19,7 @@ except (TypeError, OSError):
     pass
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy.typing import NDArray
 
 
 import design3d
@@ -117,6 +119,59 @@ def get_edge_index_in_list(edge, list_edges, tol: float = 1e-6):
     return get_element_index_in_list(edge, list_edges, tol)
 
 
+def point_tolerance_key(point, tol: float = 1e-6):
+    """
+    Gets a hashable key of a point by quantizing its coordinates with the given tolerance.
+
+    Points closer than the tolerance share the same key in most cases, which allows deduplicating them with a set.
+    """
+    return tuple(round(coordinate / tol) for coordinate in point)
+
+
+class EdgeHashSet:
+    """
+    Set of edges with constant time insertion and lookup, considering a certain tolerance.
+
+    Edges are bucketed by the quantized key of their start point. An edge close to another one has its start point in
+    one of the neighbor cells of the other's start point, so a lookup only compares the edge with the few edges of
+    these cells instead of scanning a whole list as edge_in_list does. An edge is considered inside the set if it is
+    close to one of its edges, or to the reverse of one of them.
+
+    :param edges: Edges to initialize the set with.
+    :param tol: Tolerance to consider if two edges are the same.
+    """
+
+    def __init__(self, edges=(), tol: float = 1e-6):
+        self.tol = tol
+        self._edges = []
+        self._buckets = {}
+        for edge in edges:
+            self.add(edge)
+
+    def _neighbor_edges(self, point):
+        """Gets the edges starting in the cell of the point, or in one of its neighbor cells."""
+        key = point_tolerance_key(point, self.tol)
+        for offsets in itertools.product((-1, 0, 1), repeat=len(key)):
+            yield from self._buckets.get(tuple(index + offset for index, offset in zip(key, offsets)), ())
+
+    def add(self, edge):
+        """Adds an edge to the set."""
+        self._buckets.setdefault(point_tolerance_key(edge.start, self.tol), []).append(edge)
+        self._edges.append(edge)
+
+    def __contains__(self, edge):
+        if edge_in_list(edge, self._neighbor_edges(edge.start), self.tol):
+            return True
+        reverse_direction_edges = list(self._neighbor_edges(edge.end))
+        return bool(reverse_direction_edges) and edge_in_list(edge.reverse(), reverse_direction_edges, self.tol)
+
+    def __len__(self):
+        return len(self._edges)
+
+    def __iter__(self):
+        return iter(self._edges)
+
+
 def determinant(vec1, vec2, vec3):
     """
     Calculates the determinant for a three vector matrix.
@@ -818,18 +873,20 @@ class BoundingBox:
         """
         return bbox_is_intersecting(self, bbox2, tol)
 
-    def is_inside_bbox(self, bbox2: "BoundingBox") -> bool:
+    def is_inside_bbox(self, bbox2: "BoundingBox", tol: float = 1e-6) -> bool:
         """
         Checks if a bounding box is contained inside another bounding box.
 
         :param bbox2: The bounding box to check against.
         :type bbox2: BoundingBox
+        :param tol: tolerance to be considered.
+        :type tol: float
         :return: True if the bounding box is contained inside bbox2, False otherwise.
         :rtype: bool
         """
-        return (self.xmin >= bbox2.xmin - 1e-6) and (self.xmax <= bbox2.xmax + 1e-6) \
-            and (self.ymin >= bbox2.ymin - 1e-6) and (self.ymax <= bbox2.ymax + 1e-6) \
-            and (self.zmin >= bbox2.zmin - 1e-6) and (self.zmax <= bbox2.zmax + 1e-6)
+        return (self.xmin >= bbox2.xmin - tol) and (self.xmax <= bbox2.xmax + tol) \
+            and (self.ymin >= bbox2.ymin - tol) and (self.ymax <= bbox2.ymax + tol) \
+            and (self.zmin >= bbox2.zmin - tol) and (self.zmax <= bbox2.zmax + tol)
 
     def intersection_volume(self, bbox2: "BoundingBox") -> float:
         """
@@ -867,6 +924,37 @@ class BoundingBox:
 
         return triangle_intersects_voxel(_triangle, _center, _extents)
 
+    def is_intersecting_linesegment(self, linesegment: "LineSegment3D", tol: float = 1e-6) -> bool:
+        """
+        Check if the bounding box and a line segment are intersecting or touching, using the slabs method.
+
+        :param linesegment: the line segment to check if there is an intersection with.
+        :type linesegment: LineSegment3D
+        :param tol: tolerance to be considered.
+
+        :return: True if the bounding box and the line segment are intersecting or touching, False otherwise.
+        :rtype: bool
+        """
+        start, end = linesegment.start, linesegment.end
+        t_min, t_max = 0.0, 1.0
+        for start_coordinate, end_coordinate, bound_min, bound_max in (
+                (start.x, end.x, self.xmin - tol, self.xmax + tol),
+                (start.y, end.y, self.ymin - tol, self.ymax + tol),
+                (start.z, end.z, self.zmin - tol, self.zmax + tol)):
+            direction = end_coordinate - start_coordinate
+            if direction == 0.0:
+                if not bound_min <= start_coordinate <= bound_max:
+                    return False
+                continue
+            t_1 = (bound_min - start_coordinate) / direction
+            t_2 = (bound_max - start_coordinate) / direction
+            if t_1 > t_2:
+                t_1, t_2 = t_2, t_1
+            t_min, t_max = max(t_min, t_1), min(t_max, t_2)
+            if t_min > t_max:
+                return False
+        return True
+
     def distance_to_bbox(self, bbox2: "BoundingBox") -> float:
         """
         Calculates the distance between the bounding box and another bounding box.
@@ -916,6 +1004,32 @@ class BoundingBox:
                 and self.zmin - tol <= point[2] <= self.zmax + tol
         )
 
+    def points_inside(self, points: NDArray[float], tol=1e-6) -> NDArray[bool]:
+        """
+        Determines which points of an array belong to the bounding box.
+
+        :param points: The points to check for inclusion, as a (n, 3) array.
+        :param tol: tolerance.
+        :return: A boolean mask, True for the points belonging to the bounding box.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        return np.all((points >= (self.xmin - tol, self.ymin - tol, self.zmin - tol)) &
+                      (points <= (self.xmax + tol, self.ymax + tol, self.zmax + tol)), axis=1)
+
+    def boxes_intersecting(self, bounds: NDArray[float], tol: float = 1e-6) -> NDArray[bool]:
+        """
+        Determines which bounding boxes of an array are intersecting or touching the bounding box.
+
+        Same criterion as is_intersecting, evaluated for all the boxes at once.
+
+        :param bounds: The (xmin, xmax, ymin, ymax, zmin, zmax) of the boxes to check, as a (n, 6) array.
+        :param tol: tolerance.
+        :return: A boolean mask, True for the boxes intersecting the bounding box.
+        """
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 6)
+        return (np.all(bounds[:, ::2] <= (self.xmax + 2 * tol, self.ymax + 2 * tol, self.zmax + 2 * tol), axis=1) &
+                np.all(bounds[:, 1::2] >= (self.xmin - 2 * tol, self.ymin - 2 * tol, self.zmin - 2 * tol), axis=1))
+
     def distance_to_point(self, point: design3d.Point3D) -> float:
         """
         Calculates the minimum Euclidean distance between the bounding box and a point.
@@ -1702,7 +1816,7 @@ class VolumeModel:
                 continue
 
         lines.append('Field[' + str(field_num) + '] = MinAniso;')
-        lines.append('Field[' + str(field_num) + '].FieldsList = {' + str(field_nums)[1:-1] + '};')
+        lines.append(f'Field[{field_num}].FieldsList = {{{", ".join(map(str, field_nums))}}};')
         lines.append('Background Field = ' + str(field_num) + ';')
 
         lines.append('Mesh.MeshSizeFromCurvature = ' + str(kwargs['curvature_mesh_size']) + ';')
@@ -1875,7 +1989,7 @@ class VolumeModel:
                 face_contours = [face.outer_contour3d for face in primitive.faces]
                 contours.append(face_contours)
                 lines.append('Mesh 2;')
-                lines.append('Physical Surface(' + str(i + 1) + ') = {' + str(surfaces[i])[1:-1] + '};')
+                lines.append(f'Physical Surface({i + 1}) = {{{", ".join(map(str, surfaces[i]))}}};')
                 lines.append('Save "' + file_name + '.stl" ;')
                 faces_account += len(primitive.faces) + 1
             else:
@@ -1889,7 +2003,7 @@ class VolumeModel:
                 #                 surfaces[i][k] = surfaces[l][c]
                 #                 continue
                 lines.append('Mesh 2;')
-                lines.append('Physical Surface(' + str(i + 1) + ') = {' + str(surfaces[i])[1:-1] + '};')
+                lines.append(f'Physical Surface({i + 1}) = {{{", ".join(map(str, surfaces[i]))}}};')
                 lines.append('Save "' + file_name + '.stl" ;')
                 faces_account += len(primitive.faces) + 1
                 contours.append(face_contours)
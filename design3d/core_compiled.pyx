@@ -282,6 +282,54 @@ cpdef np.ndarray[np.uint8_t, ndim = 1] points_in_polygon(double[:, ::1] polygon,
     return results
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple cylindrical_points_parametric_coordinates(double[:, ::1] local_points, double radius,
+                                                      double u_min, double u_max, double v_min, double v_max,
+                                                      double tol=1e-6, double bounds_tol=1e-3):
+    """
+    Gets the parametric coordinates (theta, z) of points given in the frame of a cylinder.
+
+    Theta is brought back into the [u_min, u_max] range by one period when it is out of it. Candidate points are the
+    ones lying on the cylinder whose parametric coordinates are inside the bounds, up to bounds_tol.
+
+    :return: a (n, 2) array of the parametric coordinates and a (n,) array flagging the candidate points.
+    """
+    cdef size_t n = local_points.shape[0]
+    cdef size_t i
+    cdef double x, y, z, theta, squared_distance
+    cdef double squared_radius = radius * radius
+    cdef bint on_surface
+    cdef np.ndarray[np.float64_t, ndim = 2] points2d = npy.empty((n, 2), dtype=npy.float64)
+    cdef np.ndarray[np.uint8_t, ndim = 1] candidates = npy.zeros(n, dtype=npy.uint8)
+
+    for i in range(n):
+        x = local_points[i, 0]
+        y = local_points[i, 1]
+        z = local_points[i, 2]
+        squared_distance = x * x + y * y
+        # Same test as math.isclose in CylindricalSurface3D.point_belongs
+        on_surface = math_c.fabs(squared_distance - squared_radius) <= math_c.fmax(
+            1e-9 * math_c.fmax(squared_distance, squared_radius), tol)
+        if math_c.fabs(x) < 1e-12:
+            x = 0.0
+        if math_c.fabs(y) < 1e-12:
+            y = 0.0
+        theta = math_c.atan2(y, x)
+        if math_c.fabs(theta) < 1e-9:
+            theta = 0.0
+        if theta < u_min - tol:
+            theta += 2 * math_c.M_PI
+        elif theta > u_max + tol:
+            theta -= 2 * math_c.M_PI
+        points2d[i, 0] = theta
+        points2d[i, 1] = z
+        candidates[i] = on_surface and u_min - bounds_tol <= theta <= u_max + bounds_tol \
+            and v_min - bounds_tol <= z <= v_max + bounds_tol
+
+    return points2d, candidates
+
+
 # =============================================================================
 def bbox_is_intersecting(bbox1, bbox2, tol):
     """Verifies if the two bounding boxes are intersecting, or touching."""
@@ -2005,6 +2053,19 @@ cdef class Point3D(Vector3D):
         """
         return (self - point2).norm()
 
+    def point_distance_squared(self, Point3D point2) -> float:
+        """
+        Computes the squared euclidean distance between two 3-dimensional points.
+
+        Cheaper than point_distance when only comparing distances.
+
+        :param point2: The other 3-dimensional point
+        :type point2: :class:`design3d.Point3D`
+        :return: The squared euclidean distance
+        :rtype: float
+        """
+        return c_vector3d_squared_distance(self.x - point2.x, self.y - point2.y, self.z - point2.z)
+
     @classmethod
     def middle_point(cls, point1: Point3D, point2: Point3D, name = ""):
         """
@@ -824,6 +824,23 @@ class Line3D(Line):
         vector2 = self.direction_vector()
         return vector1.cross(vector2).norm() / vector2.norm()
 
+    def points_abscissas(self, points, tol: float = 1e-6):
+        """
+        Calculates the abscissas of several points at once, the points not belonging to the line getting NaN.
+
+        Vectorized equivalent of point_belongs followed by abscissa for each point.
+
+        :param points: points to be verified, as a list of points or a (n, 3) array.
+        :param tol: tolerance.
+        :return: a (n,) array of abscissas.
+        """
+        points = np.array([[*point] for point in points], dtype=np.float64).reshape(-1, 3)
+        direction = np.array([*self.direction_vector()])
+        direction_norm = np.linalg.norm(direction)
+        vectors = points - [*self.point1]
+        distances = np.linalg.norm(np.cross(vectors, direction), axis=1) / direction_norm
+        return np.where(distances < tol, vectors @ direction / direction_norm, np.nan)
+
     def line_distance(self, line2):
         """
         Calculates the distance between two Line3D.
@@ -1792,6 +1809,31 @@ class Circle3D(CircleMixin, ClosedCurve):
             return True
         return False
 
+    def points_abscissas(self, points, abs_tol: float = 1e-6):
+        """
+        Calculates the abscissas of several points at once, the points not belonging to the circle getting NaN.
+
+        Vectorized equivalent of point_belongs followed by abscissa for each point.
+
+        :param points: points to be verified, as a list of points or a (n, 3) array.
+        :param abs_tol: tolerance.
+        :return: a (n,) array of abscissas.
+        """
+        points = np.array([[*point] for point in points], dtype=np.float64).reshape(-1, 3)
+        vectors = points - [*self.center]
+        distances = np.linalg.norm(vectors, axis=1)
+        local_coordinates = vectors @ np.linalg.inv(
+            np.array([[*self.frame.u], [*self.frame.v], [*self.frame.w]]).T).T
+        belongs = ((np.abs(distances - self.radius) <= np.maximum(1e-9 * np.maximum(distances, self.radius), abs_tol))
+                   & (np.abs(vectors @ [*self.normal]) <= abs_tol))
+        cosines = np.clip(local_coordinates[:, 0] / self.radius, -1.0, 1.0)
+        sines = np.clip(local_coordinates[:, 1] / self.radius, -1.0, 1.0)
+        # Same branches as geometry.sin_cos_angle
+        theta = np.where(sines >= 0, np.arccos(cosines),
+                         np.where(cosines > 0, design3d.TWO_PI + np.arcsin(sines), design3d.TWO_PI - np.arccos(cosines)))
+        theta[np.abs(theta - design3d.TWO_PI) <= 1e-9] = 0.
+        return np.where(belongs, self.radius * theta, np.nan)
+
     def point_distance(self, point3d):
         """
         Calculates the distance between a Circle 3D and point 3D.
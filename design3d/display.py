@@ -129,10 +129,7 @@ class MeshMixin:
 
         merged_vertices = np.concatenate((self.vertices, other.vertices))
         # merged_triangles = np.concatenate((self.triangles, other.triangles + len(self.vertices).astype(np.int32)))
-        merged_triangles = np.concatenate((
-            self.triangles.astype(np.int32), 
-            (other.triangles.astype(np.int32) + len(self.vertices))
-        ), dtype=np.int32)
+        merged_triangles = np.concatenate((self.triangles, other.triangles + len(self.vertices)), dtype=np.int32)
 
         mesh = self.__class__(merged_vertices, merged_triangles, name=self.name)
 
@@ -348,13 +345,13 @@ class Mesh2D(MeshMixin):
 
         :param vertices: An array of 2D vertices specifying the 2D mesh.
         :type vertices: ndarray[float]
-        :param triangles: An array of triangles representing the connectivity of the 2D mesh.
+        :param triangles: An array of triangles representing the connectivity of the 2D mesh, stored as int32 indices.
         :type triangles: ndarray[int]
         :param name: A name for the mesh (default is an empty string).
         :type name: str, optional
         """
         self.vertices = vertices
-        self.triangles = triangles
+        self.triangles = np.asarray(triangles, dtype=np.int32)
 
         self.name = name
 
@@ -391,13 +388,13 @@ class Mesh3D(MeshMixin, Primitive3D):
         Initialize a 3D mesh.
 
         :param vertices: An array of 3D vertices specifying the 3D mesh.
-        :param triangles: An array of triangles representing the connectivity of the 3D mesh.
+        :param triangles: An array of triangles representing the connectivity of the 3D mesh, stored as int32 indices.
         :param color: A color for the mesh, optional.
         :param alpha: An alpha value for the mesh, optional.
         :param name: A name for the mesh, optional (default is an empty string).
         """
         self.vertices = vertices
-        self.triangles = triangles
+        self.triangles = np.asarray(triangles, dtype=np.int32)
 
         self._faces = None
         self._bounding_box = None
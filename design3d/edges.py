@@ -35,6 +35,38 @@ from design3d.core import EdgeStyle
 # pylint: disable=arguments-differ
 
 
+def batch_discretization_points(edges_, numbers_points):
+    """
+    Discretizes a list of edges, each one with its own number of points.
+
+    Line segments are evaluated all together with a single vectorized operation. Other edges fall back on their own
+    discretization_points method.
+
+    :param edges_: list of edges to discretize.
+    :param numbers_points: number of points (including start and end points) for each edge.
+    :return: a list with the discretization points of each edge.
+    """
+    discretizations = [None] * len(edges_)
+    line_indexes = []
+    for i, (edge, number_points) in enumerate(zip(edges_, numbers_points)):
+        if isinstance(edge, LineSegment):
+            line_indexes.append(i)
+        else:
+            discretizations[i] = edge.discretization_points(number_points=number_points)
+    if not line_indexes:
+        return discretizations
+    counts = np.array([max(numbers_points[i] or 2, 2) for i in line_indexes])
+    starts = np.array([[*edges_[i].start] for i in line_indexes])
+    ends = np.array([[*edges_[i].end] for i in line_indexes])
+    local_indexes = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    parameters = local_indexes / np.repeat(counts - 1, counts)
+    points = np.repeat(starts, counts, axis=0) + parameters[:, None] * np.repeat(ends - starts, counts, axis=0)
+    for i, array in zip(line_indexes, np.split(points, np.cumsum(counts)[:-1])):
+        point_class = edges_[i].start.__class__
+        discretizations[i] = [point_class(*coordinates) for coordinates in array]
+    return discretizations
+
+
 class Edge:
     """
     Defines a simple edge Object.
@@ -1739,7 +1771,7 @@ class BSplineCurve(Edge):
         :rtype: str
         """
 
-        return 'BSpline(' + str(tag) + ') = {' + str(control_points_tags)[1:-1] + '};'
+        return f'BSpline({tag}) = {{{", ".join(map(str, control_points_tags))}}};'
 
     def get_geo_points(self):
         """Gets the points that define a BsplineCurve in a .geo file."""
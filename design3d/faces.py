@@ -5,38 +5,148 @@ Surfaces & faces.
 
 import math
 import warnings
-from itertools import chain, product
+from collections import defaultdict, deque
+from functools import cached_property
+from itertools import chain, combinations, product
 from typing import List
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy.typing import NDArray
 import triangle as triangle_lib
 
 import design3d.core
-from design3d.core import EdgeStyle
+from design3d.core import EdgeHashSet, EdgeStyle, point_tolerance_key
 import design3d.core_compiled
+from design3d.core_compiled import polygon_point_belongs
 import design3d.display as d3dd
 import design3d.edges as d3de
 import design3d.curves as design3d_curves
 import design3d.geometry
 import design3d.grid
 from design3d import surfaces
-from design3d.utils.parametric import update_face_grid_points_with_inner_polygons
+from design3d.utils.parametric import checkerboard_grid_points, update_face_grid_points_with_inner_polygons
 import design3d.wires
 
 warnings.simplefilter("once")
 
+_TEN_DEGREES = math.radians(10)
+_TWENTY_DEGREES = math.radians(20)
+
+
+def join_connected_contours(contour1, contour2, tol: float = 1e-6):
+    """
+    Joins two ordered 2D contours connected by one of their extremities, keeping contour1's direction.
+
+    Splicing the two primitive lists avoids re-ordering every primitive with Contour2D.contours_from_edges, which is
+    only used as a fallback when the contours are not connected by their extremities.
+    """
+    start1, end1 = contour1.primitives[0].start, contour1.primitives[-1].end
+    start2, end2 = contour2.primitives[0].start, contour2.primitives[-1].end
+    if end1.is_close(start2, tol):
+        primitives = contour1.primitives + contour2.primitives
+    elif end1.is_close(end2, tol):
+        primitives = contour1.primitives + contour2.inverted_primitives()
+    elif start1.is_close(end2, tol):
+        primitives = contour2.primitives + contour1.primitives
+    elif start1.is_close(start2, tol):
+        primitives = contour2.inverted_primitives() + contour1.primitives
+    else:
+        return design3d.wires.Contour2D.contours_from_edges(contour1.primitives + contour2.primitives, tol)[0]
+    return design3d.wires.Contour2D(primitives)
+
+
+def merge_unique_points(points, other_points, tol: float = 1e-6):
+    """
+    Appends to a list of points the other points that are not close to any point already in the list.
+
+    Points are bucketed by their quantized coordinates: a point closer than tol to another lies in one of the 27
+    neighbor cells, so each lookup only compares the point with a few others instead of scanning the whole list.
+
+    :param points: points kept as they are, at the beginning of the returned list.
+    :param other_points: points to add, if not already in the list.
+    :param tol: tolerance to consider if two points are the same.
+    :return: a new list of unique points.
+    """
+    unique_points = list(points)
+    points_by_key = defaultdict(list)
+    for point in unique_points:
+        points_by_key[point_tolerance_key(point, tol)].append(point)
+    neighbor_offsets = tuple(product((-1, 0, 1), repeat=3))
+    for point in other_points:
+        key_x, key_y, key_z = point_tolerance_key(point, tol)
+        if any(point.is_close(other_point, tol)
+               for offset_x, offset_y, offset_z in neighbor_offsets
+               for other_point in points_by_key.get((key_x + offset_x, key_y + offset_y, key_z + offset_z), ())):
+            continue
+        points_by_key[(key_x, key_y, key_z)].append(point)
+        unique_points.append(point)
+    return unique_points
+
+
+def linesegments_closest_points(starts1, ends1, starts2, ends2):
+    """
+    Gets the closest points between every pair of line segments of two sets, given as (n, 3) and (m, 3) arrays.
+
+    The segments parameters are computed all at once, clamped to the segments as in Ericson's Real-Time Collision
+    Detection closest points between two segments.
+
+    :return: a (n, m) array of the distances, and two (n, m, 3) arrays of the closest points on the segments of the
+        first and second sets.
+    """
+    starts1, starts2 = starts1[:, np.newaxis, :], starts2[np.newaxis, :, :]
+    directions1 = ends1[:, np.newaxis, :] - starts1
+    directions2 = ends2[np.newaxis, :, :] - starts2
+    starts_vectors = starts1 - starts2
+    squared_lengths1 = np.einsum('ijk,ijk->ij', directions1, directions1)
+    squared_lengths2 = np.einsum('ijk,ijk->ij', directions2, directions2)
+    directions_dot = np.einsum('ijk,ijk->ij', directions1, directions2)
+    dot1 = np.einsum('ijk,ijk->ij', directions1, starts_vectors)
+    dot2 = np.einsum('ijk,ijk->ij', directions2, starts_vectors)
+    denominator = squared_lengths1 * squared_lengths2 - directions_dot ** 2
+    not_parallel = denominator > 1e-12 * squared_lengths1 * squared_lengths2
+    parameters1 = np.where(not_parallel, np.clip(
+        (directions_dot * dot2 - dot1 * squared_lengths2) / np.where(not_parallel, denominator, 1.0), 0.0, 1.0), 0.0)
+    parameters2 = (directions_dot * parameters1 + dot2) / squared_lengths2
+    before_start2, after_end2 = parameters2 < 0.0, parameters2 > 1.0
+    parameters1 = np.where(before_start2, np.clip(-dot1 / squared_lengths1, 0.0, 1.0), parameters1)
+    parameters1 = np.where(after_end2, np.clip((directions_dot - dot1) / squared_lengths1, 0.0, 1.0), parameters1)
+    parameters2 = np.clip(parameters2, 0.0, 1.0)
+    points1 = starts1 + parameters1[..., np.newaxis] * directions1
+    points2 = starts2 + parameters2[..., np.newaxis] * directions2
+    return np.linalg.norm(points1 - points2, axis=2), points1, points2
+
+
+def points_on_curve_sorted(curve, points, tol: float = 1e-6):
+    """
+    Gets the points belonging to a curve, sorted along it.
+
+    Curves defining points_abscissas test and parametrize all the points at once, others are checked point by point.
+
+    :param curve: the curve to search the points on.
+    :param points: the candidate points.
+    :param tol: tolerance used to consider a point belongs to the curve.
+    :return: the sorted points on curve.
+    """
+    if not points:
+        return []
+    if hasattr(curve, "points_abscissas"):
+        abscissas = curve.points_abscissas(points, tol)
+        indexes = np.flatnonzero(~np.isnan(abscissas))
+        return [points[index] for index in indexes[np.argsort(abscissas[indexes], kind="stable")]]
+    return curve.sort_points_along_curve([point for point in points if curve.point_belongs(point, tol)])
+
 
 def octree_decomposition(bbox, faces):
     """Decomposes a list of faces into eight Bounding boxes subdivided boxes."""
-    decomposition = {octant: [] for octant in bbox.octree()}
+    octants = bbox.octree()
+    decomposition = defaultdict(list)
     for face in faces:
         center = face.bounding_box.center
-        for octant in bbox.octree():
+        for octant_index, octant in enumerate(octants):
             if octant.point_inside(center):
-                decomposition[octant].append(face)
+                decomposition[octant_index].append(face)
                 break
-    decomposed = {octant: faces for octant, faces in decomposition.items() if faces}
-    return decomposed
+    return {octants[octant_index]: decomposition[octant_index] for octant_index in sorted(decomposition)}
 
 
 def octree_face_decomposition(face):
@@ -58,25 +168,101 @@ def parametric_face_inside(face1, face2, abs_tol: float = 1e-6):
 
     It returns True if face2 is inside or False if the opposite.
     """
+    if face1.bounding_box_bounds_face and not face2.bounding_box.is_inside_bbox(face1.bounding_box, 1e-3):
+        return False
     if face1.surface3d.is_coincident(face2.surface3d, abs_tol):
-        if not face1.bounding_box.is_intersecting(face2.bounding_box) and \
-                not face1.bounding_box.is_inside_bbox(face2.bounding_box):
-            return False
         self_contour2d = face1.surface2d.outer_contour
         face2_contour2d = face2.surface2d.outer_contour
+        if not face2_contour2d.bounding_rectangle.is_inside_b_rectangle(self_contour2d.bounding_rectangle, 1e-3):
+            return False
         if self_contour2d.is_inside(face2_contour2d):
-            if self_contour2d.is_inside(face2_contour2d):
-                for inner_contour2d in face1.surface2d.inner_contours:
-                    if inner_contour2d.is_inside(face2_contour2d) or inner_contour2d.is_superposing(
-                            face2_contour2d
-                    ):
-                        return False
+            for inner_contour2d in face1.surface2d.inner_contours:
+                if inner_contour2d.is_inside(face2_contour2d) or inner_contour2d.is_superposing(face2_contour2d):
+                    return False
             return True
         if self_contour2d.is_superposing(face2_contour2d):
             return True
     return False
 
 
+def _faces_bounds(faces):
+    """Gets the bounding boxes of faces, as two (number of faces, 3) arrays of minimal and maximal coordinates."""
+    bounds = np.array([[bbox.xmin, bbox.ymin, bbox.zmin, bbox.xmax, bbox.ymax, bbox.zmax]
+                       for bbox in (face.bounding_box for face in faces)], dtype=np.float64).reshape(-1, 6)
+    return bounds[:, :3], bounds[:, 3:]
+
+
+def _contours_primitives_mapping(contours2d, contours3d):
+    """
+    Maps the primitives of 2D contours to the ones of the 3D contours they were projected from, in the same order.
+
+    :return: the primitives mapping, or None if a 3D contour is unknown or lost a primitive in the projection.
+    """
+    primitives_mapping = {}
+    for contour2d, contour3d in zip(contours2d, contours3d):
+        if contour3d is None or len(contour2d.primitives) != len(contour3d.primitives):
+            return None
+        primitives_mapping.update(zip(contour2d.primitives, contour3d.primitives))
+    return primitives_mapping
+
+
+def parametric_isolines(bounds, number_lines: int, constant_u: bool = True):
+    """
+    Gets lines evenly spaced strictly inside a parametric rectangle, all the parameter values being computed at once.
+
+    :param bounds: the (u_min, u_max, v_min, v_max) bounds of the rectangle.
+    :param number_lines: number of lines.
+    :param constant_u: if True, the lines go along v at constant u values, else along u at constant v values.
+    :return: list of Line2D.
+    """
+    u_min, u_max, v_min, v_max = bounds
+    if constant_u:
+        values = (u_min + np.arange(1, number_lines + 1) / (number_lines + 1) * (u_max - u_min)).tolist()
+        return [design3d_curves.Line2D(design3d.Point2D(value, v_min), design3d.Point2D(value, v_max))
+                for value in values]
+    values = (v_min + np.arange(1, number_lines + 1) / (number_lines + 1) * (v_max - v_min)).tolist()
+    return [design3d_curves.Line2D(design3d.Point2D(u_min, value), design3d.Point2D(u_max, value))
+            for value in values]
+
+
+def bounding_box_connected_groups(faces, tol: float = 1e-6):
+    """
+    Splits faces into groups connected by their bounding boxes.
+
+    Two faces are in the same group if a chain of faces with intersecting, or touching, bounding boxes links them.
+    Faces of different groups can neither share an edge nor be inside one another.
+
+    :param faces: the faces to be grouped.
+    :param tol: tolerance used to consider that two bounding boxes are touching.
+    :return: list of groups, each one a sorted list of the indices of its faces.
+    """
+    mins, maxs = _faces_bounds(faces)
+    # Sweep along x: a box can only touch the boxes sorted after it that start before its x end
+    order = np.argsort(mins[:, 0], kind="stable")
+    sorted_mins, sorted_maxs = mins[order], maxs[order]
+    sweep_ends = np.searchsorted(sorted_mins[:, 0], sorted_maxs[:, 0] + 2 * tol, side="right")
+    parents = list(range(len(faces)))
+
+    def root(index):
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for position, sweep_end in enumerate(sweep_ends):
+        following = slice(position + 1, sweep_end)
+        touching = np.all((sorted_mins[following, 1:] <= sorted_maxs[position, 1:] + 2 * tol) &
+                          (sorted_mins[position, 1:] <= sorted_maxs[following, 1:] + 2 * tol), axis=1)
+        for neighbour_index in order[following][touching]:
+            root1, root2 = root(order[position]), root(neighbour_index)
+            if root1 != root2:
+                parents[max(root1, root2)] = min(root1, root2)
+    groups = {}
+    for index in range(len(faces)):
+        groups.setdefault(root(index), []).append(index)
+    return list(groups.values())
+
+
 class Face3D(design3d.core.Primitive3D):
     """
     Abstract method to define 3D faces.
@@ -85,6 +271,8 @@ class Face3D(design3d.core.Primitive3D):
     min_x_density = 1
     min_y_density = 1
     face_tolerance = 1e-6
+    # Whether the bounding box contains the whole face: a contour based box can miss the bulge of a curved face
+    bounding_box_bounds_face = False
 
     def __init__(self, surface3d, surface2d: surfaces.Surface2D,
                  reference_path: str = design3d.PATH_ROOT, name: str = ""):
@@ -93,7 +281,12 @@ class Face3D(design3d.core.Primitive3D):
         self._outer_contour3d = None
         self._inner_contours3d = None
         self._face_octree_decomposition = None
+        self._triangulation = None
+        self._triangulation_triangles = None
+        self._face_decomposition_points = None
         self._primitives_mapping = None
+        self._outer_contour2d_projections = {}
+        self._boundary_primitives = None
 
         design3d.core.Primitive3D.__init__(self, reference_path=reference_path, name=name)
 
@@ -118,12 +311,41 @@ class Face3D(design3d.core.Primitive3D):
         """
         if not self.bounding_box.point_inside(point3d, 1e-3):
             return False
+        return self._point_belongs_surface2d(point3d, tol)
+
+    def _point_belongs_surface2d(self, point3d: design3d.Point3D, tol: float = 1e-6):
+        """Checks a point against the surface and the face contours, without the bounding box rejection."""
         point2d = self.surface3d.point3d_to_2d(point3d)
         if not self.surface3d.point_belongs(point3d, tol):
             return False
 
         return self.surface2d.point_belongs(point2d)
 
+    def points_belong(self, points3d: List[design3d.Point3D], tol: float = 1e-6) -> List[bool]:
+        """
+        Tells you, for each point of a list, if it is on the 3D face and inside its contour.
+
+        The bounding box rejection is done for all points at once, when point_belongs uses one.
+
+        :param points3d: list of points to verify.
+        :param tol: tolerance.
+        :return: a list of booleans, True for the points belonging to the face.
+        """
+        return list(self._iter_points_belong(points3d, tol))
+
+    def _iter_points_belong(self, points3d: List[design3d.Point3D], tol: float = 1e-6):
+        """
+        Lazy version of points_belong, allowing callers to stop at the first point outside the face.
+
+        The bounding box rejection of point_belongs is done for all points at once. Faces overriding point_belongs
+        also override this method.
+        """
+        if not points3d:
+            return
+        inside_bounding_box = self.bounding_box.points_inside([[*point] for point in points3d], 1e-3)
+        for point, inside in zip(points3d, inside_bounding_box):
+            yield bool(inside) and self._point_belongs_surface2d(point, tol)
+
     @property
     def outer_contour3d(self) -> design3d.wires.Contour3D:
         """
@@ -427,19 +649,13 @@ class Face3D(design3d.core.Primitive3D):
             outer_polygon, inner_polygons = self.get_face_polygons()
 
         u, v = self._get_grid_axis(outer_polygon, grid_size)
-        if not u or not v:
+        if u.size == 0 or v.size == 0:
             return []
+        grid_points = np.stack(np.meshgrid(u, v), axis=-1).reshape(-1, 2)
         if inner_polygons:
-            grid_points = []
-            points_indexes_map = {}
-            for j, v_j in enumerate(v):
-                for i, u_i in enumerate(u):
-                    grid_points.append((u_i, v_j))
-                    points_indexes_map[(i, j)] = len(grid_points) - 1
+            points_indexes_map = np.arange(len(grid_points)).reshape(len(v), len(u)).T
             grid_points = update_face_grid_points_with_inner_polygons(inner_polygons,
                                                                       [grid_points, u, v, points_indexes_map])
-        else:
-            grid_points = np.array([[u_i, v_j] for v_j in v for u_i in u], dtype=np.float64)
         grid_points = self._update_grid_points_with_outer_polygon(outer_polygon, grid_points)
 
         return grid_points
@@ -451,19 +667,26 @@ class Face3D(design3d.core.Primitive3D):
         number_points_u, number_points_v = grid_size
         u_step = (u_max - u_min) / (number_points_u - 1) if number_points_u > 1 else (u_max - u_min)
         v_step = (v_max - v_min) / (number_points_v - 1) if number_points_v > 1 else (v_max - v_min)
-        u = [u_min + i * u_step for i in range(number_points_u)]
-        v = [v_min + i * v_step for i in range(number_points_v)]
+        u = u_min + u_step * np.arange(number_points_u)
+        v = v_min + v_step * np.arange(number_points_v)
 
         return u, v
 
     @staticmethod
-    def _update_grid_points_with_outer_polygon(outer_polygon, grid_points):
+    def _update_grid_points_with_outer_polygon(outer_polygon, grid_points, include_edge_points: bool = False,
+                                               tol: float = 1e-6):
         """Helper function to grid_points."""
-        # Find the indices where points_in_polygon is True (i.e., points inside the polygon)
-        indices = np.where(outer_polygon.points_in_polygon(grid_points, include_edge_points=False) == 0)[0]
-        grid_points = np.delete(grid_points, indices, axis=0)
+        # Only the points inside the polygon bounding rectangle need the full point in polygon test
+        x_min, x_max, y_min, y_max = outer_polygon.bounding_rectangle.bounds()
+        inside_rectangle = ((grid_points[:, 0] >= x_min - tol) & (grid_points[:, 0] <= x_max + tol) &
+                            (grid_points[:, 1] >= y_min - tol) & (grid_points[:, 1] <= y_max + tol))
+        grid_points = grid_points[inside_rectangle]
+        # Keep the points where points_in_polygon is True (i.e., points inside the polygon)
+        grid_points = grid_points[outer_polygon.points_in_polygon(
+            grid_points, include_edge_points=include_edge_points, tol=tol).astype(bool)]
         polygon_points = set(outer_polygon.points)
-        points = [design3d.Point2D(*point) for point in grid_points if design3d.Point2D(*point) not in polygon_points]
+        points = [point for point in (design3d.Point2D(x, y) for x, y in grid_points.tolist())
+                  if point not in polygon_points]
         return points
 
     def get_face_polygons(self):
@@ -471,11 +694,10 @@ class Face3D(design3d.core.Primitive3D):
         primitives_mapping = self.primitives_mapping
 
         def get_polygon_points(primitives):
+            numbers_points = [self.get_edge_discretization_size(primitives_mapping.get(edge))
+                              for edge in primitives]
             points = []
-            for edge in primitives:
-                edge3d = primitives_mapping.get(edge)
-                number_points = self.get_edge_discretization_size(edge3d)
-                edge_points = edge.discretization_points(number_points=number_points)
+            for edge_points in d3de.batch_discretization_points(primitives, numbers_points):
                 points.extend(edge_points[:-1])
             return points
 
@@ -495,15 +717,15 @@ class Face3D(design3d.core.Primitive3D):
         """
         Triangulates a surface without holes.
 
-        :param vertices: vertices of the surface.
+        :param vertices: vertices of the surface, as a (n, 2) array.
         :param segments: segments defined as tuples of vertices.
         :param points_grid: to do.
         :param tri_opt: triangulation option: "p"
         :return:
         """
-        vertices_grid = [(p.x, p.y) for p in points_grid]
-        vertices.extend(vertices_grid)
-        tri = {'vertices': np.array(vertices).reshape((-1, 2)),
+        if points_grid:
+            vertices = np.concatenate([vertices, np.array([(p.x, p.y) for p in points_grid])])
+        tri = {'vertices': vertices,
                'segments': np.array(segments).reshape((-1, 2)),
                }
         triangulation = triangle_lib.triangulate(tri, tri_opt)
@@ -530,11 +752,11 @@ class Face3D(design3d.core.Primitive3D):
             outer_polygon, inner_polygons = self.get_face_polygons()
         if any(grid_size):
             points_grid = self.grid_points(grid_size, [outer_polygon, inner_polygons])
-        points = outer_polygon.points.copy()
-        if len(set(points)) < len(points):
-            return None
-        vertices = [(point.x, point.y) for point in points]
+        points = outer_polygon.points
         n = len(points)
+        vertices = outer_polygon.points_array
+        if np.unique(vertices, axis=0).shape[0] < n:
+            return None
         segments = [(i, i + 1) for i in range(n - 1)]
         segments.append((n - 1, 0))
 
@@ -542,13 +764,13 @@ class Face3D(design3d.core.Primitive3D):
             return self.helper_triangulation_without_holes(vertices, segments, points_grid, tri_opt)
 
         point_index = {p: i for i, p in enumerate(points)}
+        inner_vertices = []
         holes = []
         for inner_polygon in inner_polygons:
             inner_polygon_nodes = inner_polygon.points
             for point in inner_polygon_nodes:
                 if point not in point_index:
-                    points.append(point)
-                    vertices.append((point.x, point.y))
+                    inner_vertices.append((point.x, point.y))
                     point_index[point] = n
                     n += 1
 
@@ -556,21 +778,24 @@ class Face3D(design3d.core.Primitive3D):
                                       inner_polygon_nodes[1:]):
                 segments.append((point_index[point1], point_index[point2]))
             segments.append((point_index[inner_polygon_nodes[-1]], point_index[inner_polygon_nodes[0]]))
-            rpi = inner_polygon.barycenter()
-            if not inner_polygon.point_inside(rpi, include_edge_points=False):
+            inner_polygon_array = inner_polygon.points_array
+            barycenter = inner_polygon_array.mean(axis=0)
+            if polygon_point_belongs(inner_polygon_array, barycenter, include_edge_points=False):
+                holes.append(barycenter)
+            else:
                 rpi = inner_polygon.random_point_inside(include_edge_points=False)
-            holes.append([rpi.x, rpi.y])
+                holes.append([rpi.x, rpi.y])
 
+        vertices = [vertices, np.array(inner_vertices).reshape((-1, 2))]
         if points_grid:
-            vertices_grid = [(p.x, p.y) for p in points_grid]
-            vertices.extend(vertices_grid)
+            vertices.append(np.array([(p.x, p.y) for p in points_grid]))
 
-        tri = {'vertices': np.array(vertices).reshape((-1, 2)),
+        tri = {'vertices': np.concatenate(vertices),
                'segments': np.array(segments).reshape((-1, 2)),
                'holes': np.array(holes).reshape((-1, 2))
                }
         triangulation = triangle_lib.triangulate(tri, tri_opt)
-        return d3dd.Mesh2D(triangulation['vertices'], triangles=triangulation['triangles'].astype(np.int32))
+        return d3dd.Mesh2D(triangulation['vertices'], triangles=triangulation['triangles'])
 
     def triangulation(self):
         """Triangulates the face."""
@@ -580,6 +805,12 @@ class Face3D(design3d.core.Primitive3D):
             return None
         return d3dd.Mesh3D(self.surface3d.parametric_points_to_3d(mesh2d.vertices), mesh2d.triangles)
 
+    def _get_triangulation(self):
+        """Gets the face triangulation, computed once and reused by the approximated distance and intersections."""
+        if self._triangulation is None:
+            self._triangulation = self.triangulation()
+        return self._triangulation
+
     def plot2d(self, ax=None, color="k", alpha=1):
         """Plot 2D of the face using matplotlib."""
         if ax is None:
@@ -628,26 +859,20 @@ class Face3D(design3d.core.Primitive3D):
 
         It returns True if face2 is inside or False if the opposite.
         """
+        if self.bounding_box_bounds_face and not face2.bounding_box.is_inside_bbox(self.bounding_box, 1e-3):
+            return False
         if self.surface3d.is_coincident(face2.surface3d, abs_tol):
-            if not self.bounding_box.is_intersecting(face2.bounding_box) and \
-                    not self.bounding_box.is_inside_bbox(face2.bounding_box):
-                return False
-            self_contour2d = self.outer_contour3d.to_2d(
-                self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-            )
-            face2_contour2d = face2.outer_contour3d.to_2d(
-                self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-            )
+            frame = self.surface3d.frame
+            origin, u_vector, v_vector = frame.origin, frame.u, frame.v
+            self_contour2d = self.outer_contour3d.to_2d(origin, u_vector, v_vector)
+            face2_contour2d = face2.outer_contour3d.to_2d(origin, u_vector, v_vector)
             if self_contour2d.is_inside(face2_contour2d):
-                if self_contour2d.is_inside(face2_contour2d):
-                    for inner_contour in self.inner_contours3d:
-                        inner_contour2d = inner_contour.to_2d(
-                            self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-                        )
-                        if inner_contour2d.is_inside(face2_contour2d) or inner_contour2d.is_superposing(
-                            face2_contour2d
-                        ):
-                            return False
+                for inner_contour in self.inner_contours3d:
+                    inner_contour2d = inner_contour.to_2d(origin, u_vector, v_vector)
+                    if inner_contour2d.is_inside(face2_contour2d) or inner_contour2d.is_superposing(
+                        face2_contour2d
+                    ):
+                        return False
                 return True
             if self_contour2d.is_superposing(face2_contour2d):
                 return True
@@ -660,10 +885,10 @@ class Face3D(design3d.core.Primitive3D):
         if hasattr(self, method_name):
             intersections = getattr(self, method_name)(edge)
         elif hasattr(self.surface3d, method_name):
-            edge_surface_intersections = getattr(self.surface3d, method_name)(edge)
-            for intersection in edge_surface_intersections:
-                if self.point_belongs(intersection, self.face_tolerance) and not intersection.in_list(intersections):
-                    intersections.append(intersection)
+            edge_surface_intersections = merge_unique_points(
+                [], getattr(self.surface3d, method_name)(edge), self.face_tolerance)
+            intersections = [intersection for intersection in edge_surface_intersections
+                             if self.point_belongs(intersection, self.face_tolerance)]
         if not intersections:
             for point in [edge.start, edge.end]:
                 if self.point_belongs(point):
@@ -699,13 +924,11 @@ class Face3D(design3d.core.Primitive3D):
         :param abs_tol: tolerance used.
         :return: a list of intersections.
         """
-        linesegment_intersections = []
         if not self.bounding_box.is_intersecting(linesegment.bounding_box):
             return []
-        for intersection in self.surface3d.linesegment_intersections(linesegment):
-            if self.point_belongs(intersection, abs_tol):
-                linesegment_intersections.append(intersection)
-        return linesegment_intersections
+        intersections = self.surface3d.linesegment_intersections(linesegment)
+        return [intersection for intersection, belongs in zip(intersections, self.points_belong(intersections, abs_tol))
+                if belongs]
 
     def fullarc_intersections(self, fullarc: d3de.FullArc3D) -> List[design3d.Point3D]:
         """
@@ -714,11 +937,9 @@ class Face3D(design3d.core.Primitive3D):
         :param fullarc: other fullarc.
         :return: a list of intersections.
         """
-        intersections = []
-        for intersection in self.surface3d.fullarc_intersections(fullarc):
-            if self.point_belongs(intersection):
-                intersections.append(intersection)
-        return intersections
+        intersections = self.surface3d.fullarc_intersections(fullarc)
+        return [intersection for intersection, belongs in zip(intersections, self.points_belong(intersections))
+                if belongs]
 
     def plot(self, ax=None, color="k", alpha=1, edge_details=False):
         """Plots the face."""
@@ -740,6 +961,15 @@ class Face3D(design3d.core.Primitive3D):
         point_inside2d = self.surface2d.random_point_inside()
         return self.surface3d.point2d_to_3d(point_inside2d)
 
+    def random_points_inside(self, number_points: int):
+        """
+        Gets random points on the face.
+
+        :param number_points: The number of points to generate.
+        :return: An array of shape (number_points, 3) with the random points.
+        """
+        return self.surface3d.parametric_points_to_3d(self.surface2d.random_points_inside(number_points))
+
     def is_adjacent(self, face2: "Face3D"):
         """
         Verifies if two faces are adjacent or not.
@@ -747,24 +977,67 @@ class Face3D(design3d.core.Primitive3D):
         :param face2: other face.
         :return: True or False.
         """
-        contour1 = self.outer_contour3d.to_2d(
-            self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-        )
-        contour2 = face2.outer_contour3d.to_2d(
-            self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-        )
+        frame = self.surface3d.frame
+        contour1 = self.outer_contour2d_projection(frame)
+        contour2 = face2.outer_contour2d_projection(frame)
         if contour1.is_sharing_primitives_with(contour2):
             return True
         return False
 
+    def outer_contour2d_projection(self, frame: design3d.Frame3D, max_size: int = 64):
+        """
+        Projects the outer contour 3D on the plane defined by the origin, u and v vectors of a frame.
+
+        Projections are cached by frame, so that repeated adjacency tests with the same faces compute them only once.
+
+        :param frame: frame defining the projection plane.
+        :param max_size: maximum number of cached projections, the oldest ones being dropped first.
+        :return: the projected outer contour 2D.
+        """
+        outer_contour3d = self.outer_contour3d
+        cached = self._outer_contour2d_projections.get(id(frame))
+        if cached is not None and cached[0] is frame and cached[1] is outer_contour3d:
+            return cached[2]
+        contour2d = outer_contour3d.to_2d(frame.origin, frame.u, frame.v)
+        if len(self._outer_contour2d_projections) >= max_size:
+            del self._outer_contour2d_projections[next(iter(self._outer_contour2d_projections))]
+        self._outer_contour2d_projections[id(frame)] = (frame, outer_contour3d, contour2d)
+        return contour2d
+
+    def boundary_primitives(self):
+        """
+        Gives the primitives of the outer and inner contours 3D, along with the bounds of their bounding boxes.
+
+        The result is cached as long as the contours 3D of the face are the same objects.
+
+        :return: a tuple of the primitives, and a (n, 6) array of their bounding boxes xmin, xmax, ymin, ymax, zmin and
+            zmax.
+        """
+        contours3d = [self.outer_contour3d] + self.inner_contours3d
+        if self._boundary_primitives:
+            cached_contours3d, primitives, bounds = self._boundary_primitives
+            if len(cached_contours3d) == len(contours3d) and all(
+                    cached_contour is contour for cached_contour, contour in zip(cached_contours3d, contours3d)):
+                return primitives, bounds
+        primitives = tuple(primitive for contour in contours3d for primitive in contour.primitives)
+        bounds = np.array([[bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax]
+                           for bbox in (primitive.bounding_box for primitive in primitives)], dtype=np.float64)
+        self._boundary_primitives = (contours3d, primitives, bounds)
+        return primitives, bounds
+
     def geo_lines(self):  # , mesh_size_list=None):
         """
         Gets the lines that define a Face3D in a .geo file.
 
         """
+        return list(self.geo_lines_iter())
 
-        i_index, p_index = None, None
-        lines, line_surface, lines_tags = [], [], []
+    def geo_lines_iter(self):
+        """
+        Yields the lines that define a Face3D in a .geo file, one at a time.
+
+        """
+        line_surface = []
         point_account, line_account, line_loop_account = 0, 0, 1
         for c_index, contour in enumerate(list(chain(*[[self.outer_contour3d], self.inner_contours3d]))):
 
@@ -797,37 +1070,23 @@ class Face3D(design3d.core.Primitive3D):
             elif isinstance(contour, (design3d.wires.Contour3D, design3d.wires.ClosedPolygon3D)):
                 if not isinstance(contour, design3d.wires.ClosedPolygon3D):
                     contour = contour.to_polygon(1)
-                for i_index, point in enumerate(contour.points):
-                    lines.append(point.get_geo_lines(tag=point_account + i_index + 1, point_mesh_size=None))
-
-                for p_index, primitive in enumerate(contour.primitives):
-                    if p_index != len(contour.primitives) - 1:
-                        lines.append(
-                            primitive.get_geo_lines(
-                                tag=line_account + p_index + 1,
-                                start_point_tag=point_account + p_index + 1,
-                                end_point_tag=point_account + p_index + 2,
-                            )
-                        )
-                    else:
-                        lines.append(
-                            primitive.get_geo_lines(
-                                tag=line_account + p_index + 1,
-                                start_point_tag=point_account + p_index + 1,
-                                end_point_tag=point_account + 1,
-                            )
-                        )
-                    lines_tags.append(line_account + p_index + 1)
-
-                lines.append("Line Loop(" + str(c_index + 1) + ") = {" + str(lines_tags)[1:-1] + "};")
+                number_points = len(contour.points)
+                number_primitives = len(contour.primitives)
+                yield from (point.get_geo_lines(tag=point_account + i_index + 1, point_mesh_size=None)
+                            for i_index, point in enumerate(contour.points))
+                yield from (primitive.get_geo_lines(
+                    tag=line_account + p_index + 1,
+                    start_point_tag=point_account + p_index + 1,
+                    end_point_tag=point_account + (p_index + 2 if p_index != number_primitives - 1 else 1))
+                    for p_index, primitive in enumerate(contour.primitives))
+                lines_tags = ", ".join(str(line_account + p_index + 1) for p_index in range(number_primitives))
+
+                yield f"Line Loop({c_index + 1}) = {{{lines_tags}}};"
                 line_surface.append(line_loop_account)
-                point_account = point_account + i_index + 1
-                line_account, line_loop_account = line_account + p_index + 1, line_loop_account + 1
-                lines_tags = []
-
-        lines.append("Plane Surface(" + str(1) + ") = {" + str(line_surface)[1:-1] + "};")
+                point_account += number_points
+                line_account, line_loop_account = line_account + number_primitives, line_loop_account + 1
 
-        return lines
+        yield f"Plane Surface(1) = {{{', '.join(map(str, line_surface))}}};"
 
     def to_geo(self, file_name: str):  # , mesh_size_list=None):
         """
@@ -835,13 +1094,8 @@ class Face3D(design3d.core.Primitive3D):
 
         """
 
-        lines = self.geo_lines()
-
         with open(file_name + ".geo", "w", encoding="utf-8") as file:
-            for line in lines:
-                file.write(line)
-                file.write("\n")
-        file.close()
+            file.writelines(line + "\n" for line in self.geo_lines_iter())
 
     def get_geo_lines(self, tag: int, line_loop_tag: List[int]):
         """
@@ -849,48 +1103,48 @@ class Face3D(design3d.core.Primitive3D):
 
         """
 
-        return "Plane Surface(" + str(tag) + ") = {" + str(line_loop_tag)[1:-1] + "};"
+        return f"Plane Surface({tag}) = {{{', '.join(map(str, line_loop_tag))}}};"
 
-    def edge3d_inside(self, edge3d, abs_tol: float = 1e-6):
+    def edge3d_inside(self, edge3d, abs_tol: float = 1e-6, edge_points: List[design3d.Point3D] = None):
         """
         Returns True if edge 3d is coplanar to the face.
+
+        :param edge3d: edge to verify.
+        :param abs_tol: tolerance.
+        :param edge_points: (optional) the edge's interior discretization points, if already computed by the caller.
         """
         method_name = f"{edge3d.__class__.__name__.lower()[:-2]}_inside"
         if hasattr(self, method_name):
             return getattr(self, method_name)(edge3d)
-        points = edge3d.discretization_points(number_points=10)
-        for point in points[1:-1]:
-            if not self.point_belongs(point, abs_tol):
-                return False
-        return True
+        if edge_points is None:
+            edge_points = edge3d.discretization_points(number_points=10)[1:-1]
+        return all(self._iter_points_belong(edge_points, abs_tol))
 
     def is_intersecting(self, face2, list_coincident_faces=None, tol: float = 1e-6):
         """
         Verifies if two face are intersecting.
 
         :param face2: face 2
-        :param list_coincident_faces: list of coincident faces, if existent
+        :param list_coincident_faces: coincident faces pairs, if existent. Faces being hashable, a set of pairs can
+            be given for constant time lookups.
         :param tol: tolerance for calculations
         :return: True if faces intersect, False otherwise
         """
         if list_coincident_faces is None:
-            list_coincident_faces = []
-        if self.bounding_box.is_intersecting(face2.bounding_box, tol) and (self, face2) not in list_coincident_faces:
-
-            edge_intersections = []
-            for prim1 in self.outer_contour3d.primitives + [
-                prim for inner_contour in self.inner_contours3d for prim in inner_contour.primitives
-            ]:
-                edge_intersections = face2.edge_intersections(prim1)
-                if edge_intersections:
+            list_coincident_faces = frozenset()
+        bbox1 = self.bounding_box
+        bbox2 = face2.bounding_box
+        if bbox1.is_intersecting(bbox2, tol) and (self, face2) not in list_coincident_faces:
+            prims1, bounds1 = self.boundary_primitives()
+            face2_edge_intersections = face2.edge_intersections
+            for index in np.flatnonzero(bbox2.boxes_intersecting(bounds1, tol)):
+                if face2_edge_intersections(prims1[index]):
+                    return True
+            prims2, bounds2 = face2.boundary_primitives()
+            self_edge_intersections = self.edge_intersections
+            for index in np.flatnonzero(bbox1.boxes_intersecting(bounds2, tol)):
+                if self_edge_intersections(prims2[index]):
                     return True
-            if not edge_intersections:
-                for prim2 in face2.outer_contour3d.primitives + [
-                    prim for inner_contour in face2.inner_contours3d for prim in inner_contour.primitives
-                ]:
-                    edge_intersections = self.edge_intersections(prim2)
-                    if edge_intersections:
-                        return True
 
         return False
 
@@ -899,28 +1153,27 @@ class Face3D(design3d.core.Primitive3D):
         Returns the intersections of the face outer contour with other given face.
         """
         intersections_points = []
+        face2_bounding_box = face2.bounding_box
         for edge1 in self.outer_contour3d.primitives:
-            intersection_points = face2.edge_intersections(edge1)
-            if intersection_points:
-                for point in intersection_points:
-                    if not point.in_list(intersections_points):
-                        intersections_points.append(point)
+            if not edge1.bounding_box.is_intersecting(face2_bounding_box):
+                continue
+            intersections_points.extend(face2.edge_intersections(edge1))
 
-        return intersections_points
+        return merge_unique_points([], intersections_points)
 
     def face_border_intersections(self, face2):
         """
         Returns the intersections of the face outer and inner contour with other given face.
         """
         intersections_points = []
+        face2_bounding_box = face2.bounding_box
         for contour in [self.outer_contour3d] + self.inner_contours3d:
             for edge1 in contour.primitives:
-                intersection_points = face2.edge_intersections(edge1)
-                for point in intersection_points:
-                    if not point.in_list(intersections_points):
-                        intersections_points.append(point)
+                if not edge1.bounding_box.is_intersecting(face2_bounding_box):
+                    continue
+                intersections_points.extend(face2.edge_intersections(edge1))
 
-        return intersections_points
+        return merge_unique_points([], intersections_points)
 
     def face_intersections(self, face2, tol=1e-6) -> List[design3d.wires.Wire3D]:
         """
@@ -945,24 +1198,19 @@ class Face3D(design3d.core.Primitive3D):
         :return: list of intersecting wires.
         """
         surface_intersections = self.surface3d.surface_intersections(generic_face.surface3d)
-        intersections_points = self.face_intersections_outer_contour(generic_face)
-        for point in generic_face.face_intersections_outer_contour(self):
-            if not point.in_list(intersections_points):
-                intersections_points.append(point)
+        intersections_points = merge_unique_points(self.face_intersections_outer_contour(generic_face),
+                                                   generic_face.face_intersections_outer_contour(self))
         face_intersections = []
         for primitive in surface_intersections:
-            points_on_primitive = []
-            for point in intersections_points:
-                if primitive.point_belongs(point, 1e-4):
-                    points_on_primitive.append(point)
+            points_on_primitive = points_on_curve_sorted(primitive, intersections_points, 1e-4)
             if not points_on_primitive:
                 continue
-            points_on_primitive = primitive.sort_points_along_curve(points_on_primitive)
             if primitive.periodic:
                 points_on_primitive = points_on_primitive + [points_on_primitive[0]]
             for point1, point2 in zip(points_on_primitive[:-1], points_on_primitive[1:]):
                 edge = primitive.trim(point1, point2)
-                if self.edge3d_inside(edge, 1e-3) and generic_face.edge3d_inside(edge, 1e-3):
+                edge_points = edge.discretization_points(number_points=10)[1:-1]
+                if self.edge3d_inside(edge, 1e-3, edge_points) and generic_face.edge3d_inside(edge, 1e-3, edge_points):
                     face_intersections.append(design3d.wires.Wire3D([edge]))
         return face_intersections
 
@@ -1042,58 +1290,59 @@ class Face3D(design3d.core.Primitive3D):
         :param list_split_inner_contours: list of split inner contours.
         :return: valid list of cutting contours.
         """
-        valid_cutting_contours = []
+        outer_contour = self.surface2d.outer_contour
+        outer_contour_point_belongs_cache = {}
 
-        while list_cutting_contours:
-            for i, cutting_contour in enumerate(list_cutting_contours[:]):
-                if (
-                    self.surface2d.outer_contour.point_belongs(cutting_contour.primitives[0].start)
-                    and self.surface2d.outer_contour.point_belongs(cutting_contour.primitives[-1].end)
-                ) or cutting_contour.primitives[0].start.is_close(cutting_contour.primitives[-1].end):
+        def outer_contour_point_belongs(point):
+            key = point_tolerance_key(point)
+            if key not in outer_contour_point_belongs_cache:
+                outer_contour_point_belongs_cache[key] = outer_contour.point_belongs(point)
+            return outer_contour_point_belongs_cache[key]
+
+        def are_extremity_points_touching(wire):
+            return (outer_contour_point_belongs(wire.primitives[0].start)
+                    and outer_contour_point_belongs(wire.primitives[-1].end))
+
+        valid_cutting_contours = []
+        pending_cutting_contours = deque(list_cutting_contours)
+        while pending_cutting_contours:
+            cutting_contour = pending_cutting_contours.popleft()
+            if (are_extremity_points_touching(cutting_contour)
+                    or cutting_contour.primitives[0].start.is_close(cutting_contour.primitives[-1].end)):
+                valid_cutting_contours.append(cutting_contour)
+                continue
+            while True:
+                connecting_split_contour = cutting_contour.get_connected_wire(list_split_inner_contours)
+                if not connecting_split_contour:
                     valid_cutting_contours.append(cutting_contour)
-                    list_cutting_contours.pop(i)
                     break
-                list_cutting_contours.pop(i)
-                while True:
-                    connecting_split_contour = cutting_contour.get_connected_wire(list_split_inner_contours)
-                    if not connecting_split_contour:
-                        valid_cutting_contours.append(cutting_contour)
-                        break
-                    list_split_inner_contours.remove(connecting_split_contour)
-                    new_contour = design3d.wires.Contour2D.contours_from_edges(
-                        cutting_contour.primitives + connecting_split_contour.primitives
-                    )[0]
-
-                    if (
-                        self.surface2d.outer_contour.are_extremity_points_touching(new_contour)
-                        or new_contour.is_contour_closed()
-                    ):
-                        valid_cutting_contours.append(new_contour)
-                        break
+                list_split_inner_contours.remove(connecting_split_contour)
+                new_contour = join_connected_contours(cutting_contour, connecting_split_contour)
 
-                    connecting_cutting_contour = new_contour.get_connected_wire(list_cutting_contours)
-                    if not connecting_cutting_contour:
-                        if any(
-                            self.surface2d.outer_contour.point_belongs(point)
-                            for point in [new_contour.primitives[0].start, new_contour.primitives[-1].end]
-                        ) and any(
-                            valid_contour.point_belongs(point)
-                            for valid_contour in valid_cutting_contours
-                            for point in [new_contour.primitives[0].start, new_contour.primitives[-1].end]
-                        ):
-                            valid_cutting_contours.append(new_contour)
-                        break
-                    new_contour = design3d.wires.Contour2D.contours_from_edges(
-                        new_contour.primitives + connecting_cutting_contour.primitives
-                    )[0]
-                    list_cutting_contours.remove(connecting_cutting_contour)
+                if are_extremity_points_touching(new_contour) or new_contour.is_contour_closed():
+                    valid_cutting_contours.append(new_contour)
+                    break
 
-                    if self.surface2d.outer_contour.are_extremity_points_touching(new_contour):
+                connecting_cutting_contour = new_contour.get_connected_wire(pending_cutting_contours)
+                if not connecting_cutting_contour:
+                    if any(
+                        outer_contour_point_belongs(point)
+                        for point in [new_contour.primitives[0].start, new_contour.primitives[-1].end]
+                    ) and any(
+                        valid_contour.point_belongs(point)
+                        for valid_contour in valid_cutting_contours
+                        for point in [new_contour.primitives[0].start, new_contour.primitives[-1].end]
+                    ):
                         valid_cutting_contours.append(new_contour)
-                        break
+                    break
+                new_contour = join_connected_contours(new_contour, connecting_cutting_contour)
+                pending_cutting_contours.remove(connecting_cutting_contour)
 
-                    cutting_contour = new_contour
-                break
+                if are_extremity_points_touching(new_contour):
+                    valid_cutting_contours.append(new_contour)
+                    break
+
+                cutting_contour = new_contour
         return valid_cutting_contours
 
     def get_face_cutting_contours(self, dict_intersecting_combinations):
@@ -1111,24 +1360,30 @@ class Face3D(design3d.core.Primitive3D):
 
         cutting_contours = []
         if len(list_cutting_contours) > 1:
-            while list_cutting_contours:
-                closed_contours = []
-                opened_contours = []
-                for contour in list_cutting_contours:
-                    if contour.is_contour_closed():
-                        closed_contours.append(contour)
-                    else:
-                        opened_contours.append(contour)
-                list_cutting_contours = closed_contours + opened_contours
-                current_cutting_contour = list_cutting_contours.pop(0)
-                connected_contour = current_cutting_contour.get_connected_wire(list_cutting_contours)
-                if connected_contour in list_cutting_contours:
-                    list_cutting_contours.remove(connected_contour)
+            closed_contours = deque()
+            opened_contours = deque()
+            for contour in list_cutting_contours:
+                if contour.is_contour_closed():
+                    closed_contours.append(contour)
+                else:
+                    opened_contours.append(contour)
+            while closed_contours or opened_contours:
+                current_cutting_contour = closed_contours.popleft() if closed_contours else opened_contours.popleft()
+                # get_connected_wire keeps the first connected contour in this order: an end point index would not
+                connected_contour = current_cutting_contour.get_connected_wire(
+                    chain(closed_contours, opened_contours))
                 if not connected_contour:
                     cutting_contours.append(current_cutting_contour)
                     continue
+                if connected_contour in closed_contours:
+                    closed_contours.remove(connected_contour)
+                elif connected_contour in opened_contours:
+                    opened_contours.remove(connected_contour)
                 new_contour = current_cutting_contour.merge_not_adjacent_contour(connected_contour)
-                list_cutting_contours.append(new_contour)
+                if new_contour.is_contour_closed():
+                    closed_contours.append(new_contour)
+                else:
+                    opened_contours.append(new_contour)
             list_cutting_contours = cutting_contours
 
         list_split_inner_contours = self.split_inner_contour_intersecting_cutting_contours(list_cutting_contours)
@@ -1293,11 +1548,11 @@ class Face3D(design3d.core.Primitive3D):
                     break
             else:
                 new_faces_contours_.append(new_contour)
-        new_faces_contours = new_faces_contours_
+        # Work queue: merged contours are processed right after the contour they come from
+        new_faces_contours = deque(new_faces_contours_)
         while new_faces_contours:
-            new_face_contour = new_faces_contours[0]
+            new_face_contour = new_faces_contours.popleft()
             if new_face_contour in valid_new_faces_contours:
-                new_faces_contours.remove(new_face_contour)
                 continue
             inner_contours = []
             for inner_contour in self.surface2d.inner_contours:
@@ -1306,15 +1561,13 @@ class Face3D(design3d.core.Primitive3D):
                 if new_face_contour.is_sharing_primitives_with(inner_contour):
                     merged_new_face_contours = new_face_contour.merge_with(inner_contour)
                     if merged_new_face_contours:
-                        new_faces_contours.remove(new_face_contour)
-                        new_faces_contours = merged_new_face_contours + new_faces_contours
+                        new_faces_contours.extendleft(reversed(merged_new_face_contours))
                         break
                 else:
                     inner_contours.append(inner_contour)
             else:
                 valid_new_faces_contours.append(new_face_contour)
                 valid_inner_contours.append(inner_contours)
-                new_faces_contours.remove(new_face_contour)
         return valid_new_faces_contours, valid_inner_contours
 
     def get_closed_contour_divided_faces_inner_contours(self, list_faces, new_contour):
@@ -1326,6 +1579,19 @@ class Face3D(design3d.core.Primitive3D):
         :return: a list of new faces with its inner contours.
         """
         new_list_faces = []
+        new_contour_primitives = tuple(new_contour.primitives)
+        # Divided faces share their inner contours objects: relations to new_contour are computed once per contour
+        inner_contours_relations = {}
+
+        def get_inner_contour_relation(inner_contour):
+            cached = inner_contours_relations.get(id(inner_contour))
+            if cached is not None and cached[0] is inner_contour:
+                return cached[1]
+            relation = (new_contour.is_inside(inner_contour),
+                        any(inner_contour.primitive_over_contour(prim) for prim in new_contour_primitives))
+            inner_contours_relations[id(inner_contour)] = (inner_contour, relation)
+            return relation
+
         for new_face in list_faces:
             if new_face.surface2d.outer_contour.is_inside(new_contour):
                 inner_contours1 = []
@@ -1335,12 +1601,13 @@ class Face3D(design3d.core.Primitive3D):
                     break
                 new_contour_not_sharing_primitives = True
                 for i, inner_contour in enumerate(new_face.surface2d.inner_contours):
-                    if new_contour.is_inside(inner_contour):
-                        if any(inner_contour.primitive_over_contour(prim) for prim in new_contour.primitives):
+                    is_around_inner_contour, is_sharing_primitives = get_inner_contour_relation(inner_contour)
+                    if is_around_inner_contour:
+                        if is_sharing_primitives:
                             new_face.surface2d.inner_contours[i] = new_contour
                             break
                         inner_contours2.append(inner_contour)
-                    elif not any(inner_contour.primitive_over_contour(prim) for prim in new_contour.primitives):
+                    elif not is_sharing_primitives:
                         inner_contours1.append(inner_contour)
                     else:
                         new_contour_not_sharing_primitives = False
@@ -1367,6 +1634,12 @@ class Face3D(design3d.core.Primitive3D):
         :return: list of intersecting primitives for current face
         """
         face_intersecting_primitives2d = []
+        selected_primitives = EdgeHashSet()
+
+        def add_primitive(primitive):
+            face_intersecting_primitives2d.append(primitive)
+            selected_primitives.add(primitive)
+
         intersections = dict_intersecting_combinations[self]
         for intersection_wire in intersections:
             wire2d = self.surface3d.contour3d_to_2d(intersection_wire)
@@ -1376,21 +1649,19 @@ class Face3D(design3d.core.Primitive3D):
                     primitive_plus_periodicity = primitive2d.translation(
                         design3d.Vector2D(self.surface3d.x_periodicity, 0))
                     if self.surface2d.outer_contour.is_edge_inside(primitive_plus_periodicity, self.face_tolerance):
-                        face_intersecting_primitives2d.append(primitive_plus_periodicity)
+                        add_primitive(primitive_plus_periodicity)
                         continue
                     primitive_minus_periodicity = primitive2d.translation(
                         design3d.Vector2D(- self.surface3d.x_periodicity, 0))
                     if self.surface2d.outer_contour.is_edge_inside(primitive_minus_periodicity, self.face_tolerance):
-                        face_intersecting_primitives2d.append(primitive_minus_periodicity)
+                        add_primitive(primitive_minus_periodicity)
                         continue
-                if design3d.core.edge_in_list(primitive2d, face_intersecting_primitives2d) or design3d.core.edge_in_list(
-                        primitive2d.reverse(), face_intersecting_primitives2d
-                ):
+                if primitive2d in selected_primitives:
                     continue
                 if not self.surface2d.outer_contour.primitive_over_contour(primitive2d, tol=1e-7) and \
                         not any(inner_contour.primitive_over_contour(primitive2d, tol=1e-7)
                                 for inner_contour in self.surface2d.inner_contours):
-                    face_intersecting_primitives2d.append(primitive2d)
+                    add_primitive(primitive2d)
         return face_intersecting_primitives2d
 
     def _is_linesegment_intersection_possible(self, linesegment: d3de.LineSegment3D):
@@ -1400,25 +1671,36 @@ class Face3D(design3d.core.Primitive3D):
         :param linesegment: other line segment.
         :return: returns True if possible, False otherwise.
         """
-        if not self.bounding_box.is_intersecting(linesegment.bounding_box):
+        bounding_box = self.bounding_box
+        if not bounding_box.is_intersecting(linesegment.bounding_box):
             return False
         if math.isclose(self.area(), 0.0, abs_tol=1e-10):
             return False
-        bbox_block_faces = design3d.primitives3d.Block.from_bounding_box(self.bounding_box).faces
-        if not any(bbox_face.line_intersections(linesegment.line) for bbox_face in bbox_block_faces):
-            return False
-        return True
+        return bounding_box.is_intersecting_linesegment(linesegment)
+
+    def _get_triangulation_triangles(self):
+        """
+        Gets the triangles of the face triangulation, along with the bounds of their bounding boxes.
+
+        :return: a tuple of the triangles, and a (n, 6) array of their bounding boxes xmin, xmax, ymin, ymax, zmin and
+            zmax.
+        """
+        if not self._triangulation_triangles:
+            triangles = tuple(self._get_triangulation().to_triangles3d())
+            bounds = np.array([[bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax]
+                               for bbox in (triangle.bounding_box for triangle in triangles)],
+                              dtype=np.float64).reshape(-1, 6)
+            self._triangulation_triangles = (triangles, bounds)
+        return self._triangulation_triangles
 
     def _get_linesegment_intersections_approximation(self, linesegment: d3de.LineSegment3D):
         """Generator line segment intersections approximation."""
         if self.__class__ == PlaneFace3D:
-            faces_triangulation = [self]
-        else:
-            triangulation = self.triangulation()
-            faces_triangulation = triangulation.triangular_faces()
-        for face in faces_triangulation:
-            inters = face.linesegment_intersections(linesegment)
-            yield inters
+            yield self.linesegment_intersections(linesegment)
+            return
+        triangles, bounds = self._get_triangulation_triangles()
+        for index in np.flatnonzero(linesegment.bounding_box.boxes_intersecting(bounds)):
+            yield triangles[index].linesegment_intersections(linesegment)
 
     def is_linesegment_crossing(self, linesegment):
         """
@@ -1434,13 +1716,8 @@ class Face3D(design3d.core.Primitive3D):
         """Approximation of intersections face 3D and a line segment 3D."""
         if not self._is_linesegment_intersection_possible(linesegment):
             return []
-        linesegment_intersections = []
-        for inters in self._get_linesegment_intersections_approximation(linesegment):
-            for point in inters:
-                if not point.in_list(linesegment_intersections, abs_tol):
-                    linesegment_intersections.append(point)
-
-        return linesegment_intersections
+        return merge_unique_points(
+            [], chain.from_iterable(self._get_linesegment_intersections_approximation(linesegment)), abs_tol)
 
     def face_decomposition(self):
         """
@@ -1464,7 +1741,7 @@ class Face3D(design3d.core.Primitive3D):
             return getattr(self, method_name)(other_face, return_points)
 
         # Generic case
-        return self.triangulation().minimum_distance(other_face.triangulation(), return_points)
+        return self._get_triangulation().minimum_distance(other_face._get_triangulation(), return_points)
         # TODO : implement an exact method and then clean code
 
         # face_decomposition1 = self.face_decomposition()
@@ -1522,11 +1799,7 @@ class Face3D(design3d.core.Primitive3D):
         outer_contour_intersections_with_plane = plane3d.contour_intersections(self.outer_contour3d)
         plane_intersections = []
         for plane_intersection in surfaces_intersections:
-            points_on_curve = []
-            for point in outer_contour_intersections_with_plane:
-                if plane_intersection.point_belongs(point):
-                    points_on_curve.append(point)
-            points_on_primitive = plane_intersection.sort_points_along_curve(points_on_curve)
+            points_on_primitive = points_on_curve_sorted(plane_intersection, outer_contour_intersections_with_plane)
             if not isinstance(plane_intersection, design3d_curves.Line3D):
                 points_on_primitive = points_on_primitive + [points_on_primitive[0]]
             for point1, point2 in zip(points_on_primitive[:-1], points_on_primitive[1:]):
@@ -1555,31 +1828,41 @@ class Face3D(design3d.core.Primitive3D):
                 break
         return self.divide_face(intersections_with_plane2d)
 
+    def _get_face_decomposition_points(self):
+        """
+        Gets the points of all the face decomposition's sets, stacked in a single array.
+
+        The arrays are cached along with the face decomposition they were computed from.
+
+        :return: the list of the decomposition's sets, the list of (m, 6) arrays of the bounding boxes of each set's
+            faces, a (n, 3) array of the sets points, and the index of the first point of each set in this array.
+        """
+        face_decomposition = self.face_decomposition()
+        if not self._face_decomposition_points or self._face_decomposition_points[0] is not face_decomposition:
+            decomposition_sets = list(face_decomposition.values())
+            list_set_points = [[[*point] for point in {point for face in faces for point in face.points}]
+                               for faces in decomposition_sets]
+            offsets = np.cumsum([0] + [len(set_points) for set_points in list_set_points[:-1]])
+            points = np.array([point for set_points in list_set_points for point in set_points], dtype=np.float64)
+            sets_bounds = [np.array([[bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax]
+                                     for bbox in (face.bounding_box for face in faces)], dtype=np.float64)
+                           for faces in decomposition_sets]
+            self._face_decomposition_points = (face_decomposition, decomposition_sets, sets_bounds, points, offsets)
+        return self._face_decomposition_points[1:]
+
     def _get_face_decomposition_set_closest_to_point(self, point):
         """
         Searches for the faces decomposition's set closest to given point.
 
         :param point: other point.
-        :return: list of triangular faces, corresponding to area of the face closest to point.
+        :return: list of triangular faces, corresponding to area of the face closest to point, and the (m, 6) array of
+            their bounding boxes.
         """
-        face_decomposition1 = self.face_decomposition()
-        list_set_points1 = [
-            {point for face in faces1 for point in face.points} for _, faces1 in face_decomposition1.items()
-        ]
-        list_set_points1 = [
-            np.array([(point[0], point[1], point[2]) for point in sets_points1]) for sets_points1 in list_set_points1
-        ]
-        list_set_points2 = [np.array([(point[0], point[0], point[0])])]
-
-        minimum_distance = math.inf
-        index1 = None
-        for sets_points1, sets_points2 in product(list_set_points1, list_set_points2):
-            distances = np.linalg.norm(sets_points2[:, np.newaxis] - sets_points1, axis=2)
-            sets_min_dist = np.min(distances)
-            if sets_min_dist < minimum_distance:
-                minimum_distance = sets_min_dist
-                index1 = next((i for i, x in enumerate(list_set_points1) if np.array_equal(x, sets_points1)), -1)
-        return list(face_decomposition1.values())[index1]
+        decomposition_sets, sets_bounds, points, offsets = self._get_face_decomposition_points()
+        vectors = points - [*point]
+        closest_point_index = np.einsum('ij,ij->i', vectors, vectors).argmin()
+        set_index = np.searchsorted(offsets, closest_point_index, side='right') - 1
+        return decomposition_sets[set_index], sets_bounds[set_index]
 
     def point_distance(self, point, return_other_point: bool = False):
         """
@@ -1590,11 +1873,18 @@ class Face3D(design3d.core.Primitive3D):
         :return: distance to face3D.
         """
 
-        faces1 = self._get_face_decomposition_set_closest_to_point(point)
+        faces1, bounds1 = self._get_face_decomposition_set_closest_to_point(point)
+        # The distance to a face bounding box is a lower bound of the distance to the face: faces are visited from the
+        # closest box and the search stops once the boxes are farther than the best distance found
+        coordinates = np.array([*point])
+        lower_bounds = np.linalg.norm(np.maximum(np.maximum(bounds1[:, ::2] - coordinates,
+                                                            coordinates - bounds1[:, 1::2]), 0.), axis=1)
         minimum_distance = math.inf
         best_distance_point = None
-        for face1 in faces1:
-            distance, point1 = face1.point_distance(point, True)
+        for index in np.argsort(lower_bounds, kind="stable"):
+            if lower_bounds[index] > minimum_distance + self.face_tolerance:
+                break
+            distance, point1 = faces1[index].point_distance(point, True)
             if distance < minimum_distance:
                 minimum_distance = distance
                 best_distance_point = point1
@@ -1644,15 +1934,50 @@ class PlaneFace3D(Face3D):
     :type surface2d: Surface2D.
     """
 
+    bounding_box_bounds_face = True
+
     def __init__(self, surface3d: surfaces.Plane3D, surface2d: surfaces.Surface2D,
                  reference_path: str = design3d.PATH_ROOT, name: str = ""):
         self._bbox = None
+        self._outer_border_polygon = None
         Face3D.__init__(self, surface3d=surface3d, surface2d=surface2d, reference_path=reference_path, name=name)
 
+    def _iter_points_belong(self, points3d: List[design3d.Point3D], tol: float = 1e-6):
+        """
+        Lazy version of points_belong, allowing callers to stop at the first point outside the face.
+
+        Parametric coordinates and distances to the plane are computed for all points at once.
+        """
+        if not points3d:
+            return
+        points_array = np.array([[*point] for point in points3d], dtype=np.float64)
+        inside_bounding_box = self.bounding_box.points_inside(points_array, 1e-3)
+        frame = self.surface3d.frame
+        points2d = self.surface3d.points3d_to_2d(points_array)
+        plane_distances = (points_array - [*frame.origin]) @ np.array([*frame.w])
+        for point2d, plane_distance, inside in zip(points2d, plane_distances, inside_bounding_box):
+            yield (bool(inside) and abs(plane_distance) <= tol
+                   and self.surface2d.point_belongs(design3d.Point2D(*point2d)))
+
     def copy(self, deep=True, memo=None):
         """Returns a copy of the PlaneFace3D."""
         return PlaneFace3D(self.surface3d.copy(deep, memo), self.surface2d.copy(), self.reference_path, self.name)
 
+    def _get_outer_border_polygon(self):
+        """
+        Gets the polygon of the outer contour used to compute distances to the face border.
+
+        The polygon, and so its line segments, are kept as long as the outer contour is the same object.
+        """
+        outer_contour = self.surface2d.outer_contour
+        if self._outer_border_polygon:
+            cached_contour, polygon2d = self._outer_border_polygon
+            if cached_contour is outer_contour:
+                return polygon2d
+        polygon2d = outer_contour.to_polygon(angle_resolution=10)
+        self._outer_border_polygon = (outer_contour, polygon2d)
+        return polygon2d
+
     def point_distance(self, point, return_other_point=False):
         """
         Calculates the distance from a plane face and a point.
@@ -1670,10 +1995,11 @@ class PlaneFace3D(Face3D):
                 return projection_distance, projected_pt
             return projection_distance
 
-        point_2d = point.to_2d(self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v)
+        frame = self.surface3d.frame
+        point_2d = point.to_2d(frame.origin, frame.u, frame.v)
 
-        polygon2d = self.surface2d.outer_contour.to_polygon(angle_resolution=10)
-        border_distance, other_point = polygon2d.point_border_distance(point_2d, return_other_point=True)
+        border_distance, other_point = self._get_outer_border_polygon().point_border_distance(
+            point_2d, return_other_point=True)
 
         other_point = self.surface3d.point2d_to_3d(design3d.Point2D(*other_point))
 
@@ -1704,9 +2030,21 @@ class PlaneFace3D(Face3D):
                 if return_points:
                     return 0.0, edge_intersections[0], edge_intersections[0]
                 return 0.0
+        primitives1 = self.outer_contour3d.primitives
+        primitives2 = other_plane_face.outer_contour3d.primitives
+        if all(primitive.__class__ is d3de.LineSegment3D for primitive in chain(primitives1, primitives2)):
+            distances, points1, points2 = linesegments_closest_points(
+                *(np.array([[*getattr(primitive, attribute)] for primitive in primitives], dtype=np.float64)
+                  for primitives in (primitives1, primitives2) for attribute in ("start", "end")))
+            index1, index2 = np.unravel_index(np.argmin(distances), distances.shape)
+            min_distance = float(distances[index1, index2])
+            if return_points:
+                return (min_distance, design3d.Point3D(*points1[index1, index2]),
+                        design3d.Point3D(*points2[index1, index2]))
+            return min_distance
         min_distance = math.inf
-        for edge1 in self.outer_contour3d.primitives:
-            for edge2 in other_plane_face.outer_contour3d.primitives:
+        for edge1 in primitives1:
+            for edge2 in primitives2:
                 if hasattr(edge1, "minimum_distance"):
                     dist = edge1.minimum_distance(edge2, return_points=return_points)
                 elif hasattr(edge2, "minimum_distance"):
@@ -1732,10 +2070,12 @@ class PlaneFace3D(Face3D):
         """
         if not linesegment.direction_vector().is_perpendicular_to(self.surface3d.frame.w, 1e-6):
             return False
-        for point in [linesegment.start, linesegment.middle_point(), linesegment.end]:
-            if not self.point_belongs(point):
-                return False
-        return True
+        # The middle point lies in the bounding box as soon as both ends do, and is only computed if they belong
+        if not (self.bounding_box.point_inside(linesegment.start, 1e-3)
+                and self.bounding_box.point_inside(linesegment.end, 1e-3)):
+            return False
+        return (self.point_belongs(linesegment.start) and self.point_belongs(linesegment.end)
+                and self.point_belongs(linesegment.middle_point()))
 
     def circle_inside(self, circle: design3d_curves.Circle3D):
         """
@@ -1746,11 +2086,7 @@ class PlaneFace3D(Face3D):
         """
         if not math.isclose(abs(circle.frame.w.dot(self.surface3d.frame.w)), 1.0, abs_tol=1e-6):
             return False
-        points = circle.discretization_points(number_points=4)
-        for point in points:
-            if not self.point_belongs(point):
-                return False
-        return True
+        return all(self._iter_points_belong(circle.discretization_points(number_points=4)))
 
     def planeface_intersections(self, planeface):
         """
@@ -1759,25 +2095,30 @@ class PlaneFace3D(Face3D):
         :param planeface: the other Plane Face 3D to verify intersections with Plane Face 3D.
         :return: list of intersecting wires.
         """
+        if not self.bounding_box.is_intersecting(planeface.bounding_box):
+            return []
         face2_plane_intersections = planeface.surface3d.plane_intersections(self.surface3d)
         if not face2_plane_intersections:
             return []
-        points_intersections = self.face_border_intersections(planeface)
-        for point in planeface.face_border_intersections(self):
-            if not point.in_list(points_intersections):
-                points_intersections.append(point)
+        points_intersections = merge_unique_points(self.face_border_intersections(planeface),
+                                                   planeface.face_border_intersections(self))
         points_intersections = face2_plane_intersections[0].sort_points_along_curve(points_intersections)
+        # A line segment over a contour lies inside its bounding box: the discretized check is only done in that case
+        self_inner_contours = [(contour, contour.bounding_box) for contour in self.inner_contours3d]
+        planeface_inner_contours = [(contour, contour.bounding_box) for contour in planeface.inner_contours3d]
+
+        def is_over_inner_contour(inner_contours, linesegment3d):
+            linesegment_bbox = linesegment3d.bounding_box
+            return any(linesegment_bbox.is_inside_bbox(contour_bbox) and inner_contour.primitive_over_contour(
+                linesegment3d) for inner_contour, contour_bbox in inner_contours)
+
         planeface_intersections = []
         for point1, point2 in zip(points_intersections[:-1], points_intersections[1:]):
             linesegment3d = d3de.LineSegment3D(point1, point2)
             over_self_outer_contour = self.outer_contour3d.primitive_over_contour(linesegment3d)
             over_planeface_outer_contour = planeface.outer_contour3d.primitive_over_contour(linesegment3d)
-            over_self_inner_contour = any(
-                inner_contour.primitive_over_contour(linesegment3d) for inner_contour in self.inner_contours3d
-            )
-            over_planeface_inner_contour = any(
-                inner_contour.primitive_over_contour(linesegment3d) for inner_contour in planeface.inner_contours3d
-            )
+            over_self_inner_contour = is_over_inner_contour(self_inner_contours, linesegment3d)
+            over_planeface_inner_contour = is_over_inner_contour(planeface_inner_contours, linesegment3d)
             if over_self_inner_contour and over_planeface_outer_contour:
                 continue
             if over_planeface_inner_contour and over_self_outer_contour:
@@ -1809,6 +2150,8 @@ class PlaneFace3D(Face3D):
         :param cylindricalface: the Cylindrical Face 3D to verify intersections with Plane Face 3D.
         :return: list of intersecting wires.
         """
+        if not self.bounding_box.is_intersecting(cylindricalface.bounding_box):
+            return []
         cylindricalsurfaceface_intersections = cylindricalface.surface3d.plane_intersections(self.surface3d)
         if not cylindricalsurfaceface_intersections:
             return []
@@ -1826,19 +2169,13 @@ class PlaneFace3D(Face3D):
                         [design3d.edges.FullArcEllipse3D.from_curve(cylindricalsurfaceface_intersections[0])]
                     )
                 return [contour3d]
-        intersections_points = self.face_intersections_outer_contour(cylindricalface)
-        for point in cylindricalface.face_intersections_outer_contour(self):
-            if point not in intersections_points:
-                intersections_points.append(point)
+        intersections_points = merge_unique_points(self.face_intersections_outer_contour(cylindricalface),
+                                                   cylindricalface.face_intersections_outer_contour(self))
         face_intersections = []
         for primitive in cylindricalsurfaceface_intersections:
-            points_on_primitive = []
-            for point in intersections_points:
-                if primitive.point_belongs(point):
-                    points_on_primitive.append(point)
+            points_on_primitive = points_on_curve_sorted(primitive, intersections_points)
             if not points_on_primitive:
                 continue
-            points_on_primitive = primitive.sort_points_along_curve(points_on_primitive)
             if not isinstance(primitive, design3d_curves.Line3D):
                 points_on_primitive = points_on_primitive + [points_on_primitive[0]]
             for point1, point2 in zip(points_on_primitive[:-1], points_on_primitive[1:]):
@@ -1854,6 +2191,8 @@ class PlaneFace3D(Face3D):
         :param conical_face: the Conical Face 3D to verify intersections with Plane Face 3D.
         :return: list of intersecting wires.
         """
+        if not self.bounding_box.is_intersecting(conical_face.bounding_box):
+            return []
         surface_intersections = self.surface3d.surface_intersections(conical_face.surface3d)
         if isinstance(surface_intersections[0], design3d_curves.Circle3D):
             if self.edge3d_inside(surface_intersections[0]) and conical_face.edge3d_inside(surface_intersections[0]):
@@ -1865,19 +2204,13 @@ class PlaneFace3D(Face3D):
                     [design3d.edges.FullArcEllipse3D.from_curve(surface_intersections[0])]
                 )
                 return [contour3d]
-        intersections_points = self.face_intersections_outer_contour(conical_face)
-        for point in conical_face.face_intersections_outer_contour(self):
-            if not point.in_list(intersections_points):
-                intersections_points.append(point)
+        intersections_points = merge_unique_points(self.face_intersections_outer_contour(conical_face),
+                                                   conical_face.face_intersections_outer_contour(self))
         face_intersections = []
         for primitive in surface_intersections:
-            points_on_primitive = []
-            for point in intersections_points:
-                if primitive.point_belongs(point):
-                    points_on_primitive.append(point)
+            points_on_primitive = points_on_curve_sorted(primitive, intersections_points)
             if not points_on_primitive:
                 continue
-            points_on_primitive = primitive.sort_points_along_curve(points_on_primitive)
             if isinstance(primitive, design3d_curves.ClosedCurve):
                 points_on_primitive = points_on_primitive + [points_on_primitive[0]]
             for point1, point2 in zip(points_on_primitive[:-1], points_on_primitive[1:]):
@@ -1895,20 +2228,16 @@ class PlaneFace3D(Face3D):
         :param toroidal_face: the Toroidal Face 3D to verify intersections with Plane Face 3D.
         :return: list of intersecting wires.
         """
+        if not self.bounding_box.is_intersecting(toroidal_face.bounding_box):
+            return []
         surface_intersections = self.surface3d.surface_intersections(toroidal_face.surface3d)
-        intersections_points = self.face_intersections_outer_contour(toroidal_face)
-        for point in toroidal_face.face_intersections_outer_contour(self):
-            if not point.in_list(intersections_points):
-                intersections_points.append(point)
+        intersections_points = merge_unique_points(self.face_intersections_outer_contour(toroidal_face),
+                                                   toroidal_face.face_intersections_outer_contour(self))
         face_intersections = []
         for primitive in surface_intersections:
-            points_on_primitive = []
-            for point in intersections_points:
-                if primitive.point_belongs(point, 1e-5):
-                    points_on_primitive.append(point)
+            points_on_primitive = points_on_curve_sorted(primitive, intersections_points, 1e-5)
             if not points_on_primitive:
                 continue
-            points_on_primitive = primitive.sort_points_along_curve(points_on_primitive)
             if primitive.periodic:
                 points_on_primitive = points_on_primitive + [points_on_primitive[0]]
             for point1, point2 in zip(points_on_primitive[:-1], points_on_primitive[1:]):
@@ -1941,46 +2270,83 @@ class PlaneFace3D(Face3D):
         :param face2: other face.
         :return: True if adjacent, False otherwise.
         """
-        contour1 = self.outer_contour3d.to_2d(
-            self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-        )
-        contour2 = face2.outer_contour3d.to_2d(
-            self.surface3d.frame.origin, self.surface3d.frame.u, self.surface3d.frame.v
-        )
+        frame = self.surface3d.frame
+        contour1 = self.outer_contour2d_projection(frame)
+        contour2 = face2.outer_contour2d_projection(frame)
         if contour1.is_sharing_primitives_with(contour2, False):
             return True
         return False
 
     @staticmethod
     def merge_faces(list_coincident_faces: List[Face3D]):
-        """Merges faces from a list of faces in the same plane, if any are adjacent to one another."""
+        """
+        Merges faces from a list of faces in the same plane, if any are adjacent to one another.
+
+        Faces are first split into groups connected by their bounding boxes, which are merged independently.
+        """
         list_coincident_faces = sorted(list_coincident_faces, key=lambda face_: face_.area())
+        seeded_merged_faces = []
+        for group_indices in bounding_box_connected_groups(list_coincident_faces):
+            group = [list_coincident_faces[index] for index in group_indices]
+            seeded_merged_faces.extend((group_indices[seed_index], merged_face)
+                                       for seed_index, merged_face in PlaneFace3D._merge_faces_group(group))
+        # Same order as merging all faces at once: by area of the face each merged face started from
+        seeded_merged_faces.sort(key=lambda seeded_merged_face: seeded_merged_face[0])
+        return [merged_face for _, merged_face in seeded_merged_faces]
+
+    @staticmethod
+    def _merge_faces_group(list_coincident_faces: List[Face3D]):
+        """
+        Merges faces of a group, sorted by area, whose bounding boxes are connected.
+
+        :return: list of (index of the face the merged face started from, merged face) pairs.
+        """
+        # Faces are flagged once merged instead of being removed, which would compare them to the others' data
+        alive = np.ones(len(list_coincident_faces), dtype=bool)
+        seed_index = 0
         current_face = list_coincident_faces[0]
-        list_coincident_faces.remove(current_face)
+        alive[0] = False
         list_merged_faces = []
+        mins, maxs = _faces_bounds(list_coincident_faces)
         while True:
-            for face in list_coincident_faces:
+            # Only faces whose bounding box touches the current face's one can be merged with it or be inside it
+            current_bbox = current_face.bounding_box
+            current_min = np.array([current_bbox.xmin, current_bbox.ymin, current_bbox.zmin]) - 2e-6
+            current_max = np.array([current_bbox.xmax, current_bbox.ymax, current_bbox.zmax]) + 2e-6
+            candidates = alive & np.all((mins <= current_max) & (current_min <= maxs), axis=1)
+            for face_index in np.flatnonzero(candidates):
+                face = list_coincident_faces[face_index]
+                face_frame = face.surface3d.frame
                 if current_face.outer_contour3d.is_sharing_primitives_with(face.outer_contour3d):
                     merged_contours = current_face.outer_contour3d.merge_with(face.outer_contour3d)
-                    merged_contours2d = [
-                        contour.to_2d(face.surface3d.frame.origin, face.surface3d.frame.u, face.surface3d.frame.v)
-                        for contour in merged_contours
-                    ]
-                    merged_contours2d = sorted(merged_contours2d, key=lambda contour: contour.area(), reverse=True)
-                    if not merged_contours2d and current_face.outer_contour3d.is_superposing(face.outer_contour3d):
-                        merged_contours2d = [current_face.surface2d.outer_contour]
-                    new_outer_contour = merged_contours2d[0]
+                    # 3D contours are kept along their 2D projections, to be handed to the new face as they are
+                    merged_contours = sorted(
+                        ((contour.to_2d(face_frame.origin, face_frame.u, face_frame.v), contour)
+                         for contour in merged_contours),
+                        key=lambda contours: contours[0].area(), reverse=True)
+                    if not merged_contours and current_face.outer_contour3d.is_superposing(face.outer_contour3d):
+                        merged_contours = [(current_face.surface2d.outer_contour, None)]
+                    new_outer_contour, new_outer_contour3d = merged_contours[0]
+                    inner_contours3d = (current_face.inner_contours3d + [contour for _, contour in merged_contours[1:]]
+                                        + face.inner_contours3d)
                     inner_contours = [
-                        contour.to_2d(face.surface3d.frame.origin, face.surface3d.frame.u, face.surface3d.frame.v)
+                        contour.to_2d(face_frame.origin, face_frame.u, face_frame.v)
                         for contour in current_face.inner_contours3d
                     ]
-                    inner_contours += merged_contours2d[1:] + face.surface2d.inner_contours
+                    inner_contours += [contour for contour, _ in merged_contours[1:]] + face.surface2d.inner_contours
                     new_face = PlaneFace3D(face.surface3d, surfaces.Surface2D(new_outer_contour, inner_contours))
+                    # Avoids mapping back to 3D the contours that were just projected from 3D, when known
+                    primitives_mapping = _contours_primitives_mapping([new_outer_contour] + inner_contours,
+                                                                      [new_outer_contour3d] + inner_contours3d)
+                    if primitives_mapping is not None:
+                        new_face.outer_contour3d = new_outer_contour3d
+                        new_face.inner_contours3d = inner_contours3d
+                        new_face.primitives_mapping = primitives_mapping
                     current_face = new_face
-                    list_coincident_faces.remove(face)
+                    alive[face_index] = False
                     break
                 if current_face.face_inside(face):
-                    list_coincident_faces.remove(face)
+                    alive[face_index] = False
                     break
                 new_inner_contours = []
                 inner_contour_merged = False
@@ -1992,11 +2358,9 @@ class PlaneFace3D(Face3D):
                         new_inner_contours.extend(merged_inner_contours)
                         inner_contour_merged = True
                 if inner_contour_merged:
-                    list_coincident_faces.remove(face)
+                    alive[face_index] = False
                     inner_contours2d = [
-                        inner_contour.to_2d(
-                            face.surface3d.frame.origin, face.surface3d.frame.u, face.surface3d.frame.v
-                        )
+                        inner_contour.to_2d(face_frame.origin, face_frame.u, face_frame.v)
                         for inner_contour in new_inner_contours
                     ]
                     current_face = PlaneFace3D(
@@ -2004,11 +2368,13 @@ class PlaneFace3D(Face3D):
                     )
                     break
             else:
-                list_merged_faces.append(current_face)
-                if not list_coincident_faces:
+                list_merged_faces.append((seed_index, current_face))
+                alive_indices = np.flatnonzero(alive)
+                if not alive_indices.size:
                     break
-                current_face = list_coincident_faces[0]
-                list_coincident_faces.remove(current_face)
+                seed_index = int(alive_indices[0])
+                current_face = list_coincident_faces[seed_index]
+                alive[seed_index] = False
         return list_merged_faces
 
     def cut_by_coincident_face(self, face):
@@ -2024,6 +2390,9 @@ class PlaneFace3D(Face3D):
         if not self.surface3d.is_coincident(face.surface3d):
             raise ValueError("The faces are not coincident")
 
+        if not self.bounding_box.is_intersecting(face.bounding_box):
+            return [self]
+
         if self.face_inside(face):
             return self.divide_face([face.surface2d.outer_contour])
 
@@ -2038,12 +2407,13 @@ class PlaneFace3D(Face3D):
 
         contours = outer_contour_1.cut_by_wire(outer_contour_2)
 
+        inner_contours_rectangles = [inner_c.bounding_rectangle for inner_c in inner_contours]
         list_surfaces = []
         for contour in contours:
-            inners = []
-            for inner_c in inner_contours:
-                if contour.is_inside(inner_c):
-                    inners.append(inner_c)
+            # An inner contour can only be inside the contour if its bounding rectangle is inside the contour's one
+            contour_rectangle = contour.bounding_rectangle
+            inners = [inner_c for inner_c, inner_rectangle in zip(inner_contours, inner_contours_rectangles)
+                      if inner_rectangle.is_inside_b_rectangle(contour_rectangle, 1e-3) and contour.is_inside(inner_c)]
             list_surfaces.append(surfaces.Surface2D(contour, inners))
 
         return [self.__class__(self.surface3d, surface2d) for surface2d in list_surfaces]
@@ -2070,22 +2440,24 @@ class PlaneFace3D(Face3D):
         Update divided faces from project_faces.
 
         """
+        face2_2_outer_contour3d = face2_2.outer_contour3d
+        face2_2_bbox = face2_2_outer_contour3d.bounding_box
         for d_face in divided_faces:
-            if d_face.outer_contour3d.is_superposing(face2_2.outer_contour3d):
+            # face2_2's outer contour can only lie on d_face's one if it fits in its bounding box
+            if (face2_2_bbox.is_inside_bbox(d_face.outer_contour3d.bounding_box, 1e-3)
+                    and d_face.outer_contour3d.is_superposing(face2_2_outer_contour3d)):
                 if face2_2.surface2d.inner_contours:
                     divided_faces_d_face = []
                     for inner in face2_2.surface2d.inner_contours:
-
-                        if True in [
+                        inner_area, inner_center_of_mass = inner.area(), inner.center_of_mass()
+                        if any(
                             (
-                                (
-                                    (abs(inner_d.area() - inner.area()) < 1e-6)
-                                    and inner.center_of_mass().is_close(inner_d.center_of_mass())
-                                )
-                                or inner_d.is_inside(inner)
+                                (abs(inner_d.area() - inner_area) < 1e-6)
+                                and inner_center_of_mass.is_close(inner_d.center_of_mass())
                             )
+                            or inner_d.is_inside(inner)
                             for inner_d in d_face.surface2d.inner_contours
-                        ]:
+                        ):
                             divided_faces_d_face = ["", d_face]
                             continue
 
@@ -2117,7 +2489,11 @@ class PlaneFace3D(Face3D):
 
         used_faces, list_faces = {}, []
 
+        self_bounding_box = self.bounding_box
         for face2 in faces:
+            # Coplanar faces with disjoint bounding boxes can neither overlap nor be inside one another
+            if not self_bounding_box.is_intersecting(face2.bounding_box):
+                continue
             if self.surface3d.is_coincident(face2.surface3d):
                 contour1 = self.surface2d.outer_contour
                 contour2 = self.surface3d.contour3d_to_2d(face2.outer_contour3d)
@@ -2133,11 +2509,14 @@ class PlaneFace3D(Face3D):
                     used = []
                     for face1_1 in faces_1:
                         plane3d = face1_1.surface3d
-                        s2d = surfaces.Surface2D(
-                            outer_contour=plane3d.contour3d_to_2d(face2_2.outer_contour3d),
-                            inner_contours=[plane3d.contour3d_to_2d(contour) for contour in face2_2.inner_contours3d],
-                        )
-                        face2_2 = PlaneFace3D(surface3d=plane3d, surface2d=s2d)
+                        # Divided faces share self's plane: face2_2 is only projected again on a different plane
+                        if face2_2.surface3d is not plane3d:
+                            s2d = surfaces.Surface2D(
+                                outer_contour=plane3d.contour3d_to_2d(face2_2.outer_contour3d),
+                                inner_contours=[plane3d.contour3d_to_2d(contour)
+                                                for contour in face2_2.inner_contours3d],
+                            )
+                            face2_2 = PlaneFace3D(surface3d=plane3d, surface2d=s2d)
 
                         divided_faces = face1_1.cut_by_coincident_face(face2_2)
 
@@ -2161,7 +2540,7 @@ class PlaneFace3D(Face3D):
         Gets the lines that define a PlaneFace3D in a .geo file.
         """
 
-        return "Plane Surface(" + str(tag) + ") = {" + str(line_loop_tag)[1:-1] + "};"
+        return f"Plane Surface({tag}) = {{{', '.join(map(str, line_loop_tag))}}};"
 
     @classmethod
     def from_surface_rectangular_cut(cls, plane3d, x1: float, x2: float, y1: float, y2: float, name: str = ""):
@@ -2169,11 +2548,7 @@ class PlaneFace3D(Face3D):
         Cut a rectangular piece of the Plane3D object and return a PlaneFace3D object.
 
         """
-        point1 = design3d.Point2D(x1, y1)
-        point2 = design3d.Point2D(x2, y1)
-        point3 = design3d.Point2D(x2, y2)
-        point4 = design3d.Point2D(x1, y2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(x1, x2, y1, y2)
         surface = surfaces.Surface2D(outer_contour, [])
         return cls(plane3d, surface, name)
 
@@ -2213,6 +2588,36 @@ class PeriodicalFaceMixin:
 
         return self.surface2d.point_belongs(point2d, tol)
 
+    def _iter_points_belong(self, points3d: List[design3d.Point3D], tol: float = 1e-6):
+        """
+        Lazy version of points_belong, allowing callers to stop at the first point outside the face.
+
+        Parametric coordinates of the points lying on the surface are computed and brought back into the face's
+        periodic range all at once.
+        """
+        if not points3d:
+            return
+        on_surface = [self.surface3d.point_belongs(point, tol) for point in points3d]
+        surface_points = [[*point] for point, point_on_surface in zip(points3d, on_surface) if point_on_surface]
+        if not surface_points:
+            yield from on_surface
+            return
+        points2d = self.surface3d.points3d_to_2d(np.array(surface_points, dtype=np.float64))
+        u_min, u_max, v_min, v_max = self.surface2d.bounding_rectangle().bounds()
+        for index, periodicity, min_bound, max_bound in ((0, self.surface3d.x_periodicity, u_min, u_max),
+                                                         (1, self.surface3d.y_periodicity, v_min, v_max)):
+            if periodicity:
+                parameters = points2d[:, index]
+                parameters = np.where(parameters < min_bound - tol, parameters + periodicity, parameters)
+                points2d[:, index] = np.where(parameters > max_bound + tol, parameters - periodicity, parameters)
+        surface_point_index = 0
+        for point_on_surface in on_surface:
+            if not point_on_surface:
+                yield False
+                continue
+            yield self.surface2d.point_belongs(design3d.Point2D(*points2d[surface_point_index]), tol)
+            surface_point_index += 1
+
     def face_inside(self, face2, abs_tol: float = 1e-6):
         """
         Verifies if a face is inside another one.
@@ -2224,6 +2629,11 @@ class PeriodicalFaceMixin:
         return super().face_inside(face2, abs_tol)
 
 
+# Triangles of a single triangle mesh, shared by all Triangle3D triangulations: Mesh3D keeps int32 arrays as they are
+_TRIANGLE_MESH_TRIANGLES = np.array([[0, 1, 2]], dtype=np.int32)
+_TRIANGLE_MESH_TRIANGLES.flags.writeable = False
+
+
 class Triangle3D(PlaneFace3D):
     """
     Defines a Triangle3D class.
@@ -2260,7 +2670,8 @@ class Triangle3D(PlaneFace3D):
         self._inner_contours3d = None
         # self.bounding_box = self._bounding_box()
 
-        PlaneFace3D.__init__(self, self.surface3d, self.surface2d)
+        # Plane and boundary representation are computed lazily from the points, on first access
+        PlaneFace3D.__init__(self, surface3d=None, surface2d=None)
 
     def _data_hash(self):
         """
@@ -2272,15 +2683,27 @@ class Triangle3D(PlaneFace3D):
     def _data_eq(self, other_object):
         if other_object.__class__.__name__ != self.__class__.__name__:
             return False
-        self_set = {self.point1, self.point2, self.point3}
-        other_set = {other_object.point1, other_object.point2, other_object.point3}
-        if self_set != other_set:
-            return False
-        return True
+        # Same vertices in any order, compared in place instead of hashing them into sets
+        self_points = (self.point1, self.point2, self.point3)
+        other_points = (other_object.point1, other_object.point2, other_object.point3)
+        return (all(point in other_points for point in self_points)
+                and all(point in self_points for point in other_points))
+
+    @cached_property
+    def points_array(self):
+        """
+        Coordinates of the triangle vertices, as a contiguous (3, 3) array.
+
+        The array is computed once, points of the triangle should not be modified in place afterward.
+        """
+        return np.array([[*self.point1], [*self.point2], [*self.point3]], dtype=np.float64)
 
     def get_bounding_box(self):
         """General method to get the bounding box."""
-        return design3d.core.BoundingBox.from_points([self.point1, self.point2, self.point3])
+        point1, point2, point3 = self.point1, self.point2, self.point3
+        return design3d.core.BoundingBox(min(point1.x, point2.x, point3.x), max(point1.x, point2.x, point3.x),
+                                         min(point1.y, point2.y, point3.y), max(point1.y, point2.y, point3.y),
+                                         min(point1.z, point2.z, point3.z), max(point1.z, point2.z, point3.z))
 
     @property
     def surface3d(self):
@@ -2353,28 +2776,88 @@ class Triangle3D(PlaneFace3D):
         point3 = design3d.Point3D.dict_to_object(dict_["point3"])
         return cls(point1, point2, point3, dict_.get("name", ""))
 
+    def _plane_crossing_interval(self, plane3d: surfaces.Plane3D, line: design3d_curves.Line3D,
+                                 abs_tol: float = 1e-6):
+        """
+        Gets the interval of a line, lying in the given plane, along which the triangle crosses this plane.
+
+        :param plane3d: the plane crossed by the triangle.
+        :param line: a line contained in both the plane and the triangle's plane.
+        :param abs_tol: tolerance.
+        :return: the minimal and maximal abscissas of the interval along the line, and True if this interval is one
+            of the triangle edges. None if the triangle does not reach the plane.
+        """
+        frame = plane3d.frame
+        distances = [frame.w.dot(point - frame.origin) for point in self.points]
+        on_plane = [abs(distance) <= abs_tol for distance in distances]
+        number_points_on_plane = sum(on_plane)
+        if number_points_on_plane == 3:
+            return None
+        crossing_points = [point for point, point_on_plane in zip(self.points, on_plane) if point_on_plane]
+        for (point1, distance1, on_plane1), (point2, distance2, on_plane2) in combinations(
+                zip(self.points, distances, on_plane), 2):
+            if not on_plane1 and not on_plane2 and distance1 * distance2 < 0:
+                crossing_points.append(point1 + (point2 - point1) * (distance1 / (distance1 - distance2)))
+        if not crossing_points:
+            return None
+        abscissas = [line.abscissa(point) for point in crossing_points]
+        return min(abscissas), max(abscissas), number_points_on_plane == 2
+
+    def triangle_intersections(self, triangleface):
+        """
+        Gets the intersections between two Triangle3D.
+
+        Each triangle crosses the line shared by both planes along an interval, the triangles intersect on the overlap
+        of these two intervals. Overlaps lying on an edge of both triangles are not intersections.
+
+        :param triangleface: the other triangle face.
+        :return: list of intersecting wires.
+        """
+        plane_intersections = triangleface.surface3d.plane_intersections(self.surface3d)
+        if not plane_intersections:
+            return []
+        line = plane_intersections[0]
+        self_interval = self._plane_crossing_interval(triangleface.surface3d, line)
+        if not self_interval:
+            return []
+        other_interval = triangleface._plane_crossing_interval(self.surface3d, line)
+        if not other_interval:
+            return []
+        if self_interval[2] and other_interval[2]:
+            return []
+        abscissa1 = max(self_interval[0], other_interval[0])
+        abscissa2 = min(self_interval[1], other_interval[1])
+        if abscissa2 - abscissa1 <= 1e-6:
+            return []
+        return [design3d.wires.Wire3D([d3de.LineSegment3D(line.point_at_abscissa(abscissa1),
+                                                          line.point_at_abscissa(abscissa2))])]
+
     def area(self) -> float:
         """
         Calculates the area for the Triangle3D.
 
+        Half the norm of the cross product of two edges, which unlike Heron's formula stays accurate for flat
+        triangles.
+
         :return: area triangle.
         :rtype: float.
-
-        Formula explained here: https://www.triangle-calculator.com/?what=vc
         """
-        a = self.point1.point_distance(self.point2)
-        b = self.point2.point_distance(self.point3)
-        c = self.point3.point_distance(self.point1)
+        return 0.5 * (self.point2 - self.point1).cross(self.point3 - self.point1).norm()
 
-        semi_perimeter = (a + b + c) / 2
-
-        try:
-            # Area with Heron's formula
-            area = math.sqrt(semi_perimeter * (semi_perimeter - a) * (semi_perimeter - b) * (semi_perimeter - c))
-        except ValueError:
-            area = 0
+    @staticmethod
+    def triangles_areas(triangles_points: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Calculates the areas of several triangles at once.
 
-        return area
+        :param triangles_points: The triangles vertices coordinates, as an array of shape (n, 3, 3).
+        :type triangles_points: numpy.ndarray[np.float64]
+        :return: The n triangles areas.
+        :rtype: numpy.ndarray[np.float64]
+        """
+        triangles_points = np.asarray(triangles_points, dtype=np.float64)
+        cross_products = np.cross(triangles_points[:, 1] - triangles_points[:, 0],
+                                  triangles_points[:, 2] - triangles_points[:, 0])
+        return 0.5 * np.linalg.norm(cross_products, axis=1)
 
     def height(self):
         """
@@ -2403,7 +2886,7 @@ class Triangle3D(PlaneFace3D):
 
     def triangulation(self):
         """Computes the triangulation of the Triangle3D, basically returns itself."""
-        return d3dd.Mesh3D(np.array([self.point1, self.point2, self.point3]), np.array([[0, 1, 2]], dtype=np.int8))
+        return d3dd.Mesh3D(self.points_array.copy(), _TRIANGLE_MESH_TRIANGLES)
 
     def translation(self, offset: design3d.Vector3D):
         """
@@ -2437,93 +2920,88 @@ class Triangle3D(PlaneFace3D):
     @staticmethod
     def get_subdescription_points(new_points, resolution, max_length):
         """Gets sub-description points."""
-        vector = (new_points[0] - new_points[1]).unit_vector()
-        points_01 = [new_points[1]]
-        points_01 += [
-            new_points[1] + vector * min(k * resolution, max_length)
-            for k in range(1, int(max_length / resolution) + 2)
-        ]
-
-        vector, length_2_1 = (new_points[2] - new_points[1]).unit_vector(), new_points[2].point_distance(new_points[1])
-        points_in = []
-
-        for p0_1 in points_01:
-            point_on_2_1 = new_points[1] + vector * min(
-                points_01[0].point_distance(p0_1) * length_2_1 / max_length, length_2_1
-            )
-
-            length_2_0 = point_on_2_1.point_distance(p0_1)
-            nb_int = int(length_2_0 / resolution) + 2
-            if nb_int == 2:
-                points_in.append(point_on_2_1)
-            else:
-                vector_2_0 = (point_on_2_1 - p0_1).unit_vector()
-                step_in = length_2_0 / (nb_int - 1)
-                points_in += [
-                    p0_1 + vector_2_0 * min(i * step_in, length_2_0)
-                    for i in range(nb_int)
-                    if min(i * step_in, length_2_0) != 0
-                ]
-        points = points_01 + points_in
-        unique_points = list(set(points))
-        return unique_points
+        point0, point1, point2 = (np.array([*point]) for point in new_points)
+        vector_1_0 = point0 - point1
+        vector_1_0 /= np.linalg.norm(vector_1_0)
+        abscissas = np.minimum(np.arange(int(max_length / resolution) + 2) * resolution, max_length)
+        points_01 = point1 + abscissas[:, None] * vector_1_0
+
+        vector_1_2 = point2 - point1
+        length_2_1 = np.linalg.norm(vector_1_2)
+        vector_1_2 /= length_2_1
+        distances = np.linalg.norm(points_01 - point1, axis=1)
+        points_on_2_1 = point1 + np.minimum(distances * length_2_1 / max_length, length_2_1)[:, None] * vector_1_2
+
+        vectors_2_0 = points_on_2_1 - points_01
+        lengths_2_0 = np.linalg.norm(vectors_2_0, axis=1)
+        nb_int = (lengths_2_0 / resolution).astype(int) + 2
+        single = nb_int == 2
+        rows = np.flatnonzero(~single)
+        # Ragged sampling of each inner segment: row index and step index of every point
+        counts = nb_int[rows]
+        point_rows = np.repeat(rows, counts)
+        steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        lengths = lengths_2_0[point_rows]
+        abscissas_in = np.minimum(steps * (lengths / (nb_int[point_rows] - 1)), lengths)
+        nonzero = abscissas_in != 0
+        point_rows, abscissas_in = point_rows[nonzero], abscissas_in[nonzero]
+        directions = vectors_2_0[point_rows] / lengths_2_0[point_rows, None]
+        points_in = points_01[point_rows] + abscissas_in[:, None] * directions
+
+        points = np.concatenate((points_01, points_on_2_1[single], points_in))
+        return list(dict.fromkeys([design3d.Point3D(x, y, z) for x, y, z in zip(*points.T.tolist())]))
 
     def subdescription(self, resolution=0.01):
         """
         Returns a list of Point3D with resolution as max between Point3D.
         """
 
-        lengths = [
-            self.points[0].point_distance(self.points[1]),
-            self.points[1].point_distance(self.points[2]),
-            self.points[2].point_distance(self.points[0]),
+        squared_lengths = [
+            self.points[0].point_distance_squared(self.points[1]),
+            self.points[1].point_distance_squared(self.points[2]),
+            self.points[2].point_distance_squared(self.points[0]),
         ]
-        max_length = max(lengths)
+        max_squared_length = max(squared_lengths)
 
-        if max_length <= resolution:
+        if max_squared_length <= resolution * resolution:
             return self.points
 
-        pos_length_max = lengths.index(max_length)
+        pos_length_max = squared_lengths.index(max_squared_length)
         new_points = [self.points[-3 + pos_length_max + k] for k in range(3)]
-        return self.get_subdescription_points(new_points, resolution, max_length)
+        return self.get_subdescription_points(new_points, resolution, math.sqrt(max_squared_length))
 
     def subdescription_to_triangles(self, resolution=0.01):
         """
         Returns a list of Triangle3D with resolution as max length of sub triangles side.
 
+        Each pass splits, all at once, the sub triangles whose longest side is greater than resolution in two, by the
+        middle of this side. Sub triangles are stored as a (n, 3, 3) array of their vertices, children replacing their
+        parent in place.
         """
-
-        sub_triangles = [self.points]
-
+        sub_triangles = np.array([[[*point] for point in self.points]], dtype=np.float64)
         while True:
-            triangles = []
-            for subtri in sub_triangles:
-                lengths = [
-                    subtri[0].point_distance(subtri[1]),
-                    subtri[1].point_distance(subtri[2]),
-                    subtri[2].point_distance(subtri[0]),
-                ]
-                max_length = max(lengths)
-
-                if max_length > resolution:
-                    pos_length_max = lengths.index(max_length)
-                    pt_mid = (subtri[-3 + pos_length_max] + subtri[-3 + pos_length_max + 1]) / 2
-                    triangles.extend(
-                        [
-                            [subtri[-3 + pos_length_max], pt_mid, subtri[-3 + pos_length_max + 2]],
-                            [subtri[-3 + pos_length_max + 1], pt_mid, subtri[-3 + pos_length_max + 2]],
-                        ]
-                    )
-
-                else:
-                    triangles.append(subtri)
-
-            if len(sub_triangles) == len(triangles):
+            # Squared sides lengths, from vertex k to vertex k + 1
+            sides = sub_triangles - np.roll(sub_triangles, -1, axis=1)
+            squared_lengths = np.einsum('ijk,ijk->ij', sides, sides)
+            split = squared_lengths.max(axis=1) > resolution * resolution
+            if not split.any():
                 break
-
-            sub_triangles = triangles
-
-        return [Triangle3D(subtri[0], subtri[1], subtri[2]) for subtri in sub_triangles]
+            split_triangles = sub_triangles[split]
+            max_length_indexes = np.argmax(squared_lengths[split], axis=1)
+            rows = np.arange(len(split_triangles))
+            start = split_triangles[rows, max_length_indexes]
+            end = split_triangles[rows, (max_length_indexes + 1) % 3]
+            opposite = split_triangles[rows, (max_length_indexes + 2) % 3]
+            middle = (start + end) / 2
+            children = np.empty((len(sub_triangles), 2, 3, 3))
+            children[:, 0] = sub_triangles
+            children[split, 0] = np.stack([start, middle, opposite], axis=1)
+            children[split, 1] = np.stack([end, middle, opposite], axis=1)
+            keep = np.stack([np.ones(len(sub_triangles), dtype=bool), split], axis=1).ravel()
+            sub_triangles = children.reshape(-1, 3, 3)[keep]
+
+        return [Triangle3D(design3d.Point3D(*point1), design3d.Point3D(*point2), design3d.Point3D(*point3))
+                for point1, point2, point3 in sub_triangles.tolist()]
 
     def middle(self):
         """
@@ -2568,6 +3046,7 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
 
     min_x_density = 5
     min_y_density = 1
+    bounding_box_bounds_face = True
 
     def __init__(self, surface3d: surfaces.CylindricalSurface3D, surface2d: surfaces.Surface2D, name: str = ""):
 
@@ -2585,14 +3064,9 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
         """
         Specifies the number of subdivision when using triangulation by lines. (Old triangulation).
         """
-        theta_min, theta_max, zmin, zmax = self.surface2d.bounding_rectangle().bounds()
-        delta_theta = theta_max - theta_min
-        nlines = math.ceil(delta_theta * angle_resolution)
-        lines = []
-        for i in range(nlines):
-            theta = theta_min + (i + 1) / (nlines + 1) * delta_theta
-            lines.append(design3d_curves.Line2D(design3d.Point2D(theta, zmin), design3d.Point2D(theta, zmax)))
-        return lines, []
+        bounds = self.surface2d.bounding_rectangle().bounds()
+        nlines = math.ceil((bounds[1] - bounds[0]) * angle_resolution)
+        return parametric_isolines(bounds, nlines), []
 
     def parametrized_grid_size(self, angle_resolution, z_resolution):
         """
@@ -2635,7 +3109,7 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
 
         """
 
-        return "Surface(" + str(tag) + ") = {" + str(line_loop_tag)[1:-1] + "};"
+        return "Surface(" + str(tag) + ") = {" + ", ".join(map(str, line_loop_tag)) + "};"
 
     def arc_inside(self, arc: d3de.Arc3D):
         """
@@ -2650,6 +3124,24 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
             return False
         return self.arcellipse_inside(arc)
 
+    def _iter_points_belong(self, points3d: List[design3d.Point3D], tol: float = 1e-6):
+        """
+        Lazy version of points_belong, allowing callers to stop at the first point outside the face.
+
+        The cylinder and parametric bounds tests run in compiled code for all the points at once, only the candidate
+        points go through the 2D contour test.
+        """
+        if not points3d:
+            return
+        frame = self.surface3d.frame
+        local_points = (np.array([[*point] for point in points3d], dtype=np.float64) - [*frame.origin]) @ np.array(
+            [[*frame.u], [*frame.v], [*frame.w]]).T
+        u_min, u_max, v_min, v_max = self.surface2d.bounding_rectangle().bounds()
+        points2d, candidates = design3d.core_compiled.cylindrical_points_parametric_coordinates(
+            np.ascontiguousarray(local_points), self.radius, u_min, u_max, v_min, v_max, tol)
+        for point2d, candidate in zip(points2d, candidates):
+            yield bool(candidate) and self.surface2d.point_belongs(design3d.Point2D(*point2d), tol)
+
     def arcellipse_inside(self, arcellipse: d3de.ArcEllipse3D):
         """
         Verifies if ArcEllipse3D is inside a CylindricalFace3D.
@@ -2657,10 +3149,7 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
         :param arcellipse: ArcEllipse3D to be verified.
         :return: True if it is inside, False otherwise.
         """
-        for point in [arcellipse.start, arcellipse.middle_point(), arcellipse.end]:
-            if not self.point_belongs(point):
-                return False
-        return True
+        return all(self._iter_points_belong([arcellipse.start, arcellipse.middle_point(), arcellipse.end]))
 
     def planeface_intersections(self, planeface: PlaneFace3D):
         """
@@ -2683,11 +3172,7 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
         if theta1 == theta2:
             theta2 += design3d.TWO_PI
 
-        point1 = design3d.Point2D(theta1, param_z1)
-        point2 = design3d.Point2D(theta2, param_z1)
-        point3 = design3d.Point2D(theta2, param_z2)
-        point4 = design3d.Point2D(theta1, param_z2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(theta1, theta2, param_z1, param_z2)
         surface2d = surfaces.Surface2D(outer_contour, [])
         return cls(cylindrical_surface, surface2d, name)
 
@@ -2696,9 +3181,9 @@ class CylindricalFace3D(PeriodicalFaceMixin, Face3D):
         Returns the faces' neutral fiber.
         """
         _, _, zmin, zmax = self.surface2d.outer_contour.bounding_rectangle.bounds()
-
-        point1 = self.surface3d.frame.origin + self.surface3d.frame.w * zmin
-        point2 = self.surface3d.frame.origin + self.surface3d.frame.w * zmax
+        frame_array = self.surface3d.frame_array
+        points = frame_array[0] + np.outer([zmin, zmax], frame_array[3])
+        point1, point2 = (design3d.Point3D(*point) for point in points.tolist())
         return design3d.wires.Wire3D([d3de.LineSegment3D(point1, point2)])
 
 
@@ -2769,35 +3254,22 @@ class ToroidalFace3D(PeriodicalFaceMixin, Face3D):
         """
         Specifies the number of subdivision when using triangulation by lines. (Old triangulation).
         """
-        theta_min, theta_max, phi_min, phi_max = self.surface2d.bounding_rectangle().bounds()
-
-        delta_theta = theta_max - theta_min
-        nlines_x = int(delta_theta * angle_resolution)
-        lines_x = []
-        for i in range(nlines_x):
-            theta = theta_min + (i + 1) / (nlines_x + 1) * delta_theta
-            lines_x.append(design3d_curves.Line2D(design3d.Point2D(theta, phi_min), design3d.Point2D(theta, phi_max)))
-        delta_phi = phi_max - phi_min
-        nlines_y = int(delta_phi * angle_resolution)
-        lines_y = []
-        for i in range(nlines_y):
-            phi = phi_min + (i + 1) / (nlines_y + 1) * delta_phi
-            lines_y.append(design3d_curves.Line2D(design3d.Point2D(theta_min, phi), design3d.Point2D(theta_max, phi)))
-        return lines_x, lines_y
+        bounds = theta_min, theta_max, phi_min, phi_max = self.surface2d.bounding_rectangle().bounds()
+        nlines_x = int((theta_max - theta_min) * angle_resolution)
+        nlines_y = int((phi_max - phi_min) * angle_resolution)
+        return parametric_isolines(bounds, nlines_x), parametric_isolines(bounds, nlines_y, constant_u=False)
 
     def grid_size(self):
         """
         Specifies an adapted size of the discretization grid used in face triangulation.
         """
-        theta_angle_resolution = 10
-        phi_angle_resolution = 20
         theta_min, theta_max, phi_min, phi_max = self.surface2d.bounding_rectangle().bounds()
 
         delta_theta = theta_max - theta_min
-        number_points_x = math.ceil(delta_theta / math.radians(theta_angle_resolution))
+        number_points_x = math.ceil(delta_theta / _TEN_DEGREES)
 
         delta_phi = phi_max - phi_min
-        number_points_y = math.ceil(delta_phi / math.radians(phi_angle_resolution))
+        number_points_y = math.ceil(delta_phi / _TWENTY_DEGREES)
 
         return number_points_x, number_points_y
 
@@ -2823,20 +3295,12 @@ class ToroidalFace3D(PeriodicalFaceMixin, Face3D):
         :return: A ToroidalFace3D object created by cutting the ToroidalSurface3D object.
         :rtype: ToroidalFace3D
         """
-        if phi1 == phi2:
-            phi2 += design3d.TWO_PI
-        elif phi2 < phi1:
+        if phi2 <= phi1:
             phi2 += design3d.TWO_PI
-        if theta1 == theta2:
-            theta2 += design3d.TWO_PI
-        elif theta2 < theta1:
+        if theta2 <= theta1:
             theta2 += design3d.TWO_PI
 
-        point1 = design3d.Point2D(theta1, phi1)
-        point2 = design3d.Point2D(theta2, phi1)
-        point3 = design3d.Point2D(theta2, phi2)
-        point4 = design3d.Point2D(theta1, phi2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(theta1, theta2, phi1, phi2)
         return cls(toroidal_surface3d, surfaces.Surface2D(outer_contour, []), name)
 
     def neutral_fiber(self):
@@ -2845,12 +3309,11 @@ class ToroidalFace3D(PeriodicalFaceMixin, Face3D):
         """
         theta_min, theta_max, _, _ = self.surface2d.outer_contour.bounding_rectangle.bounds()
         circle = design3d_curves.Circle3D(self.surface3d.frame, self.surface3d.tore_radius)
-        point1, point2 = [
-            circle.center
-            + circle.radius * math.cos(theta) * circle.frame.u
-            + circle.radius * math.sin(theta) * circle.frame.v
-            for theta in [theta_min, theta_max]
-        ]
+        thetas = np.array([theta_min, theta_max])
+        frame_array = self.surface3d.frame_array
+        points = (circle.radius * np.column_stack((np.cos(thetas), np.sin(thetas))) @ frame_array[1:3]
+                  + frame_array[0])
+        point1, point2 = (design3d.Point3D(*point) for point in points.tolist())
         return design3d.wires.Wire3D([circle.trim(point1, point2)])
 
     def planeface_intersections(self, planeface: PlaneFace3D):
@@ -2876,6 +3339,8 @@ class ConicalFace3D(PeriodicalFaceMixin, Face3D):
 
     """
 
+    bounding_box_bounds_face = True
+
     def __init__(self, surface3d: surfaces.ConicalSurface3D, surface2d: surfaces.Surface2D, name: str = ""):
         Face3D.__init__(self, surface3d=surface3d, surface2d=surface2d, name=name)
         self._bbox = None
@@ -2884,13 +3349,9 @@ class ConicalFace3D(PeriodicalFaceMixin, Face3D):
         """
         Specifies the number of subdivision when using triangulation by lines. (Old triangulation).
         """
-        theta_min, theta_max, zmin, zmax = self.surface2d.bounding_rectangle().bounds()
-        delta_theta = theta_max - theta_min
-        nlines = int(delta_theta * angle_resolution)
-        lines_x = []
-        for i in range(nlines):
-            theta = theta_min + (i + 1) / (nlines + 1) * delta_theta
-            lines_x.append(design3d_curves.Line2D(design3d.Point2D(theta, zmin), design3d.Point2D(theta, zmax)))
+        bounds = theta_min, theta_max, zmin, zmax = self.surface2d.bounding_rectangle().bounds()
+        nlines = int((theta_max - theta_min) * angle_resolution)
+        lines_x = parametric_isolines(bounds, nlines)
 
         if zmin < 1e-9:
             delta_z = zmax - zmin
@@ -2916,11 +3377,7 @@ class ConicalFace3D(PeriodicalFaceMixin, Face3D):
         if theta1 == theta2:
             theta2 += design3d.TWO_PI
 
-        point1 = design3d.Point2D(theta1, z1)
-        point2 = design3d.Point2D(theta2, z1)
-        point3 = design3d.Point2D(theta2, z2)
-        point4 = design3d.Point2D(theta1, z2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(theta1, theta2, z1, z2)
         return cls(conical_surface3d, surfaces.Surface2D(outer_contour, []), name)
 
     @classmethod
@@ -2956,9 +3413,9 @@ class ConicalFace3D(PeriodicalFaceMixin, Face3D):
         Returns the faces' neutral fiber.
         """
         _, _, zmin, zmax = self.surface2d.outer_contour.bounding_rectangle.bounds()
-
-        point1 = self.surface3d.frame.origin + self.surface3d.frame.w * zmin
-        point2 = self.surface3d.frame.origin + self.surface3d.frame.w * zmax
+        frame_array = self.surface3d.frame_array
+        points = frame_array[0] + np.outer([zmin, zmax], frame_array[3])
+        point1, point2 = (design3d.Point3D(*point) for point in points.tolist())
         return design3d.wires.Wire3D([d3de.LineSegment3D(point1, point2)])
 
     def circle_inside(self, circle: design3d_curves.Circle3D):
@@ -2970,11 +3427,7 @@ class ConicalFace3D(PeriodicalFaceMixin, Face3D):
         """
         if not math.isclose(abs(circle.frame.w.dot(self.surface3d.frame.w)), 1.0, abs_tol=1e-6):
             return False
-        points = circle.discretization_points(number_points=10)
-        for point in points:
-            if not self.point_belongs(point):
-                return False
-        return True
+        return all(self._iter_points_belong(circle.discretization_points(number_points=10)))
 
 
 class SphericalFace3D(PeriodicalFaceMixin, Face3D):
@@ -3000,21 +3453,10 @@ class SphericalFace3D(PeriodicalFaceMixin, Face3D):
         """
         Specifies the number of subdivision when using triangulation by lines. (Old triangulation).
         """
-        theta_min, theta_max, phi_min, phi_max = self.surface2d.bounding_rectangle().bounds()
-
-        delta_theta = theta_max - theta_min
-        nlines_x = int(delta_theta * angle_resolution)
-        lines_x = []
-        for i in range(nlines_x):
-            theta = theta_min + (i + 1) / (nlines_x + 1) * delta_theta
-            lines_x.append(design3d_curves.Line2D(design3d.Point2D(theta, phi_min), design3d.Point2D(theta, phi_max)))
-        delta_phi = phi_max - phi_min
-        nlines_y = int(delta_phi * angle_resolution)
-        lines_y = []
-        for i in range(nlines_y):
-            phi = phi_min + (i + 1) / (nlines_y + 1) * delta_phi
-            lines_y.append(design3d_curves.Line2D(design3d.Point2D(theta_min, phi), design3d.Point2D(theta_max, phi)))
-        return lines_x, lines_y
+        bounds = theta_min, theta_max, phi_min, phi_max = self.surface2d.bounding_rectangle().bounds()
+        nlines_x = int((theta_max - theta_min) * angle_resolution)
+        nlines_y = int((phi_max - phi_min) * angle_resolution)
+        return parametric_isolines(bounds, nlines_x), parametric_isolines(bounds, nlines_y, constant_u=False)
 
     def grid_size(self):
         """
@@ -3032,22 +3474,14 @@ class SphericalFace3D(PeriodicalFaceMixin, Face3D):
             outer_polygon, inner_polygons = polygon_data
         else:
             outer_polygon, inner_polygons = self.get_face_polygons()
-        u, v, u_size, _ = self._get_grid_axis(outer_polygon, grid_size)
-        if not u or not v:
+        u, v, _, _ = self._get_grid_axis(outer_polygon, grid_size)
+        if u.size == 0 or v.size == 0:
             return []
         if inner_polygons:
-            points = []
-            points_indexes_map = {}
-            for j, v_j in enumerate(v):
-                for i in range(u_size):
-                    if (j % 2 == 0 and i % 2 == 0) or (j % 2 != 0 and i % 2 != 0):
-                        points.append((u[i], v_j))
-                        points_indexes_map[(i, j)] = len(points) - 1
-            points = np.array(points, dtype=np.float64)
+            points, points_indexes_map = checkerboard_grid_points(u, v, return_points_indexes_map=True)
             points = update_face_grid_points_with_inner_polygons(inner_polygons, [points, u, v, points_indexes_map])
         else:
-            points = np.array([(u[i], v_j) for j, v_j in enumerate(v) for i in range(u_size) if
-                              (j % 2 == 0 and i % 2 == 0) or (j % 2 != 0 and i % 2 != 0)], dtype=np.float64)
+            points = checkerboard_grid_points(u, v)
 
         points = self._update_grid_points_with_outer_polygon(outer_polygon, points)
 
@@ -3063,8 +3497,8 @@ class SphericalFace3D(PeriodicalFaceMixin, Face3D):
         u_size = math.ceil((theta_max - theta_min) / step_u)
         v_size = math.ceil((phi_max - phi_min) / step_v)
         v_start = phi_min + step_v
-        u = [theta_min + step_u * i for i in range(u_size)]
-        v = [v_start + j * step_v for j in range(v_size - 1)]
+        u = theta_min + step_u * np.arange(u_size)
+        v = v_start + step_v * np.arange(v_size - 1)
         return u, v, u_size, v_size
 
     @classmethod
@@ -3081,20 +3515,12 @@ class SphericalFace3D(PeriodicalFaceMixin, Face3D):
         Cut a rectangular piece of the SphericalSurface3D object and return a SphericalFace3D object.
 
         """
-        if phi1 == phi2:
-            phi2 += design3d.TWO_PI
-        elif phi2 < phi1:
+        if phi2 <= phi1:
             phi2 += design3d.TWO_PI
-        if theta1 == theta2:
-            theta2 += design3d.TWO_PI
-        elif theta2 < theta1:
+        if theta2 <= theta1:
             theta2 += design3d.TWO_PI
 
-        point1 = design3d.Point2D(theta1, phi1)
-        point2 = design3d.Point2D(theta2, phi1)
-        point3 = design3d.Point2D(theta2, phi2)
-        point4 = design3d.Point2D(theta1, phi2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(theta1, theta2, phi1, phi2)
         return cls(spherical_surface, surfaces.Surface2D(outer_contour, []), name=name)
 
     @classmethod
@@ -3113,11 +3539,8 @@ class SphericalFace3D(PeriodicalFaceMixin, Face3D):
         :rtype: SphericalFace3D
         """
         inner_contours = []
-        point1 = design3d.Point2D(-math.pi, -0.5 * math.pi)
-        point2 = design3d.Point2D(math.pi, -0.5 * math.pi)
-        point3 = design3d.Point2D(math.pi, 0.5 * math.pi)
-        point4 = design3d.Point2D(-math.pi, 0.5 * math.pi)
-        surface_rectangular_cut = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        surface_rectangular_cut = design3d.wires.Contour2D.from_bounding_rectangle(-math.pi, math.pi,
+                                                                                   -0.5 * math.pi, 0.5 * math.pi)
         contours2d = [surface3d.contour3d_to_2d(contour) for contour in contours]
         point2d = surface3d.point3d_to_2d(point)
         for contour in contours2d:
@@ -3168,14 +3591,9 @@ class RuledFace3D(Face3D):
         """
         Specifies the number of subdivision when using triangulation by lines. (Old triangulation).
         """
-        xmin, xmax, ymin, ymax = self.surface2d.bounding_rectangle().bounds()
-        delta_x = xmax - xmin
-        nlines = int(delta_x * angle_resolution)
-        lines = []
-        for i in range(nlines):
-            x = xmin + (i + 1) / (nlines + 1) * delta_x
-            lines.append(design3d_curves.Line2D(design3d.Point2D(x, ymin), design3d.Point2D(x, ymax)))
-        return lines, []
+        bounds = self.surface2d.bounding_rectangle().bounds()
+        nlines = int((bounds[1] - bounds[0]) * angle_resolution)
+        return parametric_isolines(bounds, nlines), []
 
     def grid_size(self):
         """
@@ -3198,11 +3616,7 @@ class RuledFace3D(Face3D):
         Cut a rectangular piece of the RuledSurface3D object and return a RuledFace3D object.
 
         """
-        point1 = design3d.Point2D(x1, y1)
-        point2 = design3d.Point2D(x2, y1)
-        point3 = design3d.Point2D(x2, y2)
-        point4 = design3d.Point2D(x1, y2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(x1, x2, y1, y2)
         surface2d = surfaces.Surface2D(outer_contour, [])
         return cls(ruled_surface3d, surface2d, name)
 
@@ -3247,11 +3661,7 @@ class ExtrusionFace3D(Face3D):
         """
         if not x2:
             x2 = extrusion_surface3d.edge.length()
-        p1 = design3d.Point2D(x1, y1)
-        p2 = design3d.Point2D(x2, y1)
-        p3 = design3d.Point2D(x2, y2)
-        p4 = design3d.Point2D(x1, y2)
-        outer_contour = design3d.wires.Contour2D.from_points([p1, p2, p3, p4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(x1, x2, y1, y2)
         surface2d = surfaces.Surface2D(outer_contour, [])
         return cls(extrusion_surface3d, surface2d, name)
 
@@ -3297,22 +3707,14 @@ class RevolutionFace3D(Face3D):
             outer_polygon, inner_polygons = polygon_data
         else:
             outer_polygon, inner_polygons, _ = self.get_face_polygons()
-        u, v, u_size, _ = self._get_grid_axis(outer_polygon, grid_size)
-        if not u or not v:
+        u, v, _, _ = self._get_grid_axis(outer_polygon, grid_size)
+        if u.size == 0 or v.size == 0:
             return []
         if inner_polygons:
-            points = []
-            points_indexes_map = {}
-            for j, v_j in enumerate(v):
-                for i in range(u_size):
-                    if (j % 2 == 0 and i % 2 == 0) or (j % 2 != 0 and i % 2 != 0):
-                        points.append((u[i], v_j))
-                        points_indexes_map[(i, j)] = len(points) - 1
-            points = np.array(points, dtype=np.float64)
+            points, points_indexes_map = checkerboard_grid_points(u, v, return_points_indexes_map=True)
             points = update_face_grid_points_with_inner_polygons(inner_polygons, [points, u, v, points_indexes_map])
         else:
-            points = np.array([(u[i], v_j) for j, v_j in enumerate(v) for i in range(u_size) if
-                              (j % 2 == 0 and i % 2 == 0) or (j % 2 != 0 and i % 2 != 0)], dtype=np.float64)
+            points = checkerboard_grid_points(u, v)
 
         points = self._update_grid_points_with_outer_polygon(outer_polygon, points)
 
@@ -3327,8 +3729,8 @@ class RevolutionFace3D(Face3D):
         number_points_u = math.ceil(delta_x / math.radians(angle_resolution))
         u_step = (u_max - u_min) / (number_points_u - 1) if number_points_u > 1 else (u_max - u_min)
         v_step = (v_max - v_min) / (number_points_v - 1) if number_points_v > 1 else (v_max - v_min)
-        u = [u_min + i * u_step for i in range(number_points_u)]
-        v = [v_min + i * v_step for i in range(number_points_v)]
+        u = u_min + u_step * np.arange(number_points_u)
+        v = v_min + v_step * np.arange(number_points_v)
 
         return u, v, number_points_u, number_points_v
 
@@ -3340,11 +3742,7 @@ class RevolutionFace3D(Face3D):
         Cut a rectangular piece of the RevolutionSurface3D object and return a RevolutionFace3D object.
 
         """
-        point1 = design3d.Point2D(x1, y1)
-        point2 = design3d.Point2D(x2, y1)
-        point3 = design3d.Point2D(x2, y2)
-        point4 = design3d.Point2D(x1, y2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(x1, x2, y1, y2)
         surface2d = surfaces.Surface2D(outer_contour, [])
         return cls(revolution_surface3d, surface2d, name)
 
@@ -3360,21 +3758,23 @@ class RevolutionFace3D(Face3D):
             scale_factor = 10 ** math.floor(
                 math.log10((delta_x/(number_points_x - 1))/(delta_y/(number_points_y - 1))))
 
-        def get_polygon_points(primitives):
-            points = []
-            for edge in primitives:
-                edge3d = primitives_mapping.get(edge)
-                number_points = self.get_edge_discretization_size(edge3d)
-                edge_points = edge.discretization_points(number_points=number_points)
-                if scale_factor != 1:
-                    for point in edge_points:
-                        point.y *= scale_factor
-                points.extend(edge_points[:-1])
-            return points
-
-        outer_polygon = design3d.wires.ClosedPolygon2D(get_polygon_points(self.surface2d.outer_contour.primitives))
-        inner_polygons = [design3d.wires.ClosedPolygon2D(get_polygon_points(inner_contour.primitives))
-                          for inner_contour in self.surface2d.inner_contours]
+        def get_polygon(primitives):
+            numbers_points = [self.get_edge_discretization_size(primitives_mapping.get(edge))
+                              for edge in primitives]
+            points = [point for edge_points in d3de.batch_discretization_points(primitives, numbers_points)
+                      for point in edge_points[:-1]]
+            if scale_factor == 1:
+                return design3d.wires.ClosedPolygon2D(points)
+            # All the points are scaled at once, new points are built instead of modifying the discretized ones
+            points_array = np.array([[*point] for point in points], dtype=np.float64).reshape(-1, 2)
+            points_array[:, 1] *= scale_factor
+            polygon = design3d.wires.ClosedPolygon2D([design3d.Point2D(x, y) for x, y in points_array.tolist()])
+            # The scaled array already holds the polygon coordinates, no need to gather them back from its points
+            polygon.points_array = points_array
+            return polygon
+
+        outer_polygon = get_polygon(self.surface2d.outer_contour.primitives)
+        inner_polygons = [get_polygon(inner_contour.primitives) for inner_contour in self.surface2d.inner_contours]
         return outer_polygon, inner_polygons, scale_factor
 
     def triangulation(self):
@@ -3418,11 +3818,14 @@ class BSplineFace3D(Face3D):
             else:
                 number_points_x, number_points_y = 3, 5
             points_grid = self.grid_points([number_points_x, number_points_y])
-            points3d = [self.surface3d.point2d_to_3d(point) for point in points_grid]
+            points3d = np.empty((0, 3))
+            if points_grid:
+                points3d = self.surface3d.parametric_points_to_3d(
+                    np.array([[point.x, point.y] for point in points_grid], dtype=np.float64))
         except ZeroDivisionError:
-            points3d = []
+            points3d = np.empty((0, 3))
 
-        if not points3d:
+        if points3d.size == 0:
             return self.outer_contour3d.bounding_box
 
         return design3d.core.BoundingBox.from_bounding_boxes(
@@ -3468,14 +3871,11 @@ class BSplineFace3D(Face3D):
         return number_points_x, number_points_y
 
     @staticmethod
-    def _update_grid_points_with_outer_polygon(outer_polygon, grid_points):
+    def _update_grid_points_with_outer_polygon(outer_polygon, grid_points, include_edge_points: bool = True,
+                                               tol: float = 1e-6):
         """Helper function to grid_points."""
-        # Find the indices where points_in_polygon is True (i.e., points inside the polygon)
-        indices = np.where(outer_polygon.points_in_polygon(grid_points, include_edge_points=True) == 0)[0]
-        grid_points = np.delete(grid_points, indices, axis=0)
-        polygon_points = set(outer_polygon.points)
-        points = [design3d.Point2D(*point) for point in grid_points if design3d.Point2D(*point) not in polygon_points]
-        return points
+        return Face3D._update_grid_points_with_outer_polygon(outer_polygon, grid_points,
+                                                             include_edge_points=include_edge_points, tol=tol)
 
     def pair_with(self, other_bspline_face3d):
         """
@@ -3796,11 +4196,7 @@ class BSplineFace3D(Face3D):
         Cut a rectangular piece of the BSplineSurface3D object and return a BSplineFace3D object.
 
         """
-        point1 = design3d.Point2D(u1, v1)
-        point2 = design3d.Point2D(u2, v1)
-        point3 = design3d.Point2D(u2, v2)
-        point4 = design3d.Point2D(u1, v2)
-        outer_contour = design3d.wires.Contour2D.from_points([point1, point2, point3, point4])
+        outer_contour = design3d.wires.Contour2D.from_bounding_rectangle(u1, u2, v1, v2)
         surface = surfaces.Surface2D(outer_contour, [])
         return BSplineFace3D(bspline_surface3d, surface, name)
 
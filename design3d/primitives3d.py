@@ -331,7 +331,15 @@ class Block(shells.ClosedShell3D):
         Cuts Block by orthogonal plane, and return a plane face at this plane, bounded by the block volume.
 
         """
-        bouding_box = self.bounding_box
+        return self.cut_bounding_box_by_orthogonal_plane(self.bounding_box, plane_3d)
+
+    @staticmethod
+    def cut_bounding_box_by_orthogonal_plane(bouding_box: design3d.core.BoundingBox, plane_3d: surfaces.Plane3D):
+        """
+        Cuts a bounding box by orthogonal plane, and return a plane face at this plane, bounded by the box volume.
+
+        Gives the same face as cut_by_orthogonal_plane on the block of this bounding box, without building the block.
+        """
         if plane_3d.frame.w.dot(design3d.Vector3D(1, 0, 0)) == 0:
             pass
         elif plane_3d.frame.w.dot(design3d.Vector3D(0, 1, 0)) == 0:
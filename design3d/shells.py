@@ -10,6 +10,7 @@ import networkx as nx
 import numpy as np
 import pyfqmr
 from numpy.typing import NDArray
+from scipy.spatial import cKDTree
 from trimesh import Trimesh
 
 import design3d.core
@@ -17,7 +18,7 @@ import design3d.core_compiled
 import design3d.faces
 import design3d.geometry
 from design3d import curves, display, edges, surfaces, wires
-from design3d.core import edge_in_list, get_edge_index_in_list, get_point_index_in_list, point_in_list
+from design3d.core import EdgeHashSet, get_edge_index_in_list, get_point_index_in_list, point_in_list
 from design3d.utils.step_writer import geometric_context_writer, product_writer, step_ids_to_str
 
 # pylint: disable=unused-argument
@@ -108,6 +109,7 @@ class Shell3D(design3d.core.CompositePrimitive3D):
         self._vertices_graph = None
         self._vertices_points = None
         self._shell_octree_decomposition = None
+        self._shell_decomposition_points = None
 
         design3d.core.CompositePrimitive3D.__init__(self,
                                                    primitives=faces, color=color, alpha=alpha,
@@ -559,14 +561,8 @@ class Shell3D(design3d.core.CompositePrimitive3D):
         :param plane_3d: plane 3d o cut shell.
         :return: return a list of faces containing the shell's sections at the plane 3d given.
         """
-        frame_block = self.bounding_box.to_frame()
-        frame_block.u = 1.1 * frame_block.u
-        frame_block.v = 1.1 * frame_block.v
-        frame_block.w = 1.1 * frame_block.w
-        block = design3d.primitives3d.Block(frame_block,
-                                           color=(0.1, 0.2, 0.2),
-                                           alpha=0.6)
-        face_3d = block.cut_by_orthogonal_plane(plane_3d)
+        face_3d = design3d.primitives3d.Block.cut_bounding_box_by_orthogonal_plane(
+            self.bounding_box.scale(1.1), plane_3d)
         intersection_primitives = []
         for face in self.faces:
             intersection_wires = face.face_intersections(face_3d)
@@ -647,18 +643,23 @@ class Shell3D(design3d.core.CompositePrimitive3D):
 
         return point1_min
 
-    @staticmethod
-    def _minimum_distance_helper_points_sets(shell_decomposition):
+    def _get_shell_decomposition_points(self):
         """
-        Gets a set of points representing the shell, some kink of a cloud of points.
+        Gets a cloud of points representing each set of the shell decomposition, stacked in a single array.
 
+        :return: the list of the decomposition's sets, a (n, 3) array of their points, and the index of the first
+            point of each set in this array.
         """
-        list_set_points = [{point for face in faces
-                            for point in face.outer_contour3d.discretization_points(number_points=10)} for _, faces in
-                           shell_decomposition.items()]
-        list_set_points = [np.array([(point[0], point[1], point[2]) for point in sets_points1])
-                           for sets_points1 in list_set_points]
-        return list_set_points
+        shell_decomposition = self.shell_decomposition()
+        if not self._shell_decomposition_points or self._shell_decomposition_points[0] is not shell_decomposition:
+            decomposition_sets = list(shell_decomposition.values())
+            list_set_points = [[[*point] for point in {point for face in faces for point in
+                                                       face.outer_contour3d.discretization_points(number_points=10)}]
+                               for faces in decomposition_sets]
+            offsets = np.cumsum([0] + [len(set_points) for set_points in list_set_points[:-1]])
+            points = np.array([point for set_points in list_set_points for point in set_points], dtype=np.float64)
+            self._shell_decomposition_points = (shell_decomposition, decomposition_sets, points, offsets)
+        return self._shell_decomposition_points[1:]
 
     def get_minimum_distance_nearby_faces(self, other_shell):
         """
@@ -668,21 +669,13 @@ class Shell3D(design3d.core.CompositePrimitive3D):
         :return: A list faces of self, with the closest faces to shell2, and another faces list of shell2,
         with those closest to self.
         """
-        shell_decomposition1 = self.shell_decomposition()
-        shell_decomposition2 = other_shell.shell_decomposition()
-        list_set_points1 = self._minimum_distance_helper_points_sets(shell_decomposition1)
-        list_set_points2 = self._minimum_distance_helper_points_sets(shell_decomposition2)
-        minimum_distance = math.inf
-        index1, index2 = None, None
-        for sets_points1, sets_points2 in product(list_set_points1, list_set_points2):
-            distances = np.linalg.norm(sets_points2[:, np.newaxis] - sets_points1, axis=2)
-            sets_min_dist = np.min(distances)
-            if sets_min_dist < minimum_distance:
-                minimum_distance = sets_min_dist
-                index1 = next((i for i, x in enumerate(list_set_points1) if np.array_equal(x, sets_points1)), -1)
-                index2 = next((i for i, x in enumerate(list_set_points2) if np.array_equal(x, sets_points2)), -1)
-        faces1 = list(shell_decomposition1.values())[index1]
-        faces2 = list(shell_decomposition2.values())[index2]
+        decomposition_sets1, points1, offsets1 = self._get_shell_decomposition_points()
+        decomposition_sets2, points2, offsets2 = other_shell._get_shell_decomposition_points()
+        distances, closest_indexes2 = cKDTree(points2).query(points1, k=1)
+        point_index1 = int(np.argmin(distances))
+        point_index2 = closest_indexes2[point_index1]
+        faces1 = decomposition_sets1[np.searchsorted(offsets1, point_index1, side='right') - 1]
+        faces2 = decomposition_sets2[np.searchsorted(offsets2, point_index2, side='right') - 1]
         return faces1, faces2
 
     def minimum_distance(self, other_shell, return_points=False):
@@ -867,9 +860,15 @@ class Shell3D(design3d.core.CompositePrimitive3D):
 
         list_faces = []
         initial_faces = self.faces[:]
+        faces2 = shell.faces
+        faces2_bounds = np.array([[bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax]
+                                  for bbox in (face.bounding_box for face in faces2)], dtype=np.float64)
 
         for face1 in initial_faces:
-            list_faces.extend(face1.project_faces(shell.faces))
+            # Only the faces whose bounding boxes intersect face1's can be projected on it, kept in shell order
+            faces2_candidates = [faces2[index] for index in
+                                 np.flatnonzero(face1.bounding_box.boxes_intersecting(faces2_bounds))]
+            list_faces.extend(face1.project_faces(faces2_candidates))
 
         return self.__class__(list_faces)
 
@@ -886,6 +885,7 @@ class Shell3D(design3d.core.CompositePrimitive3D):
         """
 
         primitives = []
+        primitives_set = EdgeHashSet()
         points = []
         for face in self.faces:
             for contour in list(chain(*[[face.outer_contour3d], face.inner_contours3d])):
@@ -897,9 +897,9 @@ class Shell3D(design3d.core.CompositePrimitive3D):
                     pass
                 else:
                     for primitive in contour.primitives:
-                        if (not edge_in_list(primitive, primitives)
-                                and not edge_in_list(primitive.reverse(), primitives)):
+                        if primitive not in primitives_set:
                             primitives.append(primitive)
+                            primitives_set.add(primitive)
 
         indices_check = len(primitives) * [None]
 
@@ -1162,15 +1162,16 @@ class ClosedShell3D(Shell3D):
 
     def get_ray_casting_line_segment(self, point3d):
         """Gets the best ray for performing ray casting algorithm."""
-        boxes_size = [self.bounding_box.size[0] / 2, self.bounding_box.size[1] / 2, self.bounding_box.size[2] / 2]
+        bbox = self.bounding_box
+        boxes_size = [size / 2 for size in bbox.size]
         xyz = [design3d.Vector3D(boxes_size[0], 0, 0), design3d.Vector3D(0, boxes_size[1], 0),
                design3d.Vector3D(0, 0, boxes_size[2])]
-        points = sorted(self.bounding_box.get_points_inside_bbox(2, 2, 2), key=point3d.point_distance)
+        points = sorted(bbox.get_points_inside_bbox(2, 2, 2), key=point3d.point_distance)
         bbox_outside_points = []
         for vector in xyz:
             for direction in [1, -1]:
                 bbox_outside_point = points[0] + direction * vector
-                if not self.bounding_box.point_inside(bbox_outside_point):
+                if not bbox.point_inside(bbox_outside_point):
                     bbox_outside_points.append(bbox_outside_point)
         bbox_outside_points = sorted(bbox_outside_points, key=point3d.point_distance)
         vec1 = bbox_outside_points[0] - point3d
@@ -1246,8 +1247,14 @@ class ClosedShell3D(Shell3D):
         """
         face_combinations1 = {face: [] for face in self.faces}
         face_combinations2 = {face: [] for face in shell2.faces}
+        faces2 = shell2.faces
+        faces2_bounds = np.array([[bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax]
+                                  for bbox in (face.bounding_box for face in faces2)], dtype=np.float64)
+        # Faces whose bounding boxes are apart can neither intersect nor share a contour section.
+        bbox_tol = max(tol, 1e-6)
         for face1 in self.faces:
-            for face2 in shell2.faces:
+            for face2_index in np.flatnonzero(face1.bounding_box.boxes_intersecting(faces2_bounds, bbox_tol)):
+                face2 = faces2[face2_index]
                 if face1.surface3d.is_coincident(face2.surface3d, abs_tol=tol):
                     contours1, contours2 = face1.get_coincident_face_intersections(face2)
                     face_combinations1[face1].extend(contours1)
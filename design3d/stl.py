@@ -12,6 +12,7 @@ from typing import List
 
 from binaryornot.check import is_binary
 from kaitaistruct import KaitaiStream
+import numpy as np
 
 import design3d as d3d
 import design3d.core as d3dc
@@ -403,12 +404,7 @@ class Stl:
         :return: A new instance of the Stl class with the flat triangles removed.
         :rtype: Stl
         """
-        invalid_triangles = []
-        for index_t, triangles in enumerate(self.triangles):
-            if triangles.area() < threshold:
-                invalid_triangles.append(index_t)
-
-        triangles = self.triangles[:]
-        for invalid_triangle_index in invalid_triangles[::-1]:
-            triangles.pop(invalid_triangle_index)
-        return Stl(triangles)
+        triangles_points = np.array([[[*triangle.point1], [*triangle.point2], [*triangle.point3]]
+                                     for triangle in self.triangles], dtype=np.float64).reshape(-1, 3, 3)
+        areas = d3df.Triangle3D.triangles_areas(triangles_points)
+        return Stl([triangle for triangle, area in zip(self.triangles, areas) if area >= threshold])
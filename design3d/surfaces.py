@@ -173,6 +173,32 @@ class Surface2D:
 
         return point_inside_outer_contour
 
+    def random_points_inside(self, number_points: int, max_iterations: int = 100):
+        """
+        Generate random points inside the 2D surface, taking into account its inner contours.
+
+        Points are drawn by batches in the outer contour bounding rectangle and rejected with vectorized point in
+        polygon tests against the contours discretization.
+
+        :param number_points: The number of points to generate.
+        :param max_iterations: The maximal number of sampling batches.
+        :return: An array of shape (number_points, 2) with the random points.
+        :rtype: numpy.ndarray[np.float64]
+        """
+        x_min, x_max, y_min, y_max = self.outer_contour.bounding_rectangle.bounds()
+        outer_polygon = self.outer_contour.to_polygon(100)
+        inner_polygons = [inner_contour.to_polygon(100) for inner_contour in self.inner_contours]
+        points = np.empty((0, 2))
+        for _ in range(max_iterations):
+            samples = np.random.uniform((x_min, y_min), (x_max, y_max), size=(2 * number_points, 2))
+            inside = outer_polygon.points_in_polygon(samples).astype(bool)
+            for inner_polygon in inner_polygons:
+                inside &= ~inner_polygon.points_in_polygon(samples, include_edge_points=True).astype(bool)
+            points = np.concatenate((points, samples[inside]))
+            if points.shape[0] >= number_points:
+                return points[:number_points]
+        raise ValueError('Could not find enough points inside')
+
     @staticmethod
     def triangulation_without_holes(vertices, segments, points_grid, tri_opt):
         """
@@ -508,9 +534,13 @@ class Surface2D:
         """
         Gets the lines that define a Surface2D in a .geo file.
         """
+        return list(self.geo_lines_iter())
 
-        i, i_p = None, None
-        lines, line_surface, lines_tags = [], [], []
+    def geo_lines_iter(self):
+        """
+        Yields the lines that define a Surface2D in a .geo file, one at a time.
+        """
+        line_surface = []
         point_account, line_account, line_loop_account = 0, 0, 1
         for outer_contour, contour in enumerate(list(chain(*[[self.outer_contour], self.inner_contours]))):
             if isinstance(contour, curves.Circle2D):
@@ -519,52 +549,41 @@ class Surface2D:
                           design3d.Point2D(contour.center.x + contour.radius, contour.center.y)]
                 index = []
                 for i, point in enumerate(points):
-                    lines.append(point.get_geo_lines(tag=point_account + i + 1,
-                                                     point_mesh_size=None))
+                    yield point.get_geo_lines(tag=point_account + i + 1,
+                                              point_mesh_size=None)
                     index.append(point_account + i + 1)
 
-                lines.append('Circle(' + str(line_account + 1) +
-                             ') = {' + str(index[0]) + ', ' + str(index[1]) + ', ' + str(index[2]) + '};')
-                lines.append('Circle(' + str(line_account + 2) +
-                             ') = {' + str(index[2]) + ', ' + str(index[1]) + ', ' + str(index[0]) + '};')
-
-                lines_tags.append(line_account + 1)
-                lines_tags.append(line_account + 2)
+                yield ('Circle(' + str(line_account + 1) +
+                       ') = {' + str(index[0]) + ', ' + str(index[1]) + ', ' + str(index[2]) + '};')
+                yield ('Circle(' + str(line_account + 2) +
+                       ') = {' + str(index[2]) + ', ' + str(index[1]) + ', ' + str(index[0]) + '};')
 
-                lines.append('Line Loop(' + str(outer_contour + 1) + ') = {' + str(lines_tags)[1:-1] + '};')
+                yield f'Line Loop({outer_contour + 1}) = {{{line_account + 1}, {line_account + 2}}};'
                 line_surface.append(line_loop_account)
 
                 point_account = point_account + 2 + 1
                 line_account, line_loop_account = line_account + 1 + 1, line_loop_account + 1
-                lines_tags = []
 
             elif isinstance(contour, (wires.Contour2D, wires.ClosedPolygon2D)):
                 if not isinstance(contour, wires.ClosedPolygon2D):
                     contour = contour.to_polygon(1)
-                for i, point in enumerate(contour.points):
-                    lines.append(point.get_geo_lines(tag=point_account + i + 1,
-                                                     point_mesh_size=None))
-
-                for i_p, primitive in enumerate(contour.primitives):
-                    if i_p != len(contour.primitives) - 1:
-                        lines.append(primitive.get_geo_lines(tag=line_account + i_p + 1,
-                                                             start_point_tag=point_account + i_p + 1,
-                                                             end_point_tag=point_account + i_p + 2))
-                    else:
-                        lines.append(primitive.get_geo_lines(tag=line_account + i_p + 1,
-                                                             start_point_tag=point_account + i_p + 1,
-                                                             end_point_tag=point_account + 1))
-                    lines_tags.append(line_account + i_p + 1)
-
-                lines.append('Line Loop(' + str(outer_contour + 1) + ') = {' + str(lines_tags)[1:-1] + '};')
+                number_points = len(contour.points)
+                number_primitives = len(contour.primitives)
+                yield from (point.get_geo_lines(tag=point_account + i + 1, point_mesh_size=None)
+                            for i, point in enumerate(contour.points))
+                yield from (primitive.get_geo_lines(
+                    tag=line_account + i_p + 1,
+                    start_point_tag=point_account + i_p + 1,
+                    end_point_tag=point_account + (i_p + 2 if i_p != number_primitives - 1 else 1))
+                    for i_p, primitive in enumerate(contour.primitives))
+                lines_tags = ', '.join(str(line_account + i_p + 1) for i_p in range(number_primitives))
+
+                yield f'Line Loop({outer_contour + 1}) = {{{lines_tags}}};'
                 line_surface.append(line_loop_account)
-                point_account = point_account + i + 1
-                line_account, line_loop_account = line_account + i_p + 1, line_loop_account + 1
-                lines_tags = []
+                point_account += number_points
+                line_account, line_loop_account = line_account + number_primitives, line_loop_account + 1
 
-        lines.append('Plane Surface(' + str(1) + ') = {' + str(line_surface)[1:-1] + '};')
-
-        return lines
+        yield f'Plane Surface(1) = {{{", ".join(map(str, line_surface))}}};'
 
     def mesh_lines(self,
                    factor: float,
@@ -644,15 +663,12 @@ class Surface2D:
             if element[0] not in kwargs:
                 kwargs[element[0]] = element[1]
 
-        lines = self.geo_lines()
-        lines.extend(self.mesh_lines(factor, kwargs['curvature_mesh_size'],
-                                     kwargs['min_points'], kwargs['initial_mesh_size']))
+        lines = chain(self.geo_lines_iter(),
+                      self.mesh_lines(factor, kwargs['curvature_mesh_size'],
+                                      kwargs['min_points'], kwargs['initial_mesh_size']))
 
         with open(file_name + '.geo', 'w', encoding="utf-8") as file:
-            for line in lines:
-                file.write(line)
-                file.write('\n')
-        file.close()
+            file.writelines(line + '\n' for line in lines)
 
     def to_msh(self, file_name: str, mesh_dimension: int, mesh_order: int,
                factor: float, **kwargs):
@@ -705,6 +721,12 @@ class Surface3D:
         self.frame = frame
         self.name=name
 
+    @cached_property
+    def frame_array(self):
+        """Frame origin, u, v and w vectors as the rows of a (4, 3) array, for vectorized computations."""
+        frame = self.frame
+        return np.array([[*frame.origin], [*frame.u], [*frame.v], [*frame.w]], dtype=np.float64)
+
     @property
     def u_domain(self):
         """The parametric domain of the surface in the U direction."""
@@ -900,6 +922,32 @@ class Surface3D:
 
         return np.array(points3d)
 
+    def points3d_to_2d(self, points: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Transform 3D points on the surface to parametric coordinates.
+
+        :param points: Array of shape (n, 3) with the 3D points.
+        :type points: numpy.ndarray[np.float64]
+
+        :return: Array of shape (n, 2) with the parametric coordinates `(u, v)` of the points.
+        :rtype: numpy.ndarray[np.float64]
+        """
+        points2d = [[*self.point3d_to_2d(design3d.Point3D(*point))] for point in points]
+
+        return np.array(points2d, dtype=np.float64).reshape(-1, 2)
+
+    def _local_points_to_3d(self, local_points: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Map points given in the surface frame coordinates to the global frame.
+
+        :param local_points: Array of shape (n, 3) with the coordinates of the points in the surface frame.
+        :return: Array of shape (n, 3) with the 3D points in the global frame.
+        """
+        frame = self.frame
+        points3d = local_points @ np.array([[*frame.u], [*frame.v], [*frame.w]])
+        points3d += [*frame.origin]
+        return points3d
+
     def primitives3d_to_2d(self, primitives3d):
         """
         Helper function to perform conversion of 3D primitives into B-Rep primitives.
@@ -1651,7 +1699,8 @@ class Plane3D(Surface3D):
         """
         Converts a 2D parametric point into a 3D point on the surface.
         """
-        return point2d.to_3d(self.frame.origin, self.frame.u, self.frame.v)
+        frame = self.frame
+        return point2d.to_3d(frame.origin, frame.u, frame.v)
 
     def parametric_points_to_3d(self, points: NDArray[np.float64]) -> NDArray[np.float64]:
         """
@@ -1667,22 +1716,30 @@ class Plane3D(Surface3D):
         :return: Array of 3D points representing the plane in Cartesian coordinates.
         :rtype: numpy.ndarray[np.float64]
         """
-        center = np.array(self.frame.origin)
-        x = np.array([self.frame.u[0], self.frame.u[1], self.frame.u[2]])
-        y = np.array([self.frame.v[0], self.frame.v[1], self.frame.v[2]])
-
-        points = points.reshape(-1, 2, 1)
-
-        u_values = points[:, 0]
-        v_values = points[:, 1]
-
-        return center + u_values * x + v_values * y
+        frame = self.frame
+        points3d = points @ np.array([[*frame.u], [*frame.v]])
+        points3d += [*frame.origin]
+        return points3d
 
     def point3d_to_2d(self, point3d):
         """
         Converts a 3D point into a 2D parametric point.
         """
-        return point3d.to_2d(self.frame.origin, self.frame.u, self.frame.v)
+        frame = self.frame
+        return point3d.to_2d(frame.origin, frame.u, frame.v)
+
+    def points3d_to_2d(self, points: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Transform 3D points to parametric coordinates on the plane.
+
+        :param points: Array of shape (n, 3) with the 3D points.
+        :type points: numpy.ndarray[np.float64]
+
+        :return: Array of shape (n, 2) with the parametric coordinates `(u, v)` of the points.
+        :rtype: numpy.ndarray[np.float64]
+        """
+        frame = self.frame
+        return (np.asarray(points, dtype=np.float64) - [*frame.origin]) @ np.array([[*frame.u], [*frame.v]]).T
 
     def contour2d_to_3d(self, contour2d, return_primitives_mapping: bool = False):
         """
@@ -1716,6 +1773,7 @@ class Plane3D(Surface3D):
         """
         primitives2d = []
         primitives_mapping = {}
+        frame = self.frame
         for primitive3d in contour3d.primitives:
             method_name = f'{primitive3d.__class__.__name__.lower()}_to_2d'
             if hasattr(self, method_name):
@@ -1725,7 +1783,7 @@ class Plane3D(Surface3D):
                 self.update_primitives_mapping(primitives_mapping, primitives, primitive3d)
                 primitives2d.extend(primitives)
             else:
-                primitive = primitive3d.to_2d(self.frame.origin, self.frame.u, self.frame.v)
+                primitive = primitive3d.to_2d(frame.origin, frame.u, frame.v)
                 if primitive is None:
                     continue
                 self.update_primitives_mapping(primitives_mapping, [primitive], primitive3d)
@@ -2572,21 +2630,15 @@ class CylindricalSurface3D(UPeriodicalSurface):
         :return: Array of 3D points representing the cylindrical surface in Cartesian coordinates.
         :rtype: numpy.ndarray[np.float64]
         """
-        center = np.array(self.frame.origin)
-        x = np.array([self.frame.u[0], self.frame.u[1], self.frame.u[2]])
-        y = np.array([self.frame.v[0], self.frame.v[1], self.frame.v[2]])
-        z = np.array([self.frame.w[0], self.frame.w[1], self.frame.w[2]])
-
-        points = points.reshape(-1, 2, 1)
-
         u_values = points[:, 0]
         v_values = points[:, 1]
 
-        x_component = np.cos(u_values) * x
-        y_component = np.sin(u_values) * y
-        z_component = v_values * z
+        local_points = np.empty((points.shape[0], 3))
+        np.multiply(self.radius, np.cos(u_values), out=local_points[:, 0])
+        np.multiply(self.radius, np.sin(u_values), out=local_points[:, 1])
+        local_points[:, 2] = v_values
 
-        return center + self.radius * (x_component + y_component) + z_component
+        return self._local_points_to_3d(local_points)
 
     def point3d_to_2d(self, point3d):
         """
@@ -3260,22 +3312,16 @@ class ToroidalSurface3D(UVPeriodicalSurface):
         :return: Array of 3D points representing the toroidal surface in Cartesian coordinates.
         :rtype: numpy.ndarray[np.float64]
         """
-        center = np.array(self.frame.origin)
-        x = np.array([self.frame.u[0], self.frame.u[1], self.frame.u[2]])
-        y = np.array([self.frame.v[0], self.frame.v[1], self.frame.v[2]])
-        z = np.array([self.frame.w[0], self.frame.w[1], self.frame.w[2]])
-
-        points = points.reshape(-1, 2, 1)
-
         u_values = points[:, 0]
         v_values = points[:, 1]
 
         common_term = self.major_radius + self.minor_radius * np.cos(v_values)
-        x_component = np.cos(u_values) * x
-        y_component = np.sin(u_values) * y
-        z_component = self.minor_radius * np.sin(v_values) * z
+        local_points = np.empty((points.shape[0], 3))
+        np.multiply(common_term, np.cos(u_values), out=local_points[:, 0])
+        np.multiply(common_term, np.sin(u_values), out=local_points[:, 1])
+        np.multiply(self.minor_radius, np.sin(v_values), out=local_points[:, 2])
 
-        return center + common_term * (x_component + y_component) + z_component
+        return self._local_points_to_3d(local_points)
 
     @classmethod
     def from_step(cls, arguments, object_dict, **kwargs):
@@ -4440,21 +4486,16 @@ class ConicalSurface3D(UPeriodicalSurface):
         :return: Array of 3D points representing the conical surface in Cartesian coordinates.
         :rtype: numpy.ndarray[np.float64]
         """
-        center = np.array(self.frame.origin)
-        x = np.array([self.frame.u[0], self.frame.u[1], self.frame.u[2]])
-        y = np.array([self.frame.v[0], self.frame.v[1], self.frame.v[2]])
-        z = np.array([self.frame.w[0], self.frame.w[1], self.frame.w[2]])
-
-        points = points.reshape(-1, 2, 1)
-
         u_values = points[:, 0]
         v_values = points[:, 1]
 
-        x_component = np.cos(u_values) * x
-        y_component = np.sin(u_values) * y
+        common_term = v_values * math.tan(self.semi_angle) + self.ref_radius
+        local_points = np.empty((points.shape[0], 3))
+        np.multiply(common_term, np.cos(u_values), out=local_points[:, 0])
+        np.multiply(common_term, np.sin(u_values), out=local_points[:, 1])
+        local_points[:, 2] = v_values
 
-        return (center + (v_values * math.tan(self.semi_angle) + self.ref_radius) * (x_component + y_component)
-                + v_values * z)
+        return self._local_points_to_3d(local_points)
 
     def rectangular_cut(self, theta1: float, theta2: float,
                         param_z1: float, param_z2: float, name: str = ''):
@@ -5178,22 +5219,16 @@ class SphericalSurface3D(UVPeriodicalSurface):
         :return: Array of 3D points representing the spherical surface in Cartesian coordinates.
         :rtype: numpy.ndarray[np.float64]
         """
-        center = np.array(self.frame.origin)
-        x = np.array([self.frame.u[0], self.frame.u[1], self.frame.u[2]])
-        y = np.array([self.frame.v[0], self.frame.v[1], self.frame.v[2]])
-        z = np.array([self.frame.w[0], self.frame.w[1], self.frame.w[2]])
-
-        points = points.reshape(-1, 2, 1)
-
         u_values = points[:, 0]
         v_values = points[:, 1]
 
         common_term = self.radius * np.cos(v_values)
-        x_component = np.cos(u_values) * x
-        y_component = np.sin(u_values) * y
-        z_component = self.radius * np.sin(v_values) * z
+        local_points = np.empty((points.shape[0], 3))
+        np.multiply(common_term, np.cos(u_values), out=local_points[:, 0])
+        np.multiply(common_term, np.sin(u_values), out=local_points[:, 1])
+        np.multiply(self.radius, np.sin(v_values), out=local_points[:, 2])
 
-        return center + common_term * (x_component + y_component) + z_component
+        return self._local_points_to_3d(local_points)
 
     def contour3d_to_2d(self, contour3d, return_primitives_mapping: bool = False):
         """
@@ -6632,13 +6667,17 @@ class RevolutionSurface3D(UPeriodicalSurface):
 
         u_values = points[:, 0]
         v_values = points[:, 1]
-        if self.y_periodicity:
-            v_values[v_values > self.y_periodicity] -= self.y_periodicity
-            v_values[v_values < 0] += self.y_periodicity
+        y_periodicity = self.y_periodicity
+        if y_periodicity:
+            v_values[v_values > y_periodicity] -= y_periodicity
+            v_values[v_values < 0] += y_periodicity
 
         cos_u = np.cos(u_values)
 
-        points_at_curve = np.array([self.edge.point_at_abscissa(v) for v in v_values])
+        # Mesh vertices mostly lie on a few v isolines, the edge is evaluated once per distinct abscissa
+        abscissas, abscissas_indexes = np.unique(v_values.ravel(), return_inverse=True)
+        points_at_curve = np.array([[*self.edge.point_at_abscissa(abscissa)] for abscissa in abscissas.tolist()],
+                                   dtype=np.float64)[abscissas_indexes]
         points_at_curve_minus_center = points_at_curve - center
 
         return (center + points_at_curve_minus_center * cos_u +
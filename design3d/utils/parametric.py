@@ -302,19 +302,54 @@ def array_range_search(x, xmin, xmax):
     return range(left, right)
 
 
+def checkerboard_grid_points(u, v, return_points_indexes_map: bool = False):
+    """
+    Gets the nodes of a grid kept in a checkerboard pattern, the node (i, j) being kept if i and j have the same parity.
+
+    Odd and even rows are shifted by one u step, so the kept nodes form a staggered lattice giving well-shaped
+    triangles with half the nodes of the full grid, whether or not the face has holes.
+
+    :param u: grid values along the first parametric direction, indexed by i.
+    :param v: grid values along the second parametric direction, indexed by j.
+    :param return_points_indexes_map: if True, also returns a (len(u), len(v)) integer array giving, at [i, j], the
+        index of the node (i, j) in the points array, or -1 if this node is not kept.
+    :return: a (n, 2) array of the kept nodes, ordered by j then i.
+    """
+    u_grid, v_grid = np.meshgrid(np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64))
+    v_indices, u_indices = np.indices(u_grid.shape)
+    kept_nodes = (u_indices + v_indices) % 2 == 0
+    points = np.stack([u_grid[kept_nodes], v_grid[kept_nodes]], axis=1)
+    if not return_points_indexes_map:
+        return points
+    points_indexes_map = np.full(u_grid.shape, -1, dtype=np.int64)
+    points_indexes_map[kept_nodes] = np.arange(len(points))
+    return points, points_indexes_map.T
+
+
 def update_face_grid_points_with_inner_polygons(inner_polygons, grid_points_data):
-    """Remove grid_points inside inner contours of the face."""
+    """
+    Remove grid_points inside inner contours of the face.
+
+    The grid points inside the bounding rectangle of an inner polygon are tested against it all at once.
+
+    :param inner_polygons: the inner polygons of the face.
+    :param grid_points_data: the grid points, the u and v grid values and a (len(u), len(v)) integer array giving the
+        index in the grid points of the node (i, j), or -1 if this node is not part of the grid points.
+    :return: the grid points outside the inner polygons.
+    """
     points_grid, u, v, grid_point_index = grid_points_data
+    points_grid = np.asarray(points_grid, dtype=np.float64)
     indexes = []
     for inner_polygon in inner_polygons:
         u_min, u_max, v_min, v_max = inner_polygon.bounding_rectangle.bounds()
-        for i in array_range_search(u, u_min, u_max):  # u_grid_range of inner_polygon
-            for j in array_range_search(v, v_min, v_max):  # v_grid_range of inner_polygon
-                index = grid_point_index.get((i, j))
-                if not index:
-                    continue
-                if inner_polygon.point_inside(points_grid[index], include_edge_points=True):
-                    indexes.append(index)
+        u_range = array_range_search(u, u_min, u_max)
+        v_range = array_range_search(v, v_min, v_max)
+        candidate_indexes = grid_point_index[u_range.start:u_range.stop, v_range.start:v_range.stop].ravel()
+        candidate_indexes = candidate_indexes[candidate_indexes >= 0]
+        if not candidate_indexes.size:
+            continue
+        inside = inner_polygon.points_in_polygon(points_grid[candidate_indexes], include_edge_points=True)
+        indexes.extend(candidate_indexes[np.asarray(inside, dtype=bool)].tolist())
     points_grid = np.delete(points_grid, indexes, axis=0)
     return points_grid
 
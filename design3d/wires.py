@@ -618,16 +618,37 @@ class WireMixin:
                 break
         return connected_contour
 
+    def _primitives_bounds(self):
+        """
+        Gets the bounds of the primitives, as two (number of primitives, dimension) arrays of minimal and maximal
+        coordinates.
+
+        """
+        if isinstance(self.primitives[0].start, design3d.Point2D):
+            bounds = [primitive.bounding_rectangle.bounds() for primitive in self.primitives]
+        else:
+            bounds = [(bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax)
+                      for bbox in (primitive.bounding_box for primitive in self.primitives)]
+        bounds = np.array(bounds, dtype=np.float64)
+        return bounds[:, 0::2], bounds[:, 1::2]
+
     def is_sharing_primitives_with(self, contour, abs_tol: float = 1e-6):
         """
         Check if two contour are sharing primitives.
 
+        Only the pairs of primitives whose bounds are closer than the tolerance can share a section, the others are
+        discarded at once before computing any shared section.
         """
-        for prim1 in self.primitives:
-            for prim2 in contour.primitives:
-                shared_section = prim1.get_shared_section(prim2, abs_tol)
-                if shared_section:
-                    return True
+        if not self.primitives or not contour.primitives:
+            return False
+        mins1, maxs1 = self._primitives_bounds()
+        mins2, maxs2 = contour._primitives_bounds()
+        bounds_tol = max(abs_tol, 1e-6)
+        close_bounds = np.all((mins1[:, np.newaxis] <= maxs2[np.newaxis] + bounds_tol) &
+                              (mins2[np.newaxis] <= maxs1[:, np.newaxis] + bounds_tol), axis=2)
+        for index1, index2 in zip(*np.nonzero(close_bounds)):
+            if self.primitives[index1].get_shared_section(contour.primitives[index2], abs_tol):
+                return True
         return False
 
     def middle_point(self):
@@ -1277,8 +1298,13 @@ class Wire2D(WireMixin):
         :param offset: translation vector
         :return: A new translated Wire 2D.
         """
-        return self.__class__([primitive.translation(offset)
-                               for primitive in self.primitives])
+        new_wire = self.__class__([primitive.translation(offset)
+                                   for primitive in self.primitives])
+        if self._bounding_rectangle:
+            x_min, x_max, y_min, y_max = self._bounding_rectangle.bounds()
+            new_wire._bounding_rectangle = design3d.core.BoundingRectangle(
+                x_min + offset.x, x_max + offset.x, y_min + offset.y, y_max + offset.y)
+        return new_wire
 
     def frame_mapping(self, frame: design3d.Frame2D, side: str):
         """
@@ -1896,7 +1922,7 @@ class ContourMixin(WireMixin):
         :rtype: str
         """
 
-        return 'Line Loop(' + str(tag) + ') = {' + str(primitives_tags)[1:-1] + '};'
+        return f'Line Loop({tag}) = {{{", ".join(map(str, primitives_tags))}}};'
 
     def get_geo_points(self):
         """
@@ -1956,14 +1982,12 @@ class ContourMixin(WireMixin):
         if len(points) < 3:
             raise ValueError('contour is defined at least with three points')
 
-        linesegment_name = 'LineSegment' + points[0].__class__.__name__[-2:]
-        list_edges = []
-        for i in range(0, len(points) - 1):
-            if points[i].is_close(points[i + 1]):
-                continue
-            list_edges.append(getattr(edges, linesegment_name)(points[i], points[i + 1]))
-        if not points[-1].is_close(points[0]):
-            list_edges.append(getattr(edges, linesegment_name)(points[-1], points[0]))
+        linesegment_class = getattr(edges, 'LineSegment' + points[0].__class__.__name__[-2:])
+        points_array = np.array([[*point] for point in points], dtype=np.float64)
+        segments_lengths = np.linalg.norm(np.roll(points_array, -1, axis=0) - points_array, axis=1)
+        number_points = len(points)
+        list_edges = [linesegment_class(points[i], points[(i + 1) % number_points])
+                      for i in np.flatnonzero(segments_lengths > 1e-6).tolist()]
 
         contour = cls(list_edges, name=name)
         return contour
@@ -2116,10 +2140,11 @@ class Contour2D(ContourMixin, Wire2D):
                     return True
         if not self._polygon_100_points:
             self._polygon_100_points = self.to_polygon(100)
-        if point.is_close(self.center_of_mass()) and self._polygon_100_points.is_convex():
-            return True
         if self._polygon_100_points.point_inside(point):
             return True
+        # The center of mass is only needed for the points the polygon test rejects
+        if point.is_close(self.center_of_mass()) and self._polygon_100_points.is_convex():
+            return True
         return False
 
     def bounding_points(self):
@@ -2560,14 +2585,25 @@ class Contour2D(ContourMixin, Wire2D):
         """
         Create a contour 2d with bounding_box parameters, using line segments 2d.
 
+        The contour goes through (x_min, y_min), (x_max, y_min), (x_max, y_max) and (x_min, y_max). As with
+        from_points, the sides of a flat rectangle are dropped, comparing the side lengths only.
         """
-
-        edge0 = design3d.edges.LineSegment2D(design3d.Point2D(x_min, y_min), design3d.Point2D(x_max, y_min))
-        edge1 = design3d.edges.LineSegment2D(design3d.Point2D(x_max, y_min), design3d.Point2D(x_max, y_max))
-        edge2 = design3d.edges.LineSegment2D(design3d.Point2D(x_max, y_max), design3d.Point2D(x_min, y_max))
-        edge3 = design3d.edges.LineSegment2D(design3d.Point2D(x_min, y_max), design3d.Point2D(x_min, y_min))
-
-        return Contour2D([edge0, edge1, edge2, edge3], name=name)
+        point1 = design3d.Point2D(x_min, y_min)
+        point2 = design3d.Point2D(x_max, y_min)
+        point3 = design3d.Point2D(x_max, y_max)
+        point4 = design3d.Point2D(x_min, y_max)
+        horizontal_sides = abs(x_max - x_min) > 1e-6
+        vertical_sides = abs(y_max - y_min) > 1e-6
+        primitives = []
+        if horizontal_sides:
+            primitives.append(design3d.edges.LineSegment2D(point1, point2))
+        if vertical_sides:
+            primitives.append(design3d.edges.LineSegment2D(point2, point3))
+        if horizontal_sides:
+            primitives.append(design3d.edges.LineSegment2D(point3, point4))
+        if vertical_sides:
+            primitives.append(design3d.edges.LineSegment2D(point4, point1))
+        return Contour2D(primitives, name=name)
 
     def cut_by_bspline_curve(self, bspline_curve2d: design3d.edges.BSplineCurve2D):
         """
@@ -2930,19 +2966,35 @@ class ClosedPolygon2D(ClosedPolygonMixin, Contour2D):
             equal = (equal and point == other_point)
         return equal
 
+    @cached_property
+    def points_array(self):
+        """
+        Coordinates of the polygon points, as a contiguous (n, 2) array.
+
+        The array is computed once, points of the polygon should not be modified in place afterward.
+        """
+        return np.array([[point.x, point.y] for point in self.points], dtype=np.float64).reshape(-1, 2)
+
+    def get_bouding_rectangle(self):
+        """
+        Calculates the bounding rectangle of the polygon, from its points array instead of its line segments.
+
+        :return: The bounding rectangle of the polygon.
+        :rtype: design3d.core.BoundingRectangle.
+        """
+        x_min, y_min = self.points_array.min(axis=0).tolist()
+        x_max, y_max = self.points_array.max(axis=0).tolist()
+        return design3d.core.BoundingRectangle(x_min, x_max, y_min, y_max)
+
     def area(self):
         """Returns the area of the polygon."""
-        # TODO: performance: cache number of points
         if len(self.points) < 3:
             return 0.
 
-        x = [point.x for point in self.points]
-        y = [point.y for point in self.points]
-
-        x1 = [x[-1]] + x[0:-1]
-        y1 = [y[-1]] + y[0:-1]
-        return 0.5 * abs(sum(i * j for i, j in zip(x, y1))
-                         - sum(i * j for i, j in zip(y, x1)))
+        x, y = self.points_array.T
+        x1 = np.roll(x, 1)
+        y1 = np.roll(y, 1)
+        return 0.5 * abs(float(np.dot(x, y1) - np.dot(y, x1)))
 
     def center_of_mass(self):
         """Returns polygon's center of mass."""
@@ -2954,8 +3006,7 @@ class ClosedPolygon2D(ClosedPolygonMixin, Contour2D):
         if lngth_points == 2:
             return 0.5 * (self.points[0] + self.points[1])
 
-        x = [point.x for point in self.points]
-        y = [point.y for point in self.points]
+        x, y = self.points_array.T
 
         xi_xi1 = x + np.roll(x, -1)
         yi_yi1 = y + np.roll(y, -1)
@@ -2986,7 +3037,7 @@ class ClosedPolygon2D(ClosedPolygonMixin, Contour2D):
         """
         Ray casting algorithm copied from internet.
         """
-        return polygon_point_belongs(np.array(self.points),
+        return polygon_point_belongs(self.points_array,
                                      np.array(point),
                                      include_edge_points=include_edge_points, tol=tol)
 
@@ -3005,8 +3056,7 @@ class ClosedPolygon2D(ClosedPolygonMixin, Contour2D):
         """
         if isinstance(points, list):
             points = np.array(points)
-        polygon = np.array(self.points)
-        return points_in_polygon(polygon, points, include_edge_points=include_edge_points, tol=tol)
+        return points_in_polygon(self.points_array, points, include_edge_points=include_edge_points, tol=tol)
 
     def second_moment_area(self, point):
         """Returns the second moment of area of the polygon."""
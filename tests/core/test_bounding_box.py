@@ -1,6 +1,7 @@
 import unittest
 import design3d
 from design3d.core import BoundingBox
+from design3d.edges import LineSegment3D
 from design3d.faces import Triangle3D
 
 
@@ -96,6 +97,24 @@ class TestBoundingBox(unittest.TestCase):
         self.assertEqual(self.bbox1.intersection_volume(self.bbox3), 0.0)
         self.assertEqual(self.bbox1.intersection_volume(self.bbox4), 1.0)
 
+    def test_is_intersecting_linesegment(self):
+        # Line segment crossing the bounding box
+        linesegment1 = LineSegment3D(design3d.Point3D(-1.0, 1.0, 1.0), design3d.Point3D(3.0, 1.0, 1.0))
+        self.assertTrue(self.bbox1.is_intersecting_linesegment(linesegment1))
+
+        # Line segment stopping before the bounding box, although its line crosses it
+        linesegment2 = LineSegment3D(design3d.Point3D(-2.0, 1.0, 1.0), design3d.Point3D(-1.0, 1.0, 1.0))
+        self.assertFalse(self.bbox1.is_intersecting_linesegment(linesegment2))
+
+        # Line segment whose bounding box intersects the bounding box, passing by one of its corners
+        linesegment3 = LineSegment3D(design3d.Point3D(1.5, 3.0, 1.0), design3d.Point3D(3.0, 1.5, 1.0))
+        self.assertFalse(self.bbox1.is_intersecting_linesegment(linesegment3))
+
+        # Line segment touching a face of a flat bounding box
+        flat_bbox = BoundingBox(0.0, 2.0, 0.0, 2.0, 0.0, 0.0)
+        linesegment4 = LineSegment3D(design3d.Point3D(1.0, 1.0, 0.0), design3d.Point3D(1.0, 1.0, 1.0))
+        self.assertTrue(flat_bbox.is_intersecting_linesegment(linesegment4))
+
     def test_distance_to_bbox(self):
         self.assertEqual(self.bbox1.distance_to_bbox(self.bbox2), 0.0)
         self.assertEqual(self.bbox1.distance_to_bbox(self.bbox3), 12**0.5)
@@ -109,6 +128,17 @@ class TestBoundingBox(unittest.TestCase):
         self.assertTrue(self.bbox1.point_inside(design3d.Point3D(1.0, 1.0, 0.0)))
         self.assertFalse(self.bbox1.point_inside(design3d.Point3D(3.0, 3.0, 3.0)))
 
+    def test_points_inside(self):
+        points = [[1.0, 1.0, 1.0], [1.0, 1.0, 0.0], [3.0, 3.0, 3.0], [2.0 + 1e-7, 1.0, 1.0]]
+        self.assertEqual(self.bbox1.points_inside(points).tolist(), [True, True, False, True])
+
+    def test_boxes_intersecting(self):
+        bboxes = [self.bbox2, self.bbox3, self.bbox4, BoundingBox(2.0 + 1e-7, 3.0, 0.0, 1.0, 0.0, 1.0)]
+        bounds = [[bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax, bbox.zmin, bbox.zmax] for bbox in bboxes]
+        self.assertEqual(self.bbox1.boxes_intersecting(bounds).tolist(),
+                         [self.bbox1.is_intersecting(bbox) for bbox in bboxes])
+        self.assertEqual(self.bbox1.boxes_intersecting(bounds).tolist(), [True, False, True, True])
+
     def test_distance_to_point(self):
         p0 = design3d.O3D
         self.assertEqual(self.bbox1.distance_to_point(p0), 0.0)
@@ -3,7 +3,8 @@ Unit tests for functions defined in design3d.core.py
 """
 import unittest
 import design3d
-from design3d.core import delete_double_point, step_ids_to_str
+from design3d.core import EdgeHashSet, delete_double_point, step_ids_to_str
+from design3d.edges import LineSegment3D
 
 
 class TestDeleteDoublePoint(unittest.TestCase):
@@ -35,5 +36,28 @@ class TestStepIdsToStr(unittest.TestCase):
         self.assertEqual(step_ids_to_str(self.ids_2), "#11,#22,#33,#44,#55")
 
 
+class TestEdgeHashSet(unittest.TestCase):
+    def test_contains(self):
+        linesegment1 = LineSegment3D(design3d.Point3D(0.0, 0.0, 0.0), design3d.Point3D(1.0, 0.0, 0.0))
+        linesegment2 = LineSegment3D(design3d.Point3D(1.0, 0.0, 0.0), design3d.Point3D(1.0, 1.0, 0.0))
+        edges = EdgeHashSet([linesegment1])
+        self.assertEqual(len(edges), 1)
+        self.assertIn(linesegment1, edges)
+        self.assertIn(LineSegment3D(design3d.Point3D(0.0, 0.0, 1e-8), design3d.Point3D(1.0, 0.0, 0.0)), edges)
+        self.assertIn(linesegment1.reverse(), edges)
+        self.assertNotIn(linesegment2, edges)
+        edges.add(linesegment2)
+        self.assertIn(linesegment2, edges)
+        self.assertEqual(list(edges), [linesegment1, linesegment2])
+
+    def test_contains_across_cells(self):
+        # The end points of these line segments are closer than the tolerance, but are rounded to different cells
+        linesegment1 = LineSegment3D(design3d.Point3D(0.4999999e-6, 0.0, 0.0), design3d.Point3D(1.0, 0.4999999e-6, 0.0))
+        linesegment2 = LineSegment3D(design3d.Point3D(0.5000001e-6, 0.0, 0.0), design3d.Point3D(1.0, 0.5000001e-6, 0.0))
+        edges = EdgeHashSet([linesegment1])
+        self.assertIn(linesegment2, edges)
+        self.assertIn(linesegment2.reverse(), edges)
+
+
 if __name__ == "__main__":
     unittest.main()
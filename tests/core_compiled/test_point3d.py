@@ -75,6 +75,10 @@ class TestPoint3D(unittest.TestCase):
                                     (self.p3.z - self.p1.z) ** 2)
         self.assertAlmostEqual(self.p1.point_distance(self.p3), expected_output)
 
+    def test_point_distance_squared(self):
+        self.assertAlmostEqual(self.p1.point_distance_squared(self.p3), 25 + 9 + 81)
+        self.assertAlmostEqual(self.p1.point_distance_squared(self.p3), self.p1.point_distance(self.p3) ** 2)
+
     def test_middle_point(self):
         expected_output = Point3D(-1.5, 3.5, -1.5)
         self.assertEqual(Point3D.middle_point(self.p1, self.p3), expected_output)
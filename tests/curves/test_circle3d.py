@@ -140,6 +140,12 @@ class TestCircle3D(unittest.TestCase):
             self.assertTrue(circle3d.point_belongs(point))
         self.assertFalse(circle3d.point_belongs(design3d.Point3D(2, 2, 2)))
 
+    def test_points_abscissas(self):
+        abscissas = circle3d.points_abscissas(self.list_points[:-1] + [design3d.Point3D(2, 2, 2)])
+        for abscissa, point in zip(abscissas, self.list_points[:-1]):
+            self.assertAlmostEqual(abscissa, circle3d.abscissa(point))
+        self.assertTrue(math.isnan(abscissas[-1]))
+
     def test_trim(self):
         trim = circle3d.trim(self.list_points[2], self.list_points[5])
         self.assertAlmostEqual(trim.length(), 2.3561944901923444)
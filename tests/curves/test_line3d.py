@@ -1,3 +1,4 @@
+import math
 import unittest
 
 import design3d
@@ -49,6 +50,14 @@ class TestLine3D(unittest.TestCase):
         for point, expected_point in zip(sorted_points_along_line3d, expected_sorted_points3d):
             self.assertEqual(point, expected_point)
 
+    def test_points_abscissas(self):
+        line3d = curves.Line3D(design3d.O3D, design3d.Point3D(1, 2, 2))
+        points = [design3d.Point3D(2, 4, 4), design3d.Point3D(1, 0, 0), design3d.Point3D(-1, -2, -2)]
+        abscissas = line3d.points_abscissas(points)
+        self.assertAlmostEqual(abscissas[0], 6.0)
+        self.assertTrue(math.isnan(abscissas[1]))
+        self.assertAlmostEqual(abscissas[2], -3.0)
+
     def test_point_at_abscissa(self):
         line3d = curves.Line3D(design3d.Point3D(-0.16532959009, 0.669230747399, 0.6255868826019999),
                                design3d.Point3D(-0.1653592907723126, 0.6687168836734351, 0.6247295250680509))
@@ -17,6 +17,14 @@ class TestBSplineFace3D(unittest.TestCase):
         bbox = face.bounding_box
         self.assertAlmostEqual(bbox.volume(), 0.00018, 5)
 
+        face = faces.BSplineFace3D.from_surface_rectangular_cut(bspline_surface_1, 0.1, 0.9, 0.2, 0.8)
+        bbox = face.get_bounding_box()
+        self.assertTrue(face.outer_contour3d.bounding_box.is_inside_bbox(bbox))
+        number_points_x, number_points_y = face.grid_size()
+        grid_size = [5, 3] if number_points_x >= number_points_y else [3, 5]
+        for point2d in face.grid_points(grid_size):
+            self.assertTrue(bbox.point_inside(bspline_surface_1.point2d_to_3d(point2d)))
+
     def test_is_linesegment_crossing(self):
         linesegment = edges.LineSegment3D(design3d.Point3D(4, 0, 0), design3d.Point3D(4, 2, 2))
         self.assertTrue(self.bspline_face.is_linesegment_crossing(linesegment=linesegment))
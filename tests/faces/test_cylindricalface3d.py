@@ -17,6 +17,16 @@ class TestCylindricalFace3D(unittest.TestCase):
     cylindrical_surface2 = surfaces.CylindricalSurface3D(design3d.OXYZ, 12.0)
     cylindrical_face2 = faces.CylindricalFace3D.from_surface_rectangular_cut(cylindrical_surface2, 0, 3.14, 0., 8.)
 
+    def test_points_belong(self):
+        points = [design3d.Point3D(0.32 * math.cos(0.5), 0.32 * math.sin(0.5), 0.1),
+                  design3d.Point3D(0.32 * math.cos(-0.005), 0.32 * math.sin(-0.005), 0.0),
+                  design3d.Point3D(0.32 * math.cos(2.0), 0.32 * math.sin(2.0), 0.1),
+                  design3d.Point3D(0.32 * math.cos(0.5), 0.32 * math.sin(0.5), 0.5),
+                  design3d.Point3D(0.5 * math.cos(0.5), 0.5 * math.sin(0.5), 0.1)]
+        self.assertEqual(self.cylindrical_face1.points_belong(points), [True, True, False, False, False])
+        self.assertEqual(self.cylindrical_face1.points_belong(points),
+                         [self.cylindrical_face1.point_belongs(point) for point in points])
+
     def test_linesegment_intersections(self):
         lineseg3d = edges.LineSegment3D(design3d.O3D, design3d.Point3D(0.3, 0.3, .3))
         line_inters = self.cylindrical_face1.linesegment_intersections(lineseg3d)
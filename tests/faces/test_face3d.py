@@ -4,7 +4,7 @@ Tests for faces 3D
 import unittest
 import math
 import design3d
-from design3d import faces, surfaces
+from design3d import faces, surfaces, wires
 
 
 class TestFace3D(unittest.TestCase):
@@ -19,6 +19,54 @@ class TestFace3D(unittest.TestCase):
         self.assertAlmostEqual(distance, 0.07871852659452186, 4)
         self.assertTrue(point1.is_close(design3d.Point3D(radius / math.sqrt(2), radius / math.sqrt(2), -0.05), 1e-3))
 
+    def test_face_inside(self):
+        hole = wires.Contour2D.from_points([design3d.Point2D(0.1, 0.1), design3d.Point2D(1.5, 0.1),
+                                            design3d.Point2D(1.5, 0.5), design3d.Point2D(0.1, 0.5)])
+
+        plane = surfaces.Plane3D(design3d.OXYZ)
+        planeface1 = faces.PlaneFace3D.from_surface_rectangular_cut(plane, 0, 2, 0, 1)
+        planeface2 = faces.PlaneFace3D.from_surface_rectangular_cut(plane, 0.5, 1, 0.2, 0.4)
+        self.assertTrue(planeface1.face_inside(planeface2))
+        self.assertFalse(planeface2.face_inside(planeface1))
+        planeface3 = faces.PlaneFace3D(plane, surfaces.Surface2D(planeface1.surface2d.outer_contour, [hole]))
+        self.assertFalse(planeface3.face_inside(planeface2))
+
+        cylindricalsurface = surfaces.CylindricalSurface3D(design3d.OXYZ, 0.5)
+        cylindricalface1 = faces.CylindricalFace3D.from_surface_rectangular_cut(cylindricalsurface, 0, math.pi, 0, 1)
+        cylindricalface2 = faces.CylindricalFace3D.from_surface_rectangular_cut(cylindricalsurface, 0.5, 1, 0.2, 0.4)
+        self.assertTrue(cylindricalface1.face_inside(cylindricalface2))
+        self.assertFalse(cylindricalface2.face_inside(cylindricalface1))
+        cylindricalface3 = faces.CylindricalFace3D(
+            cylindricalsurface, surfaces.Surface2D(cylindricalface1.surface2d.outer_contour, [hole]))
+        self.assertFalse(cylindricalface3.face_inside(cylindricalface2))
+
+    def test_is_intersecting(self):
+        planeface1 = faces.PlaneFace3D.from_surface_rectangular_cut(surfaces.Plane3D(design3d.OXYZ), -1, 1, -1, 1)
+        planeface2 = faces.PlaneFace3D.from_surface_rectangular_cut(surfaces.Plane3D(design3d.OZXY), -1, 1, -1, 1)
+        self.assertTrue(planeface1.is_intersecting(planeface2))
+        self.assertFalse(planeface1.is_intersecting(planeface2, [(planeface1, planeface2)]))
+        self.assertFalse(planeface1.is_intersecting(planeface2, {(planeface1, planeface2)}))
+
+    def test_random_points_inside(self):
+        hole = wires.Contour2D.from_points([design3d.Point2D(0.1, 0.1), design3d.Point2D(1.5, 0.1),
+                                            design3d.Point2D(1.5, 0.5), design3d.Point2D(0.1, 0.5)])
+        plane = surfaces.Plane3D(design3d.OXYZ)
+        outer_contour = wires.Contour2D.from_bounding_rectangle(0, 2, 0, 1)
+        planeface = faces.PlaneFace3D(plane, surfaces.Surface2D(outer_contour, [hole]))
+        points = planeface.random_points_inside(100)
+        self.assertEqual(points.shape, (100, 3))
+        for point in points:
+            self.assertTrue(planeface.point_belongs(design3d.Point3D(*point)))
+
+
+    def test_bounding_box_connected_groups(self):
+        plane = surfaces.Plane3D(design3d.OXYZ)
+        plane_faces = [faces.PlaneFace3D.from_surface_rectangular_cut(plane, x1, x2, y1, y2)
+                       for x1, x2, y1, y2 in [(0, 1, 0, 1), (3, 4, 0, 1), (1, 2, 0, 1), (2, 3, 5, 6), (2, 3, 0, 1)]]
+        self.assertEqual(faces.bounding_box_connected_groups(plane_faces), [[0, 1, 2, 4], [3]])
+        self.assertEqual(faces.bounding_box_connected_groups(plane_faces[:4]), [[0, 2], [1], [3]])
+        self.assertEqual(faces.bounding_box_connected_groups([]), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -265,6 +265,9 @@ class TestPlaneFace3D(unittest.TestCase):
             areas = []
             for face in merged_faces:
                 areas.append(face.area())
+                primitives_mapping = face.primitives_mapping
+                for primitive2d in face.surface2d.outer_contour.primitives:
+                    self.assertIn(primitives_mapping[primitive2d], face.outer_contour3d.primitives)
             faces_areas.append(areas)
         expected_faces_areas = [[0.1621764423452034], [0.15508002569387766],
                                 [0.005347587092921799, 0.032085522557310564, 0.18181796115851334],
@@ -286,6 +289,30 @@ class TestPlaneFace3D(unittest.TestCase):
         grid_points = face.grid_points([10, 10])
         self.assertEqual(len(grid_points), 56)
 
+    def test_point_distance(self):
+        planeface = faces.PlaneFace3D.from_surface_rectangular_cut(surfaces.Plane3D(design3d.OXYZ), 0, 2, 0, 1)
+        point = design3d.Point3D(3.0, 0.5, 1.0)
+        for _ in range(2):
+            distance, other_point = planeface.point_distance(point, return_other_point=True)
+            self.assertAlmostEqual(distance, math.sqrt(2))
+            self.assertTrue(other_point.is_close(design3d.Point3D(2.0, 0.5, 0.0)))
+
+        # The border polygon follows a change of the outer contour
+        planeface.surface2d.outer_contour = wires.Contour2D.from_bounding_rectangle(0, 1, 0, 1)
+        distance, other_point = planeface.point_distance(point, return_other_point=True)
+        self.assertAlmostEqual(distance, math.sqrt(5))
+        self.assertTrue(other_point.is_close(design3d.Point3D(1.0, 0.5, 0.0)))
+
+    def test_planeface_minimum_distance(self):
+        planeface = faces.PlaneFace3D.from_surface_rectangular_cut(surfaces.Plane3D(design3d.OXYZ), 0, 1, 0, 1)
+        triangle = faces.Triangle3D(design3d.Point3D(0.5, -1.0, 1.0), design3d.Point3D(0.5, 1.0, 1.0),
+                                    design3d.Point3D(0.5, 0.0, 2.0))
+        distance, point1, point2 = planeface.planeface_minimum_distance(triangle, return_points=True)
+        self.assertAlmostEqual(distance, 1.0)
+        self.assertAlmostEqual(point1.point_distance(point2), 1.0)
+        self.assertAlmostEqual(point1.z, 0.0)
+        self.assertAlmostEqual(point2.z, 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
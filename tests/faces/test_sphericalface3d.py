@@ -4,7 +4,7 @@ import os
 
 import design3d
 from design3d.faces import SphericalFace3D
-from design3d import surfaces, wires
+from design3d import edges, surfaces, wires
 from dessia_common.core import DessiaObject
 
 
@@ -68,6 +68,37 @@ class TestSphericalFace3D(unittest.TestCase):
         grid_points = face.grid_points([10, 10])
         self.assertEqual(len(grid_points), 518)
 
+    def test_points_belong(self):
+        surface3d = surfaces.SphericalSurface3D(design3d.OXYZ, 1)
+        face = SphericalFace3D.from_surface_rectangular_cut(surface3d, 0, 3, -1, 1.2)
+        points = [surface3d.point2d_to_3d(design3d.Point2D(0.5 * i - 0.5, 0.3 * j - 1.3))
+                  for i in range(9) for j in range(10)]
+        points.append(design3d.Point3D(0.0, 1.0, 0.0))
+        self.assertEqual(face.points_belong(points), [face.point_belongs(point) for point in points])
+        self.assertTrue(face.points_belong([design3d.Point3D(0.0, 1.0, 0.0)])[0])
+
+    def test_linesegment_intersections(self):
+        surface3d = surfaces.SphericalSurface3D(design3d.OXYZ, 1)
+        face = SphericalFace3D.from_surface_rectangular_cut(surface3d, 0, 3, -1, 1.2)
+        linesegment = edges.LineSegment3D(design3d.Point3D(0.0, 0.2, 0.0), design3d.Point3D(0.0, 2.0, 0.0))
+        intersections = face.linesegment_intersections(linesegment)
+        self.assertEqual(len(intersections), 1)
+        self.assertTrue(intersections[0].is_close(design3d.Point3D(0.0, 1.0, 0.0)))
+
+    def test_edge3d_inside(self):
+        surface3d = surfaces.SphericalSurface3D(design3d.OXYZ, 1)
+        face = SphericalFace3D.from_surface_rectangular_cut(surface3d, 0, 3, -1, 1.2)
+        arc = edges.Arc3D.from_3_points(*[surface3d.point2d_to_3d(design3d.Point2D(u, 0.0)) for u in (1.0, 1.5, 2.0)])
+        self.assertTrue(face.edge3d_inside(arc))
+
+    def test_face_inside(self):
+        surface3d = surfaces.SphericalSurface3D(design3d.OXYZ, 1)
+        face = SphericalFace3D.from_surface_rectangular_cut(surface3d, 0, 3, -1, 1.2)
+        # The small face bulges out of the big face contour bounding box
+        face2 = SphericalFace3D.from_surface_rectangular_cut(surface3d, 1, 2, -0.2, 0.2)
+        self.assertTrue(face.face_inside(face2))
+        self.assertFalse(face2.face_inside(face))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for Triangle3D
+"""
+import unittest
+
+import numpy as np
+
+import design3d
+from design3d import faces
+
+
+class TestTriangle3D(unittest.TestCase):
+    triangle1 = faces.Triangle3D(design3d.Point3D(0.0, 0.0, 0.0), design3d.Point3D(2.0, 0.0, 0.0),
+                                 design3d.Point3D(0.0, 2.0, 0.0))
+
+    def test_triangle_intersections(self):
+        triangle2 = faces.Triangle3D(design3d.Point3D(0.5, 0.5, -1.0), design3d.Point3D(0.5, 0.5, 1.0),
+                                     design3d.Point3D(3.0, 0.5, 0.0))
+        intersections = self.triangle1.triangle_intersections(triangle2)
+        self.assertEqual(len(intersections), 1)
+        self.assertEqual(len(intersections[0].primitives), 1)
+        self.assertAlmostEqual(intersections[0].length(), 1.0)
+        expected_intersections = self.triangle1.planeface_intersections(triangle2)
+        linesegment, expected_linesegment = intersections[0].primitives[0], expected_intersections[0].primitives[0]
+        self.assertTrue(linesegment.start.is_close(expected_linesegment.start))
+        self.assertTrue(linesegment.end.is_close(expected_linesegment.end))
+
+        shared_edge_triangle = faces.Triangle3D(design3d.Point3D(0.0, 0.0, 0.0), design3d.Point3D(2.0, 0.0, 0.0),
+                                                design3d.Point3D(0.0, 0.0, 2.0))
+        self.assertFalse(self.triangle1.triangle_intersections(shared_edge_triangle))
+
+        coplanar_triangle = faces.Triangle3D(design3d.Point3D(0.5, 0.5, 0.0), design3d.Point3D(3.0, 0.5, 0.0),
+                                             design3d.Point3D(0.5, 3.0, 0.0))
+        self.assertFalse(self.triangle1.triangle_intersections(coplanar_triangle))
+
+        distant_triangle = faces.Triangle3D(design3d.Point3D(0.5, 0.5, 1.0), design3d.Point3D(0.5, 0.5, 2.0),
+                                            design3d.Point3D(3.0, 0.5, 1.5))
+        self.assertFalse(self.triangle1.triangle_intersections(distant_triangle))
+
+    def test_area(self):
+        self.assertAlmostEqual(self.triangle1.area(), 2.0)
+        flat_triangle = faces.Triangle3D(design3d.Point3D(0.0, 0.0, 0.0), design3d.Point3D(1.0, 1e-9, 0.0),
+                                         design3d.Point3D(2.0, 0.0, 0.0))
+        self.assertAlmostEqual(flat_triangle.area(), 1e-9, 15)
+
+    def test_triangles_areas(self):
+        triangles_points = np.array([[[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [0.0, 2.0, 0.0]],
+                                     [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 3.0]],
+                                     [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [2.0, 2.0, 2.0]]])
+        self.assertTrue(np.allclose(faces.Triangle3D.triangles_areas(triangles_points), [2.0, 1.5, 0.0]))
+
+    def test_points_array(self):
+        self.assertTrue(np.array_equal(self.triangle1.points_array,
+                                       [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [0.0, 2.0, 0.0]]))
+        self.assertTrue(np.array_equal(self.triangle1.triangulation().vertices, self.triangle1.points_array))
+        self.assertTrue(self.triangle1.bounding_box.is_close(design3d.core.BoundingBox(0.0, 2.0, 0.0, 2.0, 0.0, 0.0)))
+
+    def test_surface3d(self):
+        triangle = faces.Triangle3D(design3d.Point3D(0.0, 0.0, 0.0), design3d.Point3D(2.0, 0.0, 0.0),
+                                    design3d.Point3D(0.0, 2.0, 0.0))
+        self.assertEqual(triangle.surface3d, self.triangle1.surface3d)
+        self.assertTrue(triangle.surface3d.frame.w.is_close(design3d.Z3D))
+        reversed_triangle = faces.Triangle3D(design3d.Point3D(2.0, 0.0, 0.0), design3d.Point3D(0.0, 0.0, 0.0),
+                                             design3d.Point3D(0.0, 2.0, 0.0))
+        self.assertTrue(reversed_triangle.surface3d.frame.w.is_close(-design3d.Z3D))
+
+    def test_data_eq(self):
+        rotated_triangle = faces.Triangle3D(design3d.Point3D(0.0, 2.0, 0.0), design3d.Point3D(0.0, 0.0, 0.0),
+                                            design3d.Point3D(2.0, 0.0, 0.0))
+        other_triangle = faces.Triangle3D(design3d.Point3D(0.0, 2.0, 0.0), design3d.Point3D(0.0, 0.0, 0.0),
+                                          design3d.Point3D(2.0, 0.0, 1.0))
+        self.assertTrue(self.triangle1._data_eq(rotated_triangle))
+        self.assertFalse(self.triangle1._data_eq(other_triangle))
+
+    def test_subdescription(self):
+        points = self.triangle1.subdescription(0.5)
+        self.assertEqual(len(points), len(set(points)))
+        for point in self.triangle1.points:
+            self.assertIn(point, points)
+        for point in points:
+            self.assertTrue(self.triangle1.point_belongs(point))
+        self.assertEqual(self.triangle1.subdescription(3.0), self.triangle1.points)
+
+    def test_subdescription_to_triangles(self):
+        sub_triangles = self.triangle1.subdescription_to_triangles(0.5)
+        self.assertEqual(len(sub_triangles), 32)
+        self.assertAlmostEqual(sum(triangle.area() for triangle in sub_triangles), self.triangle1.area())
+        for triangle in sub_triangles:
+            self.assertLessEqual(triangle.point1.point_distance(triangle.point2), 0.5)
+            self.assertLessEqual(triangle.point2.point_distance(triangle.point3), 0.5)
+            self.assertLessEqual(triangle.point3.point_distance(triangle.point1), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
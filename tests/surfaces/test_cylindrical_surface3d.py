@@ -33,6 +33,12 @@ class TestCylindricalSurface3D(unittest.TestCase):
             )
         )
 
+    def test_frame_array(self):
+        frame = design3d.Frame3D(design3d.Point3D(1, 2, 3), design3d.Y3D, design3d.Z3D, design3d.X3D)
+        cylindrical_surface = surfaces.CylindricalSurface3D(frame, 0.5)
+        expected = np.array([[1, 2, 3], [0, 1, 0], [0, 0, 1], [1, 0, 0]], dtype=np.float64)
+        self.assertTrue(np.allclose(cylindrical_surface.frame_array, expected))
+
     def test_plane_intersections(self):
         plane_surface = surfaces.Plane3D(design3d.OZXY)
         parallel_plane_secant_cylinder = plane_surface.frame_mapping(
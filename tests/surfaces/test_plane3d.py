@@ -50,6 +50,14 @@ class TestPlane3D(unittest.TestCase):
         for point, expected_point in zip(points3d, expected_points):
             self.assertAlmostEqual(np.linalg.norm(point - expected_point), 0.0)
 
+    def test_points3d_to_2d(self):
+        parametric_points = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-0.5, 0.5]])
+        points3d = self.plane2.parametric_points_to_3d(parametric_points)
+        points2d = self.plane2.points3d_to_2d(points3d)
+        self.assertEqual(points2d.shape, (4, 2))
+        for point2d, expected_point in zip(points2d, parametric_points):
+            self.assertAlmostEqual(np.linalg.norm(point2d - expected_point), 0.0)
+
     def test_from_normal(self):
         plane = Plane3D.from_normal(self.point1, self.vector3)
         self.assertEqual(plane.frame, design3d.Frame3D(design3d.O3D, design3d.X3D, -design3d.Y3D, design3d.Z3D))
@@ -76,6 +76,12 @@ class TestClosedPolygon2D(unittest.TestCase):
         for value in test:
             self.assertTrue(value)
 
+    def test_bounding_rectangle(self):
+        polygon = d3dw.ClosedPolygon2D([design3d.Point2D(0.0, -1.0), design3d.Point2D(2.0, 0.5),
+                                       design3d.Point2D(1.0, 3.0), design3d.Point2D(-0.5, 1.0)])
+        self.assertEqual(polygon.bounding_rectangle.bounds(), (-0.5, 2.0, -1.0, 3.0))
+        self.assertEqual(polygon.bounding_rectangle.bounds(), d3dw.Contour2D.get_bouding_rectangle(polygon).bounds())
+
 
 if __name__ == '__main__':
     unittest.main()
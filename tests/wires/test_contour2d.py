@@ -44,6 +44,29 @@ class TestContour2D(unittest.TestCase):
         contour, point = DessiaObject.from_json(os.path.join(folder, "test_contour_point_belongs.json")).primitives
         self.assertTrue(contour.point_inside(point, False))
 
+    def test_from_points(self):
+        points = [design3d.Point2D(0.0, 0.0), design3d.Point2D(1.0, 0.0), design3d.Point2D(1.0, 0.0),
+                  design3d.Point2D(1.0, 1.0), design3d.Point2D(0.0, 0.0)]
+        contour = wires.Contour2D.from_points(points)
+        self.assertEqual(len(contour.primitives), 3)
+        self.assertTrue(contour.is_ordered())
+        self.assertTrue(contour.primitives[-1].start.is_close(design3d.Point2D(1.0, 1.0)))
+        self.assertTrue(contour.primitives[-1].end.is_close(design3d.Point2D(0.0, 0.0)))
+
+    def test_from_bounding_rectangle(self):
+        contour = wires.Contour2D.from_bounding_rectangle(0.0, 2.0, 0.0, 1.0)
+        expected = wires.Contour2D.from_points([design3d.Point2D(0.0, 0.0), design3d.Point2D(2.0, 0.0),
+                                                design3d.Point2D(2.0, 1.0), design3d.Point2D(0.0, 1.0)])
+        self.assertEqual(len(contour.primitives), 4)
+        self.assertTrue(contour.is_ordered())
+        self.assertAlmostEqual(contour.area(), 2.0)
+        for primitive, expected_primitive in zip(contour.primitives, expected.primitives):
+            self.assertTrue(primitive.start.is_close(expected_primitive.start))
+            self.assertTrue(primitive.end.is_close(expected_primitive.end))
+
+        flat_contour = wires.Contour2D.from_bounding_rectangle(0.0, 2.0, 1.0, 1.0)
+        self.assertEqual(len(flat_contour.primitives), 2)
+
     def test_is_ordered(self):
         # self.assertTrue(self.ordered_contour.is_ordered())
         self.assertFalse(self.not_ordered_contour.is_ordered())
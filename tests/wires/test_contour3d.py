@@ -39,6 +39,14 @@ class TestContour3D(unittest.TestCase):
         contour2_sharing_primitives = Contour3D.from_json(
             os.path.join(folder, 'contour3d_sharing_primitives2.json'))
         self.assertTrue(contour1_sharing_primitives.is_sharing_primitives_with(contour2_sharing_primitives))
+        square = Contour3D.from_points([design3d.Point3D(0.0, 0.0, 0.0), design3d.Point3D(1.0, 0.0, 0.0),
+                                        design3d.Point3D(1.0, 1.0, 0.0), design3d.Point3D(0.0, 1.0, 0.0)])
+        overlapping_square = Contour3D.from_points([
+            design3d.Point3D(1.0, 0.5, 0.0), design3d.Point3D(2.0, 0.5, 0.0),
+            design3d.Point3D(2.0, 1.5, 0.0), design3d.Point3D(1.0, 1.5, 0.0)])
+        distant_square = square.translation(design3d.Vector3D(3.0, 0.0, 0.0))
+        self.assertTrue(square.is_sharing_primitives_with(overlapping_square))
+        self.assertFalse(square.is_sharing_primitives_with(distant_square))
 
     def test_from_step(self):
         step = Step.from_file(filepath=os.path.join(folder, "contour_with_repeated_edge_in_contour3d.step"))
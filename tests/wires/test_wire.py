@@ -56,6 +56,16 @@ class TestWire(unittest.TestCase):
         self.assertTrue(list_wires[0], primitives_1)
         self.assertTrue(list_wires[1], primitives_2)
 
+    def test_translation(self):
+        wire = wires.Wire2D([edges.LineSegment2D(design3d.Point2D(0.0, 0.0), design3d.Point2D(1.0, 0.5)),
+                             edges.LineSegment2D(design3d.Point2D(1.0, 0.5), design3d.Point2D(0.5, 1.0))])
+        self.assertEqual(wire.bounding_rectangle.bounds(), (0.0, 1.0, 0.0, 1.0))
+        translated_wire = wire.translation(design3d.Vector2D(2.0, -1.0))
+        self.assertEqual(translated_wire.primitives[0].start, design3d.Point2D(2.0, -1.0))
+        for bound, expected_bound in zip(translated_wire.bounding_rectangle.bounds(),
+                                         translated_wire.get_bouding_rectangle().bounds()):
+            self.assertAlmostEqual(bound, expected_bound)
+
 
 if __name__ == '__main__':
     unittest.main()